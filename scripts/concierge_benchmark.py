@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmarks for the concierge seed pipeline.
+
+Runs pipeline stages against local fixtures only (no network) and prints a
+JSON report so runs can be compared across machines and commits. The
+pipeline benchmark generates synthetic seed queues and inventories, serves
+their pages from the local replay server, and can diff its stage timings
+against a stored baseline report to flag regressions.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import concierge_locality
+import concierge_pipeline
+import concierge_replay
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT / "scripts"
+DEFAULT_PARSER_CORPUS_DIR = SCRIPTS_DIR / "fixtures" / "snapshot_parser_corpus"
+DEFAULT_PIPELINE_ROWS = (100, 1_000, 10_000)
+DEFAULT_INVENTORY_SIZES = (10_000, 100_000)
+# Per-call stages are timed over at most this many synthetic pages.
+MICRO_BENCHMARK_PAGES = 1_000
+DEFAULT_REGRESSION_TOLERANCE = 0.2
+# Differences below this are timer noise whatever the ratio.
+MIN_REGRESSION_SECONDS = 0.002
+SYNTHETIC_NAME_PREFIXES = ("Good", "Happy", "Calm", "Northside", "Urban", "Little", "Bayside", "Wag", "Smart", "Loyal")
+SYNTHETIC_NAME_SUFFIXES = ("Paws", "Hounds", "Pups", "Tails", "Companions", "Canines", "Mutts", "Dogs")
+SYNTHETIC_STREETS = ("Smith", "Brunswick", "Gertrude", "Johnston", "Nicholson", "Lygon", "Swan", "Church")
+SYNTHETIC_SERVICES = (
+    ("Puppy preschool", "Puppy school classes for puppies under 16 weeks with positive reinforcement training."),
+    ("Private training", "Private in-home dog training for adult dogs, loose lead walking and recall."),
+    ("Behaviour consultancy", "Behaviour consults for reactive, anxious and aggressive dogs by a qualified behaviourist."),
+    ("Group classes", "Group obedience classes for adolescent dogs and adult dogs every weekend."),
+)
+
+
+def time_call(fn: Callable[[], Any], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def load_parser_corpus(corpus_dir: Path = DEFAULT_PARSER_CORPUS_DIR) -> dict[str, str]:
+    return {path.name: path.read_text(encoding="utf-8") for path in sorted(corpus_dir.glob("*.html"))}
+
+
+def benchmark_parser_backends(
+    documents: dict[str, str],
+    backends: list[str] | None = None,
+    repeat: int = 20,
+) -> dict[str, Any]:
+    corpus_bytes = sum(len(text.encode("utf-8")) for text in documents.values())
+    reference = {name: concierge_pipeline.parse_snapshot(text) for name, text in documents.items()}
+    results: dict[str, Any] = {}
+    for backend in backends or sorted(concierge_pipeline.SNAPSHOT_PARSER_BACKENDS):
+
+        def parse_corpus() -> None:
+            for text in documents.values():
+                concierge_pipeline.parse_snapshot(text, backend)
+
+        timings = time_call(parse_corpus, repeat)
+        best = min(timings)
+        results[backend] = {
+            "best_seconds": round(best, 6),
+            "mean_seconds": round(sum(timings) / len(timings), 6),
+            "mb_per_second": round(corpus_bytes / best / 1_000_000, 3) if best else None,
+            "matches_reference": all(
+                concierge_pipeline.parse_snapshot(text, backend) == reference[name]
+                for name, text in documents.items()
+            ),
+        }
+    stdlib_best = results.get("stdlib", {}).get("best_seconds")
+    for backend_result in results.values():
+        backend_result["speedup_vs_stdlib"] = (
+            round(stdlib_best / backend_result["best_seconds"], 2)
+            if stdlib_best and backend_result["best_seconds"]
+            else None
+        )
+    return {
+        "documents": len(documents),
+        "corpus_bytes": corpus_bytes,
+        "repeat": repeat,
+        "backends": results,
+    }
+
+
+def benchmark_locality_index(queries: int = 2000, repeat: int = 20, seed: int = 15) -> dict[str, Any]:
+    canon = concierge_pipeline.load_councils_and_suburbs()
+    centroids = [
+        (*centroid, record)
+        for record in canon.suburbs
+        if (centroid := concierge_pipeline.suburb_centroid(record)) is not None
+    ]
+    build_timings = time_call(lambda: concierge_locality.CentroidGrid(centroids), repeat)
+    grid = canon.centroid_index
+    rng = random.Random(seed)
+    latitudes = [lat for lat, _, _ in centroids]
+    longitudes = [lon for _, lon, _ in centroids]
+    # Address points land near a suburb; bounding-box points also exercise the empty outskirts.
+    workloads = {
+        "near_suburb": [
+            (lat + rng.gauss(0, 0.02), lon + rng.gauss(0, 0.02))
+            for lat, lon, _ in (rng.choice(centroids) for _ in range(queries))
+        ],
+        "bounding_box": [
+            (rng.uniform(min(latitudes), max(latitudes)), rng.uniform(min(longitudes), max(longitudes)))
+            for _ in range(queries)
+        ],
+    }
+    projected = [(*grid.project(lat, lon), record) for lat, lon, record in centroids]
+
+    def linear_nearest(latitude: float, longitude: float) -> Any:
+        x, y = grid.project(latitude, longitude)
+        return min(projected, key=lambda entry: math.hypot(entry[0] - x, entry[1] - y))[2]
+
+    results: dict[str, Any] = {}
+    for name, points in workloads.items():
+        grid_best = min(time_call(lambda: [grid.nearest(lat, lon) for lat, lon in points], repeat))
+        linear_best = min(time_call(lambda: [linear_nearest(lat, lon) for lat, lon in points], repeat))
+        results[name] = {
+            "grid_queries_per_second": round(queries / grid_best) if grid_best else None,
+            "linear_queries_per_second": round(queries / linear_best) if linear_best else None,
+            "speedup_vs_linear": round(linear_best / grid_best, 2) if grid_best else None,
+            "matches_linear": all(grid.nearest(lat, lon)[0][1] == linear_nearest(lat, lon) for lat, lon in points),
+        }
+    names = sorted({record.name for record in canon.suburbs})
+    # Drop one interior letter from each name: the typical seed-queue typo.
+    misspelled = [name[: len(name) // 2] + name[len(name) // 2 + 1 :] for name in names]
+    canon.suburb_name_index  # built once, outside the timed loop
+    trigram_best = min(time_call(lambda: [concierge_pipeline.suggest_suburbs(hint, canon) for hint in misspelled], repeat))
+    results["misspelled_names"] = {
+        "lookups": len(misspelled),
+        "mean_lookup_us": round(trigram_best / len(misspelled) * 1_000_000, 2),
+        "top_suggestion_recall": round(
+            sum(
+                bool(suggestions) and suggestions[0][1] == name
+                for name, suggestions in zip(names, (concierge_pipeline.suggest_suburbs(hint, canon) for hint in misspelled))
+            )
+            / len(names),
+            3,
+        ),
+    }
+    return {
+        "suburbs": len(centroids),
+        "cell_km": round(grid.cell_km, 3),
+        "queries": queries,
+        "repeat": repeat,
+        "build_ms": round(min(build_timings) * 1000, 3),
+        "workloads": results,
+    }
+
+
+def synthetic_business_name(rng: random.Random) -> str:
+    return f"{rng.choice(SYNTHETIC_NAME_PREFIXES)} {rng.choice(SYNTHETIC_NAME_SUFFIXES)} Dog Training"
+
+
+def synthetic_seed_corpus(
+    count: int,
+    canon: concierge_pipeline.LocalityCanon,
+    seed: int = 24,
+) -> tuple[list[dict[str, str]], dict[str, str]]:
+    """Seed rows on distinct hosts and the page each row's URL serves."""
+    rng = random.Random(seed)
+    suburbs = sorted(
+        (record for record in canon.suburbs if record.name in canon.approved_mvp_catchment_suburbs),
+        key=lambda record: (record.name, record.id),
+    )
+    rows: list[dict[str, str]] = []
+    pages: dict[str, str] = {}
+    for index in range(count):
+        suburb = rng.choice(suburbs)
+        name = synthetic_business_name(rng)
+        service_hint, service_copy = rng.choice(SYNTHETIC_SERVICES)
+        url = f"http://trainer-{index}.example/"
+        address = f"{rng.randint(1, 400)} {rng.choice(SYNTHETIC_STREETS)} Street, {suburb.name}, VIC {suburb.postcode}"
+        jsonld = (
+            json.dumps({"@context": "https://schema.org", "@type": "LocalBusiness", "name": name, "address": address})
+            if rng.random() < 0.5
+            else ""
+        )
+        pages[url] = (
+            f"<html><head><title>{name} | {suburb.name}</title>"
+            f'<meta name="description" content="{service_hint} in {suburb.name}.">'
+            + (f'<script type="application/ld+json">{jsonld}</script>' if jsonld else "")
+            + f"</head><body><h1>{name}</h1><p>{service_copy}</p>"
+            f"<p>Serving {suburb.name} and the {suburb.council_name}.</p>"
+            f'<a href="tel:03 9{rng.randint(0, 999):03d} {rng.randint(0, 9999):04d}">Call us</a>'
+            f'<a href="mailto:hello@trainer-{index}.example">Email</a>'
+            + ("" if jsonld else f"<p>Find us at {address}</p>")
+            + "</body></html>"
+        )
+        rows.append(
+            {
+                "source_url": url,
+                "business_name_hint": name,
+                "suburb_hint": suburb.name,
+                "service_hint": service_hint,
+                "notes": "",
+            }
+        )
+    return rows, pages
+
+
+def synthetic_inventory(
+    count: int,
+    canon: concierge_pipeline.LocalityCanon,
+    seed: int = 25,
+) -> list[concierge_pipeline.ExistingInventoryRecord]:
+    # Names come from the seed-row generator, so some seed rows meet same-name inventory records.
+    rng = random.Random(seed)
+    suburbs = sorted(canon.suburbs, key=lambda record: (record.name, record.id))
+    inventory = []
+    for index in range(count):
+        suburb = rng.choice(suburbs)
+        inventory.append(
+            concierge_pipeline.ExistingInventoryRecord(
+                business_id=index + 1,
+                business_name=synthetic_business_name(rng),
+                domain=f"inventory-{index}.example",
+                phone=f"039{rng.randint(0, 9_999_999):07d}",
+                email=f"hello@inventory-{index}.example",
+                suburb_name=suburb.name,
+                council_name=suburb.council_name,
+                resource_type="trainer",
+            )
+        )
+    return inventory
+
+
+def stage_result(timings: list[float], items: int) -> dict[str, Any]:
+    best = min(timings)
+    return {
+        "seconds": round(best, 6),
+        "mean_seconds": round(sum(timings) / len(timings), 6),
+        "items": items,
+        "per_item_us": round(best / items * 1_000_000, 3) if items else None,
+    }
+
+
+def benchmark_pipeline_stages(
+    row_counts: tuple[int, ...] = DEFAULT_PIPELINE_ROWS,
+    inventory_sizes: tuple[int, ...] = DEFAULT_INVENTORY_SIZES,
+    repeat: int = 5,
+    seed: int = 24,
+    workers: int = concierge_pipeline.DEFAULT_FETCH_WORKERS,
+) -> dict[str, Any]:
+    stages: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="concierge-bench-") as tmp:
+        tmp_dir = Path(tmp)
+        stages["load_councils_and_suburbs/parse"] = stage_result(
+            time_call(lambda: concierge_pipeline.load_councils_and_suburbs(None), repeat), 1
+        )
+        canon = concierge_pipeline.load_councils_and_suburbs(tmp_dir / "canon")
+        stages["load_councils_and_suburbs/cached"] = stage_result(
+            time_call(lambda: concierge_pipeline.load_councils_and_suburbs(tmp_dir / "canon"), repeat), 1
+        )
+
+        rows, pages = synthetic_seed_corpus(max(row_counts), canon, seed)
+        sample = list(pages.values())[:MICRO_BENCHMARK_PAGES]
+        snapshots = [concierge_pipeline.parse_snapshot(html) for html in sample]
+        stages["parse_snapshot"] = stage_result(
+            time_call(lambda: [concierge_pipeline.parse_snapshot(html) for html in sample], repeat), len(sample)
+        )
+        texts = [concierge_pipeline.snapshot_text_blob(snapshot) for snapshot in snapshots]
+        stages["infer_taxonomy"] = stage_result(
+            time_call(lambda: [concierge_pipeline.infer_taxonomy(text) for text in texts], repeat), len(texts)
+        )
+        addresses = [concierge_pipeline.extract_address_from_snapshot(snapshot)[0] for snapshot in snapshots]
+        stages["infer_address_locality"] = stage_result(
+            time_call(
+                lambda: [
+                    concierge_pipeline.infer_address_locality(address, snapshot, canon)
+                    for address, snapshot in zip(addresses, snapshots)
+                ],
+                repeat,
+            ),
+            len(snapshots),
+        )
+        localities = [
+            concierge_pipeline.infer_address_locality(address, snapshot, canon) for address, snapshot in zip(addresses, snapshots)
+        ]
+        hints = [row["suburb_hint"] for row in rows[: len(snapshots)]]
+        stages["resolve_suburb"] = stage_result(
+            time_call(
+                lambda: [
+                    concierge_pipeline.resolve_suburb(hint, snapshot, canon, locality)
+                    for hint, snapshot, locality in zip(hints, snapshots, localities)
+                ],
+                repeat,
+            ),
+            len(snapshots),
+        )
+
+        recorder = concierge_replay.CorpusRecorder(tmp_dir / "corpus")
+        for url, html in pages.items():
+            recorder.record_response(url, 200, {"Content-Type": "text/html; charset=utf-8"}, html.encode("utf-8"))
+        inventory_check = {
+            "source": "synthetic",
+            "status": "available",
+            "record_count": 0,
+            "contact_signals_decrypted": True,
+            "warning": "",
+        }
+        with concierge_replay.ReplayServer(tmp_dir / "corpus") as server:
+            fetch_options = concierge_pipeline.FetchOptions(replay_url=server.base_url)
+            for inventory_size in inventory_sizes:
+                inventory = synthetic_inventory(inventory_size, canon, seed + 1)
+                for row_count in row_counts:
+                    started = time.perf_counter()
+                    artifact = concierge_pipeline.build_review_artifact(
+                        rows[:row_count],
+                        canon,
+                        tmp_dir / "seed_queue.csv",
+                        inventory,
+                        {**inventory_check, "record_count": inventory_size},
+                        workers=workers,
+                        per_host_rps=0,
+                        fetch_options=fetch_options,
+                    )
+                    stages[f"build_review_artifact/rows={row_count}/inventory={inventory_size}"] = stage_result(
+                        [time.perf_counter() - started], row_count
+                    )
+                    if inventory_size != inventory_sizes[-1]:
+                        continue
+                    writers = {
+                        "write_review_json": lambda path: path.write_text(
+                            json.dumps(artifact, indent=2, ensure_ascii=True, sort_keys=False), encoding="utf-8"
+                        ),
+                        "write_csv": lambda path: concierge_pipeline.write_csv(artifact, path),
+                        "write_mapping_artifact_json": lambda path: concierge_pipeline.write_mapping_artifact_json(artifact, path),
+                        "write_mapping_csv": lambda path: concierge_pipeline.write_mapping_csv(artifact, path),
+                    }
+                    for writer_name, writer in writers.items():
+                        output_path = tmp_dir / f"{writer_name}-{row_count}.out"
+                        stages[f"{writer_name}/rows={row_count}"] = stage_result(
+                            time_call(lambda: writer(output_path), repeat), row_count
+                        )
+            replay_stats = dict(server.stats)
+    return {
+        "benchmark": "pipeline",
+        "python": sys.version.split()[0],
+        "seed": seed,
+        "repeat": repeat,
+        "workers": workers,
+        "row_counts": list(row_counts),
+        "inventory_sizes": list(inventory_sizes),
+        "replay_requests": replay_stats["requests"],
+        "stages": stages,
+    }
+
+
+def compare_to_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_REGRESSION_TOLERANCE,
+) -> dict[str, Any]:
+    """Stages whose best time moved by more than `tolerance` (and MIN_REGRESSION_SECONDS) against the baseline."""
+    regressions: list[dict[str, Any]] = []
+    improvements: list[dict[str, Any]] = []
+    baseline_stages = baseline.get("stages", {})
+    for name, current in report["stages"].items():
+        previous = baseline_stages.get(name)
+        if previous is None:
+            continue
+        delta = current["seconds"] - previous["seconds"]
+        if abs(delta) < MIN_REGRESSION_SECONDS or not previous["seconds"]:
+            continue
+        ratio = current["seconds"] / previous["seconds"]
+        entry = {"stage": name, "baseline_seconds": previous["seconds"], "seconds": current["seconds"], "ratio": round(ratio, 3)}
+        if ratio > 1 + tolerance:
+            regressions.append(entry)
+        elif ratio < 1 / (1 + tolerance):
+            improvements.append(entry)
+    return {
+        "tolerance": tolerance,
+        "regressions": regressions,
+        "improvements": improvements,
+        "new_stages": sorted(set(report["stages"]) - set(baseline_stages)),
+        "missing_stages": sorted(set(baseline_stages) - set(report["stages"])),
+    }
+
+
+def parse_importtime(stderr: str, module: str) -> tuple[int, int]:
+    # `python -X importtime` lines: "import time: <self us> | <cumulative us> | <indented module>"
+    for line in stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[0].split(":")[-1]), int(fields[1])
+    raise ValueError(f"no importtime entry for {module}")
+
+
+def benchmark_import(module: str = "concierge_pipeline", repeat: int = 10) -> dict[str, Any]:
+    # Allow bytecode caching and discard a warm-up run so timings exclude source compilation.
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    self_ms: list[float] = []
+    cumulative_ms: list[float] = []
+    for run in range(repeat + 1):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=SCRIPTS_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        if run == 0:
+            continue
+        self_us, cumulative_us = parse_importtime(completed.stderr, module)
+        self_ms.append(self_us / 1000)
+        cumulative_ms.append(cumulative_us / 1000)
+    return {
+        "module": module,
+        "repeat": repeat,
+        "self_ms": {"min": round(min(self_ms), 3), "median": round(statistics.median(self_ms), 3)},
+        "cumulative_ms": {"min": round(min(cumulative_ms), 3), "median": round(statistics.median(cumulative_ms), 3)},
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark concierge pipeline stages against local fixtures.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parsers_cmd = subparsers.add_parser("parsers", help="Compare snapshot parser backend throughput")
+    parsers_cmd.add_argument("--corpus-dir", type=Path, default=DEFAULT_PARSER_CORPUS_DIR, help="Directory of *.html pages")
+    parsers_cmd.add_argument("--repeat", type=int, default=20, help="Timed passes over the corpus per backend")
+    parsers_cmd.add_argument(
+        "--backend",
+        action="append",
+        choices=sorted(concierge_pipeline.SNAPSHOT_PARSER_BACKENDS),
+        help="Backend to benchmark (repeatable; default all installed)",
+    )
+
+    import_cmd = subparsers.add_parser("import", help="Measure module import time in fresh interpreters")
+    import_cmd.add_argument("--module", default="concierge_pipeline", help="Module to import from scripts/")
+    import_cmd.add_argument("--repeat", type=int, default=10, help="Fresh interpreter runs")
+
+    locality_cmd = subparsers.add_parser("locality", help="Benchmark centroid grid and fuzzy suburb-name lookups")
+    locality_cmd.add_argument("--queries", type=int, default=2000, help="Random points inside the canon bounding box")
+    locality_cmd.add_argument("--repeat", type=int, default=20, help="Timed passes over the query set")
+
+    pipeline_cmd = subparsers.add_parser("pipeline", help="Time pipeline stages on synthetic seed queues and inventories")
+    pipeline_cmd.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_PIPELINE_ROWS), help="Seed queue sizes")
+    pipeline_cmd.add_argument(
+        "--inventory", type=int, nargs="+", default=list(DEFAULT_INVENTORY_SIZES), help="Existing inventory sizes"
+    )
+    pipeline_cmd.add_argument("--repeat", type=int, default=5, help="Timed passes for per-call stages and writers")
+    pipeline_cmd.add_argument("--seed", type=int, default=24, help="Seed for the synthetic corpus")
+    pipeline_cmd.add_argument("--output", type=Path, default=None, help="Also write the JSON report here (e.g. a new baseline)")
+    pipeline_cmd.add_argument("--baseline", type=Path, default=None, help="Earlier report to diff stage timings against")
+    pipeline_cmd.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_REGRESSION_TOLERANCE,
+        help="Fractional slowdown against --baseline reported as a regression",
+    )
+
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.command == "parsers":
+        documents = load_parser_corpus(args.corpus_dir)
+        if not documents:
+            parser.error(f"--corpus-dir has no *.html pages: {args.corpus_dir}")
+        report = benchmark_parser_backends(documents, args.backend, args.repeat)
+    elif args.command == "import":
+        report = benchmark_import(args.module, args.repeat)
+    elif args.command == "locality":
+        if args.queries < 1:
+            parser.error("--queries must be at least 1")
+        report = benchmark_locality_index(args.queries, args.repeat)
+    elif args.command == "pipeline":
+        if min(args.rows) < 1 or min(args.inventory) < 0:
+            parser.error("--rows must be positive and --inventory must not be negative")
+        baseline = None
+        if args.baseline is not None:
+            try:
+                baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                parser.error(f"--baseline: {exc}")
+        report = benchmark_pipeline_stages(tuple(sorted(args.rows)), tuple(sorted(args.inventory)), args.repeat, args.seed)
+        if args.output is not None:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        if baseline is not None:
+            report["baseline_comparison"] = compare_to_baseline(report, baseline, args.tolerance)
+            print(json.dumps(report, indent=2, sort_keys=True))
+            # A non-zero exit lets CI fail on a slowdown without parsing the report.
+            return 1 if report["baseline_comparison"]["regressions"] else 0
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Checkpoint journal for resumable concierge pipeline runs.
+
+Every completed queue row is appended to a JSONL journal as one line holding
+the row's identity and its extracted source data. A resumed run replays the
+journal and only fetches rows that have no line yet; a line torn by a crash
+mid-write is dropped on replay and truncated away before appending resumes.
+A completed journal is kept as the extraction store an incremental run
+compares its fresh fetches against.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+
+CHECKPOINT_FORMAT = 1
+
+
+class CheckpointMismatch(ValueError):
+    pass
+
+
+def checkpoint_row_key(row: dict[str, str]) -> str:
+    # The same fields extract_page_fields sees, so a replayed result is exactly what a fetch would produce.
+    return json.dumps(
+        [
+            (row.get("source_url") or "").strip(),
+            (row.get("business_name_hint") or "").strip(),
+            (row.get("service_hint") or "").strip(),
+        ],
+        ensure_ascii=True,
+    )
+
+
+def encode_line(payload: dict[str, Any]) -> bytes:
+    return (json.dumps(payload, ensure_ascii=True, separators=(",", ":")) + "\n").encode("ascii")
+
+
+def read_journal(path: Path) -> tuple[dict[str, Any] | None, dict[str, dict[str, Any]], int]:
+    """Return the header, completed rows by key, and the byte length of the whole lines read."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None, {}, 0
+    header: dict[str, Any] | None = None
+    completed: dict[str, dict[str, Any]] = {}
+    offset = 0
+    # Without a trailing newline the last line was torn mid-write and is not trusted.
+    for number, line in enumerate(data.split(b"\n")[:-1], start=1):
+        try:
+            payload = json.loads(line)
+        except ValueError as exc:
+            raise CheckpointMismatch(f"checkpoint {path} line {number} is corrupt: {exc}") from exc
+        if number == 1:
+            header = payload
+        else:
+            completed[payload["key"]] = payload["source_data"]
+        offset += len(line) + 1
+    return header, completed, offset
+
+
+class CheckpointJournal:
+    def __init__(self, path: Path, run_key: str, resume: bool = False) -> None:
+        self.path = path
+        self.run_key = run_key
+        self.resume = resume
+        self.completed: dict[str, dict[str, Any]] = {}
+        self.recorded = 0
+        self._valid_bytes = 0
+        self._fd: int | None = None
+        self._lock = threading.Lock()
+        if resume:
+            self._replay()
+
+    @property
+    def replayed(self) -> int:
+        return len(self.completed)
+
+    def _replay(self) -> None:
+        header, completed, valid_bytes = read_journal(self.path)
+        # A run killed before its header line landed left nothing to replay; open() starts afresh.
+        if header is None:
+            return
+        if header.get("checkpoint_format") != CHECKPOINT_FORMAT or header.get("run_key") != self.run_key:
+            raise CheckpointMismatch(f"checkpoint {self.path} was written by a run with a different input or fetch options")
+        self.completed = completed
+        self._valid_bytes = valid_bytes
+
+    def open(self) -> CheckpointJournal:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.resume and self._valid_bytes:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+            os.truncate(self.path, self._valid_bytes)
+        else:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_TRUNC, 0o644)
+            self._write(fd, encode_line({"checkpoint_format": CHECKPOINT_FORMAT, "run_key": self.run_key}))
+        self._fd = fd
+        return self
+
+    @staticmethod
+    def _write(fd: int, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+
+    def lookup(self, row: dict[str, str]) -> dict[str, Any] | None:
+        return self.completed.get(checkpoint_row_key(row))
+
+    def record(self, row: dict[str, str], source_data: dict[str, Any]) -> None:
+        # One write per line on an O_APPEND descriptor: a killed process leaves whole lines
+        # plus at most one torn tail, which replay discards.
+        line = encode_line({"key": checkpoint_row_key(row), "source_data": source_data})
+        with self._lock:
+            if self._fd is None:
+                raise RuntimeError(f"checkpoint {self.path} is not open")
+            self._write(self._fd, line)
+            self.recorded += 1
+
+    def close(self) -> None:
+        with self._lock:
+            fd, self._fd = self._fd, None
+        if fd is not None:
+            os.fsync(fd)
+            os.close(fd)
+
+    def promote(self, target: Path) -> None:
+        # A finished journal holds every row's extraction; keep it as the next run's incremental baseline.
+        self.close()
+        os.replace(self.path, target)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path.resolve()),
+            "resumed": self.resume,
+            "replayed_rows": self.replayed,
+            "recorded_rows": self.recorded,
+        }
+
+    def __enter__(self) -> CheckpointJournal:
+        return self.open()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
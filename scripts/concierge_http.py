@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Shared keep-alive HTTP client for the concierge pipeline and publish path.
+
+Keeps persistent http.client connections per origin with one reused SSL
+context, a bounded idle pool and idle eviction, so repeated Supabase and
+source-site requests skip the TCP+TLS handshake. Non-2xx responses raise
+urllib.error.HTTPError and connection failures raise URLError, matching the
+urlopen behaviour callers already handle, as do the proxy settings
+(HTTP_PROXY, HTTPS_PROXY, NO_PROXY) and the redirect rules: a POST is only
+followed as a GET after 301/302/303, and credential headers are not sent
+on to another origin. A request that dies on a stale reused connection is
+resent once, unless it is a non-idempotent request the server may have seen.
+"""
+from __future__ import annotations
+
+import base64
+import http.client
+import io
+import os
+import ssl
+import threading
+import time
+import urllib.request
+from dataclasses import dataclass
+from typing import Any, Callable
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urljoin, urlsplit
+
+
+DEFAULT_MAX_IDLE_PER_ORIGIN = 4
+DEFAULT_MAX_IDLE_TOTAL = 64
+DEFAULT_IDLE_TIMEOUT = 30.0
+MAX_REDIRECTS = 10
+MAX_ERROR_BODY_BYTES = 64 * 1024
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+CREDENTIAL_HEADERS = frozenset({"authorization", "apikey", "cookie"})
+# Safe to resend when a reused connection turns out to be dead after the request went out.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+Origin = tuple[str, str, int]
+
+
+@dataclass
+class IdleConnection:
+    connection: http.client.HTTPConnection
+    idle_since: float
+
+
+@dataclass(frozen=True)
+class Proxy:
+    host: str
+    port: int
+    authorization: str = ""
+
+
+def parse_proxy(value: str) -> Proxy:
+    parts = urlsplit(value if "://" in value else f"http://{value}")
+    # Like urllib, an https:// proxy URL still means a plain connection to the proxy.
+    if parts.scheme not in {"http", "https"} or not parts.hostname:
+        raise URLError(f"unsupported proxy for pooled HTTP client: {value}")
+    authorization = ""
+    if parts.username:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        authorization = "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    return Proxy(parts.hostname, parts.port or 80, authorization)
+
+
+def origin_for(url: str) -> Origin:
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in {"http", "https"} or not parts.hostname:
+        raise URLError(f"unsupported URL for pooled HTTP client: {url}")
+    port = parts.port or (443 if scheme == "https" else 80)
+    return scheme, parts.hostname.lower(), port
+
+
+def request_target(url: str) -> str:
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+class PooledResponse:
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        origin: Origin,
+        connection: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+        url: str,
+    ) -> None:
+        self._pool = pool
+        self._origin = origin
+        self._connection: http.client.HTTPConnection | None = connection
+        self._response = response
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+
+    def geturl(self) -> str:
+        return self.url
+
+    def getcode(self) -> int:
+        return self.status
+
+    def read(self, amt: int | None = None) -> bytes:
+        return self._response.read(amt)
+
+    def close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        if self._response.isclosed() and not self._response.will_close:
+            self._pool.release(self._origin, connection)
+        else:
+            self._response.close()
+            connection.close()
+
+    def __enter__(self) -> PooledResponse:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        *,
+        max_idle_per_origin: int = DEFAULT_MAX_IDLE_PER_ORIGIN,
+        max_idle_total: int = DEFAULT_MAX_IDLE_TOTAL,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        ssl_context: ssl.SSLContext | None = None,
+        proxies: dict[str, str] | None = None,
+    ) -> None:
+        self.max_idle_per_origin = max_idle_per_origin
+        self.max_idle_total = max_idle_total
+        self.idle_timeout = idle_timeout
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.proxies = urllib.request.getproxies() if proxies is None else proxies
+        self._idle: dict[Origin, list[IdleConnection]] = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.connections_reused = 0
+
+    def _evict_expired(self, now: float) -> None:
+        for origin in list(self._idle):
+            fresh = []
+            for idle in self._idle[origin]:
+                if now - idle.idle_since > self.idle_timeout:
+                    idle.connection.close()
+                else:
+                    fresh.append(idle)
+            if fresh:
+                self._idle[origin] = fresh
+            else:
+                del self._idle[origin]
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return sum(len(entries) for entries in self._idle.values())
+
+    def proxy_for(self, origin: Origin) -> Proxy | None:
+        scheme, host, _ = origin
+        value = self.proxies.get(scheme)
+        if not value or urllib.request.proxy_bypass_environment(host, self.proxies):
+            return None
+        return parse_proxy(value)
+
+    def acquire(
+        self,
+        origin: Origin,
+        timeout: float,
+        proxy: Proxy | None = None,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            entries = self._idle.get(origin)
+            if entries:
+                connection = entries.pop().connection
+                if not entries:
+                    del self._idle[origin]
+                self.connections_reused += 1
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+            self.connections_opened += 1
+        scheme, host, port = origin
+        if proxy is not None and scheme == "https":
+            # CONNECT tunnel through the proxy; TLS is then negotiated with the origin itself.
+            connection = http.client.HTTPSConnection(proxy.host, proxy.port, timeout=timeout, context=self.ssl_context)
+            connection.set_tunnel(host, port, headers={"Proxy-Authorization": proxy.authorization} if proxy.authorization else None)
+            return connection, False
+        if proxy is not None:
+            return http.client.HTTPConnection(proxy.host, proxy.port, timeout=timeout), False
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def release(self, origin: Origin, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired(now)
+            entries = self._idle.setdefault(origin, [])
+            entries.append(IdleConnection(connection, now))
+            if len(entries) > self.max_idle_per_origin:
+                entries.pop(0).connection.close()
+            total = sum(len(origin_entries) for origin_entries in self._idle.values())
+            while total > self.max_idle_total:
+                oldest_origin = min(self._idle, key=lambda key: self._idle[key][0].idle_since)
+                self._idle[oldest_origin].pop(0).connection.close()
+                if not self._idle[oldest_origin]:
+                    del self._idle[oldest_origin]
+                total -= 1
+
+    def close(self) -> None:
+        with self._lock:
+            for entries in self._idle.values():
+                for idle in entries:
+                    idle.connection.close()
+            self._idle.clear()
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+        timeout: float,
+        on_phase: Callable[[str, float, float], None] | None = None,
+    ) -> PooledResponse:
+        origin = origin_for(url)
+        proxy = self.proxy_for(origin)
+        target = request_target(url)
+        if proxy is not None and origin[0] == "http":
+            # Plain HTTP is sent to the proxy with the absolute URL as the request target.
+            target = url
+            if proxy.authorization:
+                headers = {**headers, "Proxy-Authorization": proxy.authorization}
+        for attempt in range(2):
+            connection, reused = self.acquire(origin, timeout, proxy)
+            sent = False
+            try:
+                started = time.perf_counter()
+                if not reused:
+                    # Connect up front so the DNS+TCP+TLS handshake is timed apart from the request.
+                    connection.connect()
+                    connected = time.perf_counter()
+                    if on_phase is not None:
+                        on_phase("connect", started, connected - started)
+                    started = connected
+                connection.request(method, target, body=body, headers=headers)
+                sent = True
+                response = connection.getresponse()
+                if on_phase is not None:
+                    on_phase("wait", started, time.perf_counter() - started)
+            except STALE_CONNECTION_ERRORS as exc:
+                connection.close()
+                # A POST that was fully sent may already have been acted on: never replay it.
+                if reused and attempt == 0 and (not sent or method in IDEMPOTENT_METHODS):
+                    continue
+                raise URLError(exc) from exc
+            except (OSError, http.client.HTTPException) as exc:
+                connection.close()
+                raise URLError(exc) from exc
+            return PooledResponse(self, origin, connection, response, url)
+        raise URLError(f"could not send {method} {url}")
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        timeout: float = 20,
+        follow_redirects: bool = True,
+        on_redirect: Callable[[str, int, dict[str, str]], None] | None = None,
+        on_phase: Callable[[str, float, float], None] | None = None,
+    ) -> PooledResponse:
+        current_method = method.upper()
+        current_url = url
+        current_body = body
+        request_headers = dict(headers or {})
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._send(current_method, current_url, request_headers, current_body, timeout, on_phase)
+            location = response.headers.get("location")
+            # urllib's rule: GET and HEAD follow any redirect, POST only 301/302/303 (as a GET);
+            # anything else, such as a 307 of a POST, is returned to the caller as an HTTPError.
+            redirectable = current_method in {"GET", "HEAD"} or (
+                current_method == "POST" and response.status in {301, 302, 303}
+            )
+            if follow_redirects and response.status in REDIRECT_STATUSES and location and redirectable:
+                response.read()
+                response.close()
+                if on_redirect is not None:
+                    on_redirect(current_url, response.status, dict(response.headers.items()))
+                next_url = urljoin(current_url, location)
+                if origin_for(next_url) != origin_for(current_url):
+                    request_headers = {
+                        key: value for key, value in request_headers.items() if key.lower() not in CREDENTIAL_HEADERS
+                    }
+                current_url = next_url
+                if current_method == "POST":
+                    current_method = "GET"
+                    current_body = None
+                    request_headers = {
+                        key: value
+                        for key, value in request_headers.items()
+                        if key.lower() not in {"content-type", "content-length"}
+                    }
+                continue
+            if 200 <= response.status < 300:
+                return response
+            detail = response.read(MAX_ERROR_BODY_BYTES)
+            response.close()
+            raise HTTPError(current_url, response.status, response.reason, response.headers, io.BytesIO(detail))
+        raise HTTPError(current_url, response.status, "too many redirects", response.headers, io.BytesIO(b""))
+
+
+_shared_pool: ConnectionPool | None = None
+_shared_pool_pid: int | None = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_pool() -> ConnectionPool:
+    global _shared_pool, _shared_pool_pid
+    with _shared_pool_lock:
+        if _shared_pool is None or _shared_pool_pid != os.getpid():
+            _shared_pool = ConnectionPool()
+            _shared_pool_pid = os.getpid()
+        return _shared_pool
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Locality matching helpers for the concierge seed pipeline.
+
+Structures here are built once from the seeded suburb/council canon and then
+queried per input row, so resolving localities stays cheap as the canon grows
+beyond the Inner City catchment.
+"""
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, Iterable
+
+
+TOKEN_RE = re.compile(r"[^\W_]+")
+# Phrase tokens may be joined by whitespace, hyphens or apostrophes ("Merri-bek", "O'Connor");
+# any other punctuation ends a run so matches never straddle a sentence or list boundary.
+RUN_BREAK_RE = re.compile(r"[^\w\s'’-]+|_+")
+KM_PER_DEGREE = 111.195
+GRID_POINTS_PER_CELL = 2
+MIN_GRID_CELL_KM = 0.5
+
+
+def phrase_tokens(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def name_trigrams(text: str) -> set[str]:
+    # Each word is padded like pg_trgm ("  kew "), so word order does not change the trigram set.
+    trigrams: set[str] = set()
+    for token in phrase_tokens(text):
+        padded = f"  {token} "
+        trigrams.update(padded[index : index + 3] for index in range(len(padded) - 2))
+    return trigrams
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton over word tokens.
+
+    Matches are word-bounded by construction and one scan over the text reports
+    every phrase it contains, however many phrases the automaton was built from.
+    """
+
+    def __init__(self, phrases: Iterable[tuple[str, Any]]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._outputs: list[list[Any]] = [[]]
+        for phrase, value in phrases:
+            tokens = phrase_tokens(phrase)
+            if not tokens:
+                continue
+            state = 0
+            for token in tokens:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][token] = next_state
+                    self._goto.append({})
+                    self._outputs.append([])
+                state = next_state
+            self._outputs[state].append(value)
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for token, next_state in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+                queue.append(next_state)
+
+    def find_all(self, text: str) -> list[Any]:
+        hits: list[Any] = []
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        for run in RUN_BREAK_RE.split(text.lower()):
+            state = 0
+            for token in TOKEN_RE.findall(run):
+                while state and token not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(token, 0)
+                if outputs[state]:
+                    hits.extend(outputs[state])
+        return hits
+
+    def matched(self, text: str) -> list[Any]:
+        return list(dict.fromkeys(self.find_all(text)))
+
+
+class TrigramIndex:
+    """Inverted trigram index for ranked fuzzy name lookups.
+
+    A query only scores names sharing at least one trigram with it, ranked by
+    Jaccard similarity of the trigram sets, so misspellings such as "Fitzory"
+    still find "Fitzroy" without comparing against every name.
+    """
+
+    def __init__(self, names: Iterable[tuple[str, Any]]) -> None:
+        self._values: list[Any] = []
+        self._sizes: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        for name, value in names:
+            trigrams = name_trigrams(name)
+            if not trigrams:
+                continue
+            entry = len(self._values)
+            self._values.append(value)
+            self._sizes.append(len(trigrams))
+            for trigram in trigrams:
+                self._postings.setdefault(trigram, []).append(entry)
+
+    def search(self, text: str, limit: int = 5, min_similarity: float = 0.0) -> list[tuple[float, Any]]:
+        """Return up to `limit` (similarity, value) pairs, best first; ties keep insertion order."""
+        trigrams = name_trigrams(text)
+        shared: dict[int, int] = {}
+        for trigram in trigrams:
+            for entry in self._postings.get(trigram, ()):
+                shared[entry] = shared.get(entry, 0) + 1
+        scored = []
+        for entry, common in shared.items():
+            similarity = common / (len(trigrams) + self._sizes[entry] - common)
+            if similarity >= min_similarity:
+                scored.append((-similarity, entry))
+        scored.sort()
+        return [(-negative, self._values[entry]) for negative, entry in scored[:limit]]
+
+
+class CentroidGrid:
+    """Uniform grid over point centroids for nearest-neighbour lookups.
+
+    Points are projected equirectangularly about their mean latitude, which is
+    accurate to well under 1% across a state-sized canon, so a query only
+    visits the rings of cells around it instead of every centroid.
+    """
+
+    def __init__(self, points: Iterable[tuple[float, float, Any]], cell_km: float | None = None) -> None:
+        entries = list(points)
+        self._lon_scale = math.cos(math.radians(sum(lat for lat, _, _ in entries) / len(entries))) if entries else 1.0
+        projected = [(*self.project(latitude, longitude), order, value) for order, (latitude, longitude, value) in enumerate(entries)]
+        self.cell_km = cell_km or self._default_cell_km(projected)
+        self._cells: dict[tuple[int, int], list[tuple[float, float, int, Any]]] = {}
+        for entry in projected:
+            self._cells.setdefault(self._cell_of(entry[0], entry[1]), []).append(entry)
+        self._bounds = (
+            (min(cx for cx, _ in self._cells), max(cx for cx, _ in self._cells), min(cy for _, cy in self._cells), max(cy for _, cy in self._cells))
+            if self._cells
+            else (0, 0, 0, 0)
+        )
+        self.size = len(entries)
+
+    @staticmethod
+    def _default_cell_km(projected: list[tuple[float, float, int, Any]]) -> float:
+        # Aim for about GRID_POINTS_PER_CELL centroids per cell over the bounding box.
+        if len(projected) < 2:
+            return MIN_GRID_CELL_KM
+        width = max(x for x, _, _, _ in projected) - min(x for x, _, _, _ in projected)
+        height = max(y for _, y, _, _ in projected) - min(y for _, y, _, _ in projected)
+        return max(math.sqrt(width * height * GRID_POINTS_PER_CELL / len(projected)), MIN_GRID_CELL_KM)
+
+    def project(self, latitude: float, longitude: float) -> tuple[float, float]:
+        return longitude * KM_PER_DEGREE * self._lon_scale, latitude * KM_PER_DEGREE
+
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x / self.cell_km), math.floor(y / self.cell_km)
+
+    def _ring(self, cx: int, cy: int, ring: int) -> Iterable[tuple[int, int]]:
+        if ring == 0:
+            yield cx, cy
+            return
+        for dx in range(-ring, ring + 1):
+            yield cx + dx, cy - ring
+            yield cx + dx, cy + ring
+        for dy in range(-ring + 1, ring):
+            yield cx - ring, cy + dy
+            yield cx + ring, cy + dy
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        limit: int = 1,
+        max_km: float | None = None,
+    ) -> list[tuple[float, Any]]:
+        """Return up to `limit` (distance_km, value) pairs, closest first; ties keep insertion order."""
+        if not self._cells or limit < 1:
+            return []
+        x, y = self.project(latitude, longitude)
+        cx, cy = self._cell_of(x, y)
+        min_cx, max_cx, min_cy, max_cy = self._bounds
+        last_ring = max(cx - min_cx, max_cx - cx, cy - min_cy, max_cy - cy, 0)
+        cell_km = self.cell_km
+        found: list[tuple[float, int, Any]] = []
+        for ring in range(last_ring + 1):
+            for cell in self._ring(cx, cy, ring):
+                for px, py, order, value in self._cells.get(cell, ()):
+                    distance = math.hypot(px - x, py - y)
+                    if max_km is None or distance <= max_km:
+                        found.append((distance, order, value))
+            # Every point closer than the edge of the searched box has been seen.
+            reach = min(
+                x - (cx - ring) * cell_km,
+                (cx + ring + 1) * cell_km - x,
+                y - (cy - ring) * cell_km,
+                (cy + ring + 1) * cell_km - y,
+            )
+            if max_km is not None and reach >= max_km:
+                break
+            if len(found) >= limit:
+                found.sort()
+                if found[limit - 1][0] <= reach:
+                    break
+        found.sort()
+        return [(distance, value) for distance, _, value in found[:limit]]
@@ -11,21 +11,59 @@ No AI sourcing, no blind discovery, and no publish mutation.
 from __future__ import annotations
 
 import argparse
+import codecs
 import csv
+import difflib
+import hashlib
+import heapq
 import html
+import importlib.util
 import json
+import math
 import os
+import pickle
 import re
-import ssl
 import sys
-from dataclasses import dataclass
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from concurrent.futures import CancelledError, Executor, Future
+from contextlib import nullcontext
+from dataclasses import astuple, dataclass, field
 from datetime import datetime
+from functools import cached_property, lru_cache
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Iterator
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
+from urllib.parse import urldefrag, urljoin, urlparse
+
+from concierge_checkpoint import CheckpointJournal, CheckpointMismatch, checkpoint_row_key, read_journal
+from concierge_http import shared_pool
+from concierge_locality import CentroidGrid, PhraseMatcher, TrigramIndex, phrase_tokens
+from concierge_profile import CONTACT_CRAWL_PREFIX, RunProfiler, Span, StageTimer
+from concierge_replay import CorpusRecorder, replay_request_url, source_url_from_replay
+from concierge_retry import (
+    DEFAULT_BREAKER_THRESHOLD,
+    DEFAULT_MAX_ATTEMPTS,
+    HOST_FAILURES,
+    RETRYABLE_FAILURES,
+    CircuitBreaker,
+    RetryPolicy,
+    RunDeadline,
+    classify_fetch_error,
+    retry_after_seconds,
+)
+from concierge_snapshot_cache import CachedSnapshot, SnapshotCache, SnapshotCacheMiss, atomic_write_bytes
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+# Only brotli releases that can cap each process() call's output (1.1+) are safe against decompression bombs.
+if brotli is not None and not hasattr(brotli.Decompressor, "can_accept_more_data"):
+    brotli = None
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -33,21 +71,41 @@ DEFAULT_INPUT = REPO_ROOT / "data" / "concierge_seed_queue_inner_melbourne_pilot
 DEFAULT_OUTPUT_DIR = REPO_ROOT / "qa_artifacts" / "concierge"
 DATA_IMPORT_SQL = REPO_ROOT / "supabase" / "data-import.sql"
 SUBURB_MAPPING_CSV = REPO_ROOT / "data" / "suburbs_councils_mapping.csv"
+DEFAULT_CANON_CACHE_DIR = REPO_ROOT / ".cache" / "concierge"
+CANON_CACHE_FORMAT = 1
+DEFAULT_FETCH_WORKERS = 8
+DEFAULT_CPU_WORKERS = 0
+DEFAULT_PER_HOST_CONCURRENCY = 2
+DEFAULT_PER_HOST_RPS = 1.0
+FETCH_AHEAD_PER_WORKER = 16
+# Scheduler priorities: a queue row's landing page is always taken before follow-up pages such as contact crawls.
+ROW_FETCH_PRIORITY = 0
+FOLLOW_UP_FETCH_PRIORITY = 1
+FETCH_CHUNK_SIZE = 64 * 1024
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+DEFAULT_STREAM_BYTE_BUDGET = 512_000
+DEFAULT_STREAM_MIN_BODY_CHARS = 4_000
+DEFAULT_PARSER_BACKEND = "stdlib"
+APPROVED_MVP_CATCHMENT_REGION = "Inner City"
+ADDRESS_CANDIDATE_LIMIT = 3
+ADDRESS_CANDIDATE_MAX_KM = 5.0
+SEED_QUEUE_REQUIRED_COLUMNS = ("source_url", "business_name_hint", "suburb_hint")
+MAX_REPORTED_QUEUE_ERRORS = 50
+SUBURB_SUGGESTION_LIMIT = 3
+SUBURB_SUGGESTION_MIN_SIMILARITY = 0.3
+SUBURB_AUTO_RESOLVE_MARGIN = 0.15
+# Absolute floor on character similarity: a sole trigram candidate can still be a different suburb ("Fitz").
+SUBURB_AUTO_RESOLVE_MIN_RATIO = 0.8
+ADDRESS_POSTCODE_RE = re.compile(r"\b(\d{4})\W*(?:australia\W*)?$", re.I)
+NO_CONTACT_FIELDS_WARNING = "no direct contact fields extracted from source"
+CONTACT_FIELDS = ("phone", "email", "address")
+# Contact pages rank ahead of about/location pages, which only sometimes carry contact details.
+CONTACT_PAGE_PATTERNS = (
+    re.compile(r"contact|get[\W_]*in[\W_]*touch|enquir", re.I),
+    re.compile(r"about|find[\W_]*us|locations?\b|visit[\W_]*us", re.I),
+)
 
 
-def load_approved_mvp_catchment_suburbs() -> frozenset[str]:
-    with SUBURB_MAPPING_CSV.open(encoding="utf-8") as fh:
-        rows = list(csv.DictReader(fh))
-    suburbs = {
-        row["suburb"].strip()
-        for row in rows
-        if row.get("region", "").strip() == "Inner City" and row.get("suburb", "").strip()
-    }
-    return frozenset(suburbs)
-
-
-APPROVED_MVP_CATCHMENT_SUBURBS = load_approved_mvp_catchment_suburbs()
-
 SERVICE_TYPES = [
     "puppy_training",
     "obedience_training",
@@ -134,9 +192,8 @@ class ExistingInventoryRecord:
     resource_type: str
 
 
-class SnapshotParser(HTMLParser):
+class SnapshotCollector:
     def __init__(self) -> None:
-        super().__init__(convert_charrefs=True)
         self.title_parts: list[str] = []
         self.body_parts: list[str] = []
         self.h1_parts: list[str] = []
@@ -145,6 +202,10 @@ class SnapshotParser(HTMLParser):
         self.meta: dict[str, str] = {}
         self.links: list[dict[str, str]] = []
         self.canonical_url: str = ""
+        self.jsonld_blocks: list[str] = []
+        self.head_complete = False
+        self.body_chars = 0
+        self._jsonld_parts: list[str] | None = None
         self._skip_depth = 0
         self._in_title = False
         self._current_heading: str = ""
@@ -152,7 +213,11 @@ class SnapshotParser(HTMLParser):
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
         attrs_map = {key.lower(): (value or "") for key, value in attrs}
+        if tag == "body":
+            self.head_complete = True
         if tag in {"script", "style", "noscript"}:
+            if tag == "script" and attrs_map.get("type", "").strip().lower() == "application/ld+json":
+                self._jsonld_parts = []
             self._skip_depth += 1
             return
         if tag == "title":
@@ -177,8 +242,13 @@ class SnapshotParser(HTMLParser):
 
     def handle_endtag(self, tag: str) -> None:
         if tag in {"script", "style", "noscript"} and self._skip_depth > 0:
+            if tag == "script" and self._jsonld_parts is not None:
+                self.jsonld_blocks.append("".join(self._jsonld_parts))
+                self._jsonld_parts = None
             self._skip_depth -= 1
             return
+        if tag == "head":
+            self.head_complete = True
         if tag == "title":
             self._in_title = False
         if tag in {"h1", "h2", "h3"}:
@@ -188,6 +258,9 @@ class SnapshotParser(HTMLParser):
             self._current_link = None
 
     def handle_data(self, data: str) -> None:
+        if self._jsonld_parts is not None:
+            self._jsonld_parts.append(data)
+            return
         if self._skip_depth > 0:
             return
         text = html.unescape(data).strip()
@@ -197,6 +270,7 @@ class SnapshotParser(HTMLParser):
             self.title_parts.append(text)
         else:
             self.body_parts.append(text)
+            self.body_chars += len(text) + 1
         if self._current_heading == "h1":
             self.h1_parts.append(text)
         elif self._current_heading == "h2":
@@ -208,6 +282,91 @@ class SnapshotParser(HTMLParser):
                 self._current_link["text"] += " "
             self._current_link["text"] += text
 
+    def has_extraction_evidence(self, min_body_chars: int) -> bool:
+        return self.head_complete and self._skip_depth == 0 and self.body_chars >= min_body_chars
+
+
+class SnapshotParser(SnapshotCollector, HTMLParser):
+    def __init__(self) -> None:
+        HTMLParser.__init__(self, convert_charrefs=True)
+        SnapshotCollector.__init__(self)
+
+
+class LxmlSnapshotTarget:
+    def __init__(self, collector: SnapshotCollector) -> None:
+        self.collector = collector
+        self._pending_text: list[str] = []
+
+    def _flush_text(self) -> None:
+        # libxml2 splits one text run at entity boundaries; html.parser delivers it whole.
+        if self._pending_text:
+            self.collector.handle_data("".join(self._pending_text))
+            self._pending_text = []
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._flush_text()
+        self.collector.handle_starttag(tag.lower(), [(key.lower(), value) for key, value in attrib.items()])
+
+    def end(self, tag: str) -> None:
+        self._flush_text()
+        self.collector.handle_endtag(tag.lower())
+
+    def data(self, text: str) -> None:
+        self._pending_text.append(text)
+
+    def comment(self, text: str) -> None:
+        self._flush_text()
+
+    def pi(self, target: str, data: str | None = None) -> None:
+        self._flush_text()
+
+    def doctype(self, *args: Any) -> None:
+        self._flush_text()
+
+    def close(self) -> None:
+        self._flush_text()
+
+
+class LxmlSnapshotParser(SnapshotCollector):
+    def __init__(self) -> None:
+        from lxml import etree as lxml_etree
+
+        super().__init__()
+        self._parser = lxml_etree.HTMLParser(target=LxmlSnapshotTarget(self), no_network=True, recover=True)
+        self._fed = False
+
+    def feed(self, text: str) -> None:
+        if text:
+            self._parser.feed(text)
+            self._fed = True
+
+    def close(self) -> None:
+        if self._fed:
+            self._parser.close()
+            self._fed = False
+
+
+SnapshotParserBackend = SnapshotParser | LxmlSnapshotParser
+
+SNAPSHOT_PARSER_BACKENDS: dict[str, Callable[[], SnapshotParserBackend]] = {"stdlib": SnapshotParser}
+# Probe without importing: lxml.etree alone costs several ms per process and most runs use stdlib.
+if importlib.util.find_spec("lxml") is not None:
+    SNAPSHOT_PARSER_BACKENDS["lxml"] = LxmlSnapshotParser
+
+
+def resolve_parser_backend(name: str) -> str:
+    if name == "auto":
+        return "lxml" if "lxml" in SNAPSHOT_PARSER_BACKENDS else DEFAULT_PARSER_BACKEND
+    if name not in SNAPSHOT_PARSER_BACKENDS:
+        raise ValueError(
+            f"snapshot parser backend '{name}' is not available; choose from {sorted(SNAPSHOT_PARSER_BACKENDS)} or auto"
+        )
+    return name
+
+
+def create_snapshot_parser(backend: str = DEFAULT_PARSER_BACKEND) -> SnapshotParserBackend:
+    return SNAPSHOT_PARSER_BACKENDS[resolve_parser_backend(backend)]()
+
 
 def norm(value: str) -> str:
     return re.sub(r"[^a-z0-9]+", "", value.lower())
@@ -230,22 +389,193 @@ def normalize_domain(url: str) -> str:
     return host
 
 
+def parse_duration(value: str) -> float:
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*", value.lower())
+    if not match:
+        raise ValueError(f"invalid duration '{value}'; use seconds or a suffix of s, m, h or d (e.g. 90, 15m, 2h)")
+    multiplier = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2)]
+    return float(match.group(1)) * multiplier
+
+
 def locality_key(suburb_name: str, council_name: str = "") -> str:
     if council_name:
         return f"{norm(suburb_name)}:{norm(council_name)}"
     return norm(suburb_name)
 
 
-def load_councils_and_suburbs() -> tuple[dict[str, CouncilRecord], dict[tuple[str, str], SuburbRecord], list[dict[str, str]]]:
-    sql_text = DATA_IMPORT_SQL.read_text(encoding="utf-8")
-    csv_rows = list(csv.DictReader(SUBURB_MAPPING_CSV.read_text(encoding="utf-8").splitlines()))
+@dataclass(frozen=True)
+class LocalityCanon:
+    councils: dict[str, CouncilRecord]
+    suburbs: tuple[SuburbRecord, ...]
+    mapping_rows: tuple[dict[str, str], ...]
+    by_suburb: dict[str, tuple[SuburbRecord, ...]]
+    by_postcode: dict[str, tuple[SuburbRecord, ...]]
+    by_suburb_council: dict[tuple[str, str], SuburbRecord]
+
+    @classmethod
+    def build(
+        cls,
+        councils: dict[str, CouncilRecord],
+        suburb_records: Iterable[SuburbRecord],
+        mapping_rows: Iterable[dict[str, str]],
+    ) -> LocalityCanon:
+        by_suburb_council: dict[tuple[str, str], SuburbRecord] = {}
+        for record in suburb_records:
+            by_suburb_council[(norm(record.name), norm(record.council_name))] = record
+        by_suburb: dict[str, list[SuburbRecord]] = {}
+        by_postcode: dict[str, list[SuburbRecord]] = {}
+        for (suburb_key, _), record in by_suburb_council.items():
+            by_suburb.setdefault(suburb_key, []).append(record)
+            if record.postcode:
+                by_postcode.setdefault(record.postcode, []).append(record)
+        return cls(
+            councils=councils,
+            suburbs=tuple(by_suburb_council.values()),
+            mapping_rows=tuple(mapping_rows),
+            by_suburb={key: tuple(records) for key, records in by_suburb.items()},
+            by_postcode={key: tuple(records) for key, records in by_postcode.items()},
+            by_suburb_council=by_suburb_council,
+        )
+
+    def suburbs_named(self, suburb_name: str) -> tuple[SuburbRecord, ...]:
+        return self.by_suburb.get(norm(suburb_name), ())
+
+    def suburbs_with_postcode(self, postcode: str) -> tuple[SuburbRecord, ...]:
+        return self.by_postcode.get(postcode.strip(), ())
+
+    def lookup(self, suburb_name: str, council_name: str) -> SuburbRecord | None:
+        return self.by_suburb_council.get((norm(suburb_name), norm(council_name)))
+
+    @cached_property
+    def centroid_index(self) -> CentroidGrid:
+        points = []
+        for record in self.suburbs:
+            centroid = suburb_centroid(record)
+            if centroid is not None:
+                points.append((*centroid, record))
+        return CentroidGrid(points)
+
+    @cached_property
+    def postcode_centroids(self) -> dict[str, tuple[float, float]]:
+        centroids: dict[str, tuple[float, float]] = {}
+        for postcode, records in self.by_postcode.items():
+            points = {centroid for centroid in map(suburb_centroid, records) if centroid is not None}
+            if points:
+                centroids[postcode] = (
+                    sum(lat for lat, _ in points) / len(points),
+                    sum(lon for _, lon in points) / len(points),
+                )
+        return centroids
+
+    @cached_property
+    def suburb_matcher(self) -> PhraseMatcher:
+        return PhraseMatcher((record.name, norm(record.name)) for record in self.suburbs)
+
+    @cached_property
+    def suburb_name_index(self) -> TrigramIndex:
+        names = {norm(record.name): record.name for record in self.suburbs}
+        return TrigramIndex((name, name) for name in names.values())
+
+    @cached_property
+    def approved_mvp_catchment_suburbs(self) -> frozenset[str]:
+        return frozenset(
+            row["suburb"].strip()
+            for row in self.mapping_rows
+            if row.get("region", "").strip() == APPROVED_MVP_CATCHMENT_REGION and row.get("suburb", "").strip()
+        )
+
+
+def parse_coordinate(value: Any, limit: float) -> float | None:
+    try:
+        coordinate = float(str(value).strip())
+    except ValueError:
+        return None
+    return coordinate if math.isfinite(coordinate) and -limit <= coordinate <= limit else None
+
+
+def suburb_centroid(record: SuburbRecord) -> tuple[float, float] | None:
+    latitude = parse_coordinate(record.latitude, 90)
+    longitude = parse_coordinate(record.longitude, 180)
+    if latitude is None or longitude is None:
+        return None
+    return latitude, longitude
+
+
+def canon_cache_path(cache_dir: Path, sql_bytes: bytes, mapping_csv_bytes: bytes) -> Path:
+    digest = hashlib.sha256()
+    digest.update(f"locality-canon-v{CANON_CACHE_FORMAT}\0".encode("ascii"))
+    for source in (sql_bytes, mapping_csv_bytes):
+        digest.update(hashlib.sha256(source).digest())
+    return cache_dir / f"locality_canon-{digest.hexdigest()[:32]}.pickle"
+
+
+def read_canon_cache(path: Path) -> LocalityCanon | None:
+    # Only builtins are pickled so a cache written by `python concierge_pipeline.py` (__main__)
+    # loads under `import concierge_pipeline` and vice versa.
+    try:
+        format_version, council_rows, suburb_rows, mapping_rows = pickle.loads(path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError, ImportError):
+        return None
+    if format_version != CANON_CACHE_FORMAT:
+        return None
+    councils = {row[1]: CouncilRecord(*row) for row in council_rows}
+    return LocalityCanon.build(councils, (SuburbRecord(*row) for row in suburb_rows), mapping_rows)
+
+
+def write_canon_cache(path: Path, canon: LocalityCanon) -> None:
+    payload = (
+        CANON_CACHE_FORMAT,
+        [astuple(council) for council in canon.councils.values()],
+        [astuple(record) for record in canon.suburbs],
+        list(canon.mapping_rows),
+    )
+    try:
+        atomic_write_bytes(path, pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+        for stale in path.parent.glob("locality_canon-*.pickle"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        return
+
+
+def load_councils_and_suburbs(
+    cache_dir: Path | None = DEFAULT_CANON_CACHE_DIR,
+    sql_path: Path = DATA_IMPORT_SQL,
+    mapping_csv_path: Path = SUBURB_MAPPING_CSV,
+) -> LocalityCanon:
+    sql_bytes = sql_path.read_bytes()
+    mapping_csv_bytes = mapping_csv_path.read_bytes()
+    cache_path = canon_cache_path(cache_dir, sql_bytes, mapping_csv_bytes) if cache_dir else None
+    if cache_path:
+        cached = read_canon_cache(cache_path)
+        if cached is not None:
+            return cached
+    canon = parse_locality_canon(sql_bytes.decode("utf-8"), mapping_csv_bytes.decode("utf-8"), sql_path)
+    if cache_path:
+        write_canon_cache(cache_path, canon)
+    return canon
+
+
+@lru_cache(maxsize=1)
+def default_locality_canon() -> LocalityCanon:
+    # Loaded on first use rather than at import so `import concierge_pipeline` (tests, publish,
+    # spawned CPU workers) does no canon I/O unless a caller actually needs localities.
+    return load_councils_and_suburbs()
+
+
+def approved_mvp_catchment_suburbs(canon: LocalityCanon | None = None) -> frozenset[str]:
+    return (canon or default_locality_canon()).approved_mvp_catchment_suburbs
+
+
+def parse_locality_canon(sql_text: str, mapping_csv_text: str, sql_path: Path = DATA_IMPORT_SQL) -> LocalityCanon:
+    csv_rows = list(csv.DictReader(mapping_csv_text.splitlines()))
 
     council_block = re.search(r"INSERT INTO councils \(name, region\) VALUES\s*(.*?);\s*INSERT INTO suburbs", sql_text, re.S)
     suburb_block = re.search(r"INSERT INTO suburbs \(name, postcode, latitude, longitude, council_id\) VALUES\s*(.*?);\s*$", sql_text, re.S)
     if not council_block:
-        raise SystemExit(f"Could not find councils INSERT block in {DATA_IMPORT_SQL}")
+        raise SystemExit(f"Could not find councils INSERT block in {sql_path}")
     if not suburb_block:
-        raise SystemExit(f"Could not find suburbs INSERT block in {DATA_IMPORT_SQL}")
+        raise SystemExit(f"Could not find suburbs INSERT block in {sql_path}")
 
     councils: dict[str, CouncilRecord] = {}
     for idx, (name, region) in enumerate(re.findall(r"\('((?:[^']|'')*)',\s*'((?:[^']|'')*)'\)", council_block.group(1)), start=1):
@@ -285,7 +615,6 @@ def load_councils_and_suburbs() -> tuple[dict[str, CouncilRecord], dict[tuple[st
         )
 
     csv_lookup = {(row["suburb"], row["council"]): row for row in csv_rows}
-    suburb_lookup: dict[tuple[str, str], SuburbRecord] = {}
     for record in suburb_records:
         csv_row = csv_lookup.get((record.name, record.council_name))
         if csv_row is None:
@@ -294,66 +623,397 @@ def load_councils_and_suburbs() -> tuple[dict[str, CouncilRecord], dict[tuple[st
             raise SystemExit(
                 f"Postcode mismatch for {record.name} / {record.council_name}: CSV={csv_row['postcode']} SQL={record.postcode}"
             )
-        suburb_lookup[(norm(record.name), norm(record.council_name))] = record
-
-    return councils, suburb_lookup, csv_rows
 
+    return LocalityCanon.build(councils, suburb_records, csv_rows)
 
-def parse_seed_queue(path: Path) -> list[dict[str, str]]:
-    rows = list(csv.DictReader(path.read_text(encoding="utf-8").splitlines()))
-    required = {"source_url", "business_name_hint", "suburb_hint"}
-    if not rows:
-        raise SystemExit(f"Input queue is empty: {path}")
-    if not required.issubset(rows[0].keys()):
-        raise SystemExit(f"Input queue missing required columns {sorted(required)}: {path}")
 
-    seen_source_urls: set[str] = set()
-    for index, row in enumerate(rows, start=1):
-        source_url = row["source_url"].strip()
+def suggest_suburbs(
+    suburb_hint: str,
+    canon: LocalityCanon,
+    allowed: Iterable[str] | None = None,
+    limit: int = SUBURB_SUGGESTION_LIMIT,
+) -> list[tuple[float, str]]:
+    allowed_keys = {norm(name) for name in allowed} if allowed is not None else None
+    matches = canon.suburb_name_index.search(suburb_hint, len(canon.by_suburb), SUBURB_SUGGESTION_MIN_SIMILARITY)
+    return [
+        (similarity, name)
+        for similarity, name in matches
+        if norm(name) != norm(suburb_hint) and (allowed_keys is None or norm(name) in allowed_keys)
+    ][:limit]
+
+
+def correct_suburb_hint(
+    suburb_hint: str,
+    canon: LocalityCanon,
+    allowed: Iterable[str] | None = None,
+) -> tuple[str, float] | None:
+    # Only a clear, close winner with the same word count is auto-resolved: "St Kilda East" must
+    # not silently become "St Kilda", it stays a suggestion for the reviewer.
+    suggestions = suggest_suburbs(suburb_hint, canon, allowed=allowed, limit=2)
+    if not suggestions:
+        return None
+    similarity, name = suggestions[0]
+    runner_up = suggestions[1][0] if len(suggestions) > 1 else 0.0
+    if similarity - runner_up < SUBURB_AUTO_RESOLVE_MARGIN or len(phrase_tokens(name)) != len(phrase_tokens(suburb_hint)):
+        return None
+    if difflib.SequenceMatcher(None, norm(suburb_hint), norm(name)).ratio() < SUBURB_AUTO_RESOLVE_MIN_RATIO:
+        return None
+    return name, similarity
+
+
+def format_suburb_suggestions(suggestions: list[tuple[float, str]]) -> str:
+    return f" (did you mean {' or '.join(name for _, name in suggestions)}?)" if suggestions else ""
+
+
+@dataclass
+class SeedQueueReader:
+    """Stream validated rows from a seed queue CSV, collecting every row error.
+
+    Rows are validated as they are read and only valid rows are yielded, so the
+    fetch stage can start on the first rows of a large queue and rejected rows
+    are never fetched. A hint that clearly misspells a catchment suburb is
+    accepted with the correction in `suburb_hint_correction`. Each row carries its
+    CSV row number in `input_row_index`, so rejected rows do not shift the
+    numbering. `errors` is complete once iteration finishes.
+    """
+
+    path: Path
+    canon: LocalityCanon | None = None
+    errors: list[str] = field(default_factory=list)
+    rows_read: int = 0
+    rows_accepted: int = 0
+
+    def __iter__(self) -> Iterator[dict[str, str]]:
+        canon = self.canon or default_locality_canon()
+        catchment_suburbs = approved_mvp_catchment_suburbs(canon)
+        seen_source_urls: set[str] = set()
+        with self.path.open(encoding="utf-8", newline="") as handle:
+            reader = csv.DictReader(handle)
+            if not reader.fieldnames:
+                raise SystemExit(f"Input queue is empty: {self.path}")
+            if not set(SEED_QUEUE_REQUIRED_COLUMNS).issubset(reader.fieldnames):
+                raise SystemExit(f"Input queue missing required columns {sorted(SEED_QUEUE_REQUIRED_COLUMNS)}: {self.path}")
+            for index, row in enumerate(reader, start=1):
+                self.rows_read = index
+                row_errors = self.validate_row(index, row, canon, catchment_suburbs, seen_source_urls)
+                if row_errors:
+                    self.errors.extend(row_errors)
+                    continue
+                self.rows_accepted += 1
+                row["input_row_index"] = str(index)
+                yield row
+        if not self.rows_read:
+            raise SystemExit(f"Input queue is empty: {self.path}")
+
+    def validate_row(
+        self,
+        index: int,
+        row: dict[str, str],
+        canon: LocalityCanon,
+        catchment_suburbs: frozenset[str],
+        seen_source_urls: set[str],
+    ) -> list[str]:
+        errors: list[str] = []
+        # Short rows leave trailing columns as None; treat them as blank so they are reported, not crashed on.
+        source_url = (row.get("source_url") or "").strip()
         parsed = urlparse(source_url)
         if parsed.scheme not in {"http", "https"} or not parsed.netloc:
-            raise SystemExit(
-                f"Row {index} in {path} has a non-approved source_url; only absolute http(s) URLs are allowed: {source_url}"
+            errors.append(
+                f"Row {index} in {self.path} has a non-approved source_url; only absolute http(s) URLs are allowed: {source_url}"
             )
-        suburb_hint = row["suburb_hint"].strip()
-        if suburb_hint not in APPROVED_MVP_CATCHMENT_SUBURBS:
-            raise SystemExit(
-                f"Row {index} in {path} has suburb_hint outside the approved Inner Melbourne catchment: {suburb_hint}"
+        suburb_hint = (row.get("suburb_hint") or "").strip()
+        correction = None
+        if suburb_hint not in catchment_suburbs:
+            correction = correct_suburb_hint(suburb_hint, canon, allowed=catchment_suburbs)
+        if correction is not None:
+            # A clear misspelling of a catchment suburb is accepted; the artifact flags the correction as advisory.
+            row["suburb_hint_correction"] = correction[0]
+        elif suburb_hint not in catchment_suburbs:
+            suggestions = suggest_suburbs(suburb_hint, canon, allowed=catchment_suburbs)
+            errors.append(
+                f"Row {index} in {self.path} has suburb_hint outside the approved Inner Melbourne catchment: {suburb_hint}"
+                f"{format_suburb_suggestions(suggestions)}"
             )
         if source_url in seen_source_urls:
-            raise SystemExit(f"Duplicate approved source_url in queue at row {index}: {source_url}")
-        seen_source_urls.add(source_url)
+            errors.append(f"Duplicate approved source_url in queue at row {index}: {source_url}")
+        elif not errors:
+            seen_source_urls.add(source_url)
+        return errors
+
+    def report(self) -> str:
+        lines = [f"Input queue {self.path} has {len(self.errors)} invalid row error(s) in {self.rows_read} rows:"]
+        lines.extend(f"  {error}" for error in self.errors[:MAX_REPORTED_QUEUE_ERRORS])
+        if len(self.errors) > MAX_REPORTED_QUEUE_ERRORS:
+            lines.append(f"  ... and {len(self.errors) - MAX_REPORTED_QUEUE_ERRORS} more")
+        return "\n".join(lines)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "rows_read": self.rows_read,
+            "rows_accepted": self.rows_accepted,
+            "rows_rejected": self.rows_read - self.rows_accepted,
+            "errors": list(self.errors),
+        }
 
+
+def parse_seed_queue(path: Path, canon: LocalityCanon | None = None) -> list[dict[str, str]]:
+    reader = SeedQueueReader(path, canon)
+    rows = list(reader)
+    if reader.errors:
+        raise SystemExit(reader.report())
     return rows
 
 
-def fetch_html(url: str, timeout: int = 20, max_bytes: int = 2_000_000) -> tuple[int | None, str, str, str, str]:
-    request = Request(
-        url,
-        headers={
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-AU,en;q=0.9",
-            "Accept-Encoding": "identity",
-        },
+@dataclass(frozen=True)
+class FetchOptions:
+    timeout: int = 20
+    max_bytes: int = 2_000_000
+    cache: SnapshotCache | None = None
+    stream_parse: bool = False
+    stream_byte_budget: int = DEFAULT_STREAM_BYTE_BUDGET
+    stream_min_body_chars: int = DEFAULT_STREAM_MIN_BODY_CHARS
+    parser_backend: str = DEFAULT_PARSER_BACKEND
+    contact_crawl_pages: int = 0
+    retry_policy: RetryPolicy = RetryPolicy()
+    circuit_breaker: CircuitBreaker | None = None
+    deadline: RunDeadline | None = None
+    recorder: CorpusRecorder | None = None
+    replay_url: str = ""
+
+
+@dataclass(frozen=True)
+class FetchedPage:
+    status: int | None
+    final_url: str
+    content_type: str
+    charset: str
+    html_text: str
+    cache_status: str = ""
+    content_encoding: str = ""
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    parser: SnapshotParserBackend | None = None
+    stopped_early: bool = False
+
+
+class ContentDecoder:
+    def __init__(self, content_encoding: str) -> None:
+        self.encoding = content_encoding.strip().lower()
+        self._raw_deflate_fallback = False
+        self._pending = b""
+        self._br_input = b""
+        if self.encoding in {"", "identity"}:
+            self._decoder: Any = None
+        elif self.encoding in {"gzip", "x-gzip"}:
+            self._decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self.encoding == "deflate":
+            self._decoder = zlib.decompressobj(zlib.MAX_WBITS)
+            self._raw_deflate_fallback = True
+        elif self.encoding == "br" and brotli is not None:
+            self._decoder = brotli.Decompressor()
+        else:
+            raise ValueError(f"unsupported content-encoding '{content_encoding}'")
+
+    @property
+    def has_pending(self) -> bool:
+        if self.encoding == "br":
+            return bool(self._pending or self._br_input) or not self._decoder.can_accept_more_data()
+        return bool(self._pending)
+
+    def decompress(self, chunk: bytes, limit: int) -> bytes:
+        data = self._pending + chunk
+        if self._decoder is None:
+            # Identity buffers the rest of the chunk; zlib and brotli keep their input instead.
+            self._pending = data[limit:]
+            return data[:limit]
+        if self.encoding == "br":
+            # Capped output per call, like zlib's max_length: a brotli bomb never inflates past `limit` at once.
+            # Input that arrives while the decoder still holds capped output waits until it can be fed.
+            self._br_input += chunk
+            feed = b""
+            if self._decoder.can_accept_more_data():
+                feed, self._br_input = self._br_input, b""
+            decoded = self._pending + self._decoder.process(feed, output_buffer_limit=limit)
+            self._pending = decoded[limit:]
+            return decoded[:limit]
+        try:
+            decoded = self._decoder.decompress(data, limit)
+        except zlib.error:
+            if not self._raw_deflate_fallback:
+                raise
+            # Some servers send raw DEFLATE without the zlib header despite advertising "deflate".
+            self._decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+            decoded = self._decoder.decompress(data, limit)
+        self._raw_deflate_fallback = False
+        self._pending = self._decoder.unconsumed_tail
+        return decoded
+
+    def flush(self, limit: int) -> bytes:
+        if self._decoder is None or self.encoding == "br":
+            return b""
+        return self._decoder.flush()[:limit]
+
+
+def read_decoded_body(
+    response: Any,
+    content_encoding: str,
+    max_bytes: int,
+    on_chunk: Callable[[bytes], bool] | None = None,
+) -> tuple[bytes, int, bool]:
+    decoder = ContentDecoder(content_encoding)
+    parts: list[bytes] = []
+    decoded_bytes = 0
+    wire_bytes = 0
+    stopped_early = False
+    while decoded_bytes < max_bytes:
+        step = min(FETCH_CHUNK_SIZE, max_bytes - decoded_bytes)
+        at_eof = False
+        if decoder.has_pending:
+            decoded = decoder.decompress(b"", step)
+        else:
+            chunk = response.read(FETCH_CHUNK_SIZE)
+            if chunk:
+                wire_bytes += len(chunk)
+                decoded = decoder.decompress(chunk, step)
+            else:
+                at_eof = True
+                decoded = decoder.flush(step)
+        parts.append(decoded)
+        decoded_bytes += len(decoded)
+        if on_chunk is not None and decoded and on_chunk(decoded) and not at_eof:
+            stopped_early = True
+            break
+        if at_eof:
+            break
+    return b"".join(parts), wire_bytes, stopped_early
+
+
+def page_from_cached_snapshot(snapshot: CachedSnapshot, cache_status: str) -> FetchedPage:
+    return FetchedPage(
+        status=snapshot.status,
+        final_url=snapshot.final_url,
+        content_type=snapshot.content_type,
+        charset=snapshot.charset,
+        html_text=snapshot.body.decode(snapshot.charset, errors="replace"),
+        cache_status=cache_status,
+        content_encoding=snapshot.headers.get("content-encoding", ""),
+        decoded_bytes=len(snapshot.body),
     )
-    context = ssl.create_default_context()
-    with urlopen(request, timeout=timeout, context=context) as response:
-        status = getattr(response, "status", response.getcode())
-        final_url = response.geturl()
-        content_type = response.headers.get("content-type", "")
-        charset = response.headers.get_content_charset() or "utf-8"
-        raw = response.read(max_bytes)
-        html_text = raw.decode(charset, errors="replace")
-        return status, final_url, content_type, charset, html_text
-
-
-def extract_jsonld_objects(html_text: str) -> list[dict[str, Any]]:
-    blocks = re.findall(
-        r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+
+
+def fetch_html(
+    url: str,
+    timeout: int = 20,
+    max_bytes: int = 2_000_000,
+    cache: SnapshotCache | None = None,
+    parser: SnapshotParserBackend | None = None,
+    min_body_chars: int = DEFAULT_STREAM_MIN_BODY_CHARS,
+    recorder: CorpusRecorder | None = None,
+    replay_url: str = "",
+    timer: StageTimer | None = None,
+) -> FetchedPage:
+    cached = cache.lookup(url) if cache else None
+    if cache and cached and (cache.offline or cache.is_fresh(cached)):
+        if recorder is not None:
+            recorder.record_snapshot(cached)
+        return page_from_cached_snapshot(cached, "hit")
+    if cache and cache.offline:
+        raise SnapshotCacheMiss(f"offline mode has no cached snapshot for {url}")
+
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-AU,en;q=0.9",
+        "Accept-Encoding": ACCEPT_ENCODING,
+    }
+    if cache and cached:
+        headers.update(cache.conditional_headers(cached))
+
+    def source_url(request_url: str) -> str:
+        return source_url_from_replay(request_url, replay_url) if replay_url else request_url
+
+    def record_redirect(hop_url: str, status: int, hop_headers: dict[str, str]) -> None:
+        if recorder is not None:
+            recorder.record_response(source_url(hop_url), status, hop_headers, b"")
+
+    def record_phase(phase: str, started: float, seconds: float) -> None:
+        timer.add(f"fetch.{phase}", started, seconds)
+
+    try:
+        with shared_pool().request(
+            "GET",
+            replay_request_url(url, replay_url) if replay_url else url,
+            headers=headers,
+            timeout=timeout,
+            on_redirect=record_redirect if recorder is not None else None,
+            on_phase=record_phase if timer is not None else None,
+        ) as response:
+            status = response.status
+            final_url = source_url(response.geturl())
+            response_headers = dict(response.headers.items())
+            content_type = response.headers.get("content-type", "")
+            charset = response.headers.get_content_charset() or "utf-8"
+            content_encoding = response.headers.get("content-encoding", "")
+            text_decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+
+            def on_chunk(chunk: bytes) -> bool:
+                parser.feed(text_decoder.decode(chunk))
+                return parser.has_extraction_evidence(min_body_chars)
+
+            with timer.stage("fetch.download") if timer is not None else nullcontext():
+                raw, wire_bytes, stopped_early = read_decoded_body(
+                    response, content_encoding, max_bytes, on_chunk if parser is not None else None
+                )
+                if parser is not None:
+                    parser.feed(text_decoder.decode(b"", final=True))
+    except HTTPError as exc:
+        exc.url = source_url(exc.url)
+        if exc.code == 304 and cache and cached:
+            refreshed = cache.refresh(cached, dict(exc.headers.items()))
+            if recorder is not None:
+                # The live redirect hops were recorded on the way to the 304.
+                recorder.record_snapshot(refreshed, record_redirect=False)
+            return page_from_cached_snapshot(refreshed, "revalidated")
+        if recorder is not None:
+            recorder.record_response(exc.url, exc.code, dict(exc.headers.items()), exc.read())
+        raise
+    except URLError as exc:
+        if recorder is not None:
+            recorder.record_failure(url, str(exc.reason))
+        raise
+
+    if recorder is not None:
+        recorder.record_response(final_url, status, response_headers, raw, truncated=stopped_early)
+
+    cache_status = ""
+    if cache and not stopped_early:
+        cache.store(
+            url,
+            final_url=final_url,
+            status=status,
+            headers=response_headers,
+            content_type=content_type,
+            charset=charset,
+            body=raw,
+        )
+        cache_status = "miss"
+    html_text = raw.decode(charset, errors="replace")
+    return FetchedPage(
+        status,
+        final_url,
+        content_type,
+        charset,
         html_text,
-        flags=re.I | re.S,
+        cache_status,
+        content_encoding=content_encoding,
+        wire_bytes=wire_bytes,
+        decoded_bytes=len(raw),
+        parser=parser,
+        stopped_early=stopped_early,
     )
+
+
+def parse_jsonld_blocks(blocks: Iterable[str]) -> list[dict[str, Any]]:
     objects: list[dict[str, Any]] = []
     for block in blocks:
         payload = block.strip()
@@ -375,9 +1035,13 @@ def extract_jsonld_objects(html_text: str) -> list[dict[str, Any]]:
     return objects
 
 
-def parse_snapshot(html_text: str) -> dict[str, Any]:
-    parser = SnapshotParser()
+def parse_snapshot(html_text: str, backend: str = DEFAULT_PARSER_BACKEND) -> dict[str, Any]:
+    parser = create_snapshot_parser(backend)
     parser.feed(html_text)
+    return snapshot_from_parser(parser)
+
+
+def snapshot_from_parser(parser: SnapshotParserBackend) -> dict[str, Any]:
     parser.close()
     title = collapse_spaces(" ".join(parser.title_parts))
     headings = {
@@ -395,7 +1059,7 @@ def parse_snapshot(html_text: str) -> dict[str, Any]:
         "canonical_url": parser.canonical_url,
         "links": links,
         "body_text": body_text,
-        "jsonld": extract_jsonld_objects(html_text),
+        "jsonld": parse_jsonld_blocks(parser.jsonld_blocks),
     }
 
 
@@ -467,6 +1131,29 @@ def extract_address_from_snapshot(snapshot: dict[str, Any]) -> tuple[str, list[s
     return "", evidence
 
 
+def extract_geo_from_snapshot(snapshot: dict[str, Any]) -> tuple[tuple[float, float] | None, list[str]]:
+    for obj in snapshot["jsonld"]:
+        if not isinstance(obj, dict) or not isinstance(obj.get("geo"), dict):
+            continue
+        latitude = parse_coordinate(obj["geo"].get("latitude"), 90)
+        longitude = parse_coordinate(obj["geo"].get("longitude"), 180)
+        if latitude is not None and longitude is not None:
+            return (latitude, longitude), [f"jsonld:{obj.get('name', obj.get('@type', 'object'))}:geo"]
+
+    meta = snapshot["meta"]
+    pairs = [
+        ("meta:place:location", meta.get("place:location:latitude", ""), meta.get("place:location:longitude", "")),
+        ("meta:geo.position", *(re.split(r"[;,]", meta.get("geo.position", ""), maxsplit=1) + [""])[:2]),
+        ("meta:icbm", *(re.split(r"[;,]", meta.get("icbm", ""), maxsplit=1) + [""])[:2]),
+    ]
+    for evidence, raw_latitude, raw_longitude in pairs:
+        latitude = parse_coordinate(raw_latitude, 90)
+        longitude = parse_coordinate(raw_longitude, 180)
+        if latitude is not None and longitude is not None:
+            return (latitude, longitude), [evidence]
+    return None, []
+
+
 def extract_name_candidates(snapshot: dict[str, Any]) -> list[tuple[str, str]]:
     candidates: list[tuple[str, str]] = []
     for obj in snapshot["jsonld"]:
@@ -541,168 +1228,678 @@ def pick_business_name(snapshot: dict[str, Any], hint: str) -> tuple[str, list[s
     return chosen, evidence
 
 
-def infer_resource_type(text: str) -> tuple[str, list[str]]:
-    lowered = text.lower()
-    evidence: list[str] = []
-    if re.search(r"\bbehavio[u]?r(?:al)?\s+(?:consultant|consultation|consultancy|assessment)\b", lowered):
-        evidence.append("behaviour consultant keyword")
-        return "behaviour_consultant", evidence
-    if re.search(r"\bbehavio[u]?r(?:al)?\s+training\b", lowered):
-        evidence.append("behaviour training keyword")
-        return "behaviour_consultant", evidence
-    evidence.append("default trainer")
-    return "trainer", evidence
+@dataclass(frozen=True)
+class TaxonomyRule:
+    field: str
+    value: str
+    evidence: str
+    patterns: tuple[str, ...]
+    fallback: bool = False
+
+
+# Rule order is output order: within a field the first rule to claim a value supplies its
+# evidence, fallback rules only apply when no primary rule hit, and resource_type keeps the
+# first hit. A rule matches when any of its patterns is found; a fallback with no patterns
+# always applies.
+TAXONOMY_RULES: tuple[TaxonomyRule, ...] = (
+    TaxonomyRule(
+        "resource_type",
+        "behaviour_consultant",
+        "behaviour consultant keyword",
+        (r"\bbehavio[u]?r(?:al)?\s+(?:consultant|consultation|consultancy|assessment)\b",),
+    ),
+    TaxonomyRule(
+        "resource_type",
+        "behaviour_consultant",
+        "behaviour training keyword",
+        (r"\bbehavio[u]?r(?:al)?\s+training\b",),
+    ),
+    TaxonomyRule("resource_type", "trainer", "default trainer", (), fallback=True),
+    TaxonomyRule("service_types", "puppy_training", "puppy keyword", (r"puppy",)),
+    TaxonomyRule(
+        "service_types",
+        "private_training",
+        "private training keyword",
+        (
+            r"\bprivate\b",
+            r"\bone[- ]on[- ]one\b",
+            r"\b1:1\b",
+            r"\bin[- ]home\b",
+            r"\bhome visit\b",
+            r"\bpersonalis(?:e|z)ed\b",
+        ),
+    ),
+    TaxonomyRule(
+        "service_types",
+        "group_classes",
+        "group/class keyword",
+        (
+            r"\bgroup\b",
+            r"\bclass\b",
+            r"\bclasses\b",
+            r"\bschool\b",
+            r"\bacademy\b",
+            r"\bworkshop\b",
+            r"\bfacility[- ]based\b",
+        ),
+    ),
+    TaxonomyRule(
+        "service_types",
+        "obedience_training",
+        "obedience/training keyword",
+        (
+            r"\bobedience\b",
+            r"\bmanners\b",
+            r"\bfoundation skills\b",
+            r"\bfoundation\b",
+            r"\bbasic training\b",
+            r"\btraining\b",
+        ),
+    ),
+    TaxonomyRule(
+        "service_types",
+        "behaviour_consultations",
+        "behaviour keyword",
+        (
+            r"\bbehavio[u]?r(?:al)?\b",
+            r"\bconsultation\b",
+            r"\bconsultancy\b",
+            r"\bassessment\b",
+            r"\bbehaivour\b",
+        ),
+    ),
+    TaxonomyRule("service_types", "obedience_training", "generic training fallback", (r"\btraining\b",), fallback=True),
+    TaxonomyRule(
+        "age_specialties",
+        "puppies_0_6m",
+        "puppy keyword",
+        (
+            r"\bpuppy\b",
+            r"\bpreschool\b",
+            r"\bpre-school\b",
+        ),
+    ),
+    TaxonomyRule(
+        "age_specialties",
+        "adolescent_6_18m",
+        "adolescent keyword",
+        (
+            r"\badolescent\b",
+            r"\bteen\b",
+            r"\byoung dog\b",
+            r"\bjuvenile\b",
+        ),
+    ),
+    TaxonomyRule(
+        "age_specialties",
+        "senior_7y_plus",
+        "senior keyword",
+        (
+            r"\bsenior\b",
+            r"\bold dog\b",
+            r"\bgeriatric\b",
+        ),
+    ),
+    TaxonomyRule(
+        "age_specialties",
+        "rescue_dogs",
+        "rescue keyword",
+        (
+            r"\brescue\b",
+            r"\brehomed\b",
+            r"\badopted\b",
+            r"\bshelter\b",
+        ),
+    ),
+    TaxonomyRule(
+        "age_specialties",
+        "adult_18m_7y",
+        "adult/general keyword",
+        (
+            r"\badult\b",
+            r"\bgeneral\b",
+            r"\ball ages\b",
+            r"\bany age\b",
+        ),
+    ),
+    TaxonomyRule(
+        "age_specialties",
+        "adult_18m_7y",
+        "generic trainer fallback",
+        (
+            r"\btraining\b",
+            r"\bbehavio[u]?r\b",
+        ),
+        fallback=True,
+    ),
+    TaxonomyRule(
+        "behavior_issues",
+        "pulling_on_lead",
+        "lead/leash keyword",
+        (
+            r"\bpull(?:ing|s)? on (?:the )?(?:lead|leash)\b",
+            r"\bloose leash\b",
+        ),
+    ),
+    TaxonomyRule(
+        "behavior_issues",
+        "separation_anxiety",
+        "separation keyword",
+        (
+            r"\bseparation anxiety\b",
+            r"\bseparation\b",
+            r"\balone\b",
+        ),
+    ),
+    TaxonomyRule("behavior_issues", "excessive_barking", "barking keyword", (r"\bbark(?:ing)?\b",)),
+    TaxonomyRule("behavior_issues", "dog_aggression", "aggression keyword", (r"\baggress(?:ion|ive)?\b",)),
+    TaxonomyRule("behavior_issues", "leash_reactivity", "leash reactivity keyword", (r"\bleash reactiv",)),
+    TaxonomyRule("behavior_issues", "jumping_up", "jumping keyword", (r"\bjump(?:ing|s)? up\b", r"\bjumping\b")),
+    TaxonomyRule(
+        "behavior_issues",
+        "destructive_behaviour",
+        "destructive/chewing keyword",
+        (
+            r"\bdestruct(?:ive|ion)\b",
+            r"\bchew(?:ing|s)?\b",
+        ),
+    ),
+    TaxonomyRule("behavior_issues", "recall_issues", "recall keyword", (r"\brecall\b", r"\bcome when called\b")),
+    TaxonomyRule(
+        "behavior_issues",
+        "anxiety_general",
+        "anxiety keyword",
+        (
+            r"\banxiety\b",
+            r"\bfearful\b",
+            r"\bnervous\b",
+        ),
+    ),
+    TaxonomyRule(
+        "behavior_issues",
+        "resource_guarding",
+        "resource guarding keyword",
+        (
+            r"\bresource guard(?:ing|)\b",
+            r"\bguard(?:ing)? food\b",
+        ),
+    ),
+    TaxonomyRule(
+        "behavior_issues",
+        "mouthing_nipping_biting",
+        "mouthing/nipping/biting keyword",
+        (
+            r"\bmouth(?:ing)?\b",
+            r"\bnip(?:ping|s)?\b",
+            r"\bbit(?:ing|es|e)?\b",
+        ),
+    ),
+    TaxonomyRule(
+        "behavior_issues",
+        "rescue_dog_support",
+        "rescue keyword",
+        (
+            r"\brescue\b",
+            r"\brehome\b",
+            r"\badopt\b",
+        ),
+    ),
+    TaxonomyRule(
+        "behavior_issues",
+        "socialisation",
+        "socialisation keyword",
+        (
+            r"\bsocialis(?:ation|ation)\b",
+            r"\bsocialization\b",
+        ),
+    ),
+)
+TAXONOMY_FIELDS = ("resource_type", "service_types", "age_specialties", "behavior_issues")
+SINGLE_VALUE_TAXONOMY_FIELDS = frozenset({"resource_type"})
+
+
+def compile_taxonomy_scanner(rules: Iterable[TaxonomyRule]) -> re.Pattern[str]:
+    # One pass over the lowered text. The leading lookahead only stops where some pattern
+    # matches (patterns starting at a word boundary share a single \b test), then one
+    # optional lookahead per rule records every rule that matches at that position.
+    bounded: list[str] = []
+    unbounded: list[str] = []
+    captures: list[str] = []
+    for index, rule in enumerate(rules):
+        for pattern in rule.patterns:
+            if pattern.startswith(r"\b"):
+                bounded.append(pattern[2:])
+            else:
+                unbounded.append(pattern)
+        captures.append(f"(?:(?=(?P<r{index}>{'|'.join(rule.patterns)}))|)")
+    gate = "|".join([rf"\b(?:{'|'.join(bounded)})", *unbounded])
+    return re.compile(f"(?=(?:{gate})){''.join(captures)}")
 
 
-def infer_service_types(text: str) -> tuple[list[str], list[str]]:
-    lowered = text.lower()
-    matches: list[str] = []
-    evidence: list[str] = []
+SCANNED_TAXONOMY_RULES = tuple(rule for rule in TAXONOMY_RULES if rule.patterns)
 
-    def add(service: str, label: str) -> None:
-        if service not in matches:
-            matches.append(service)
-            evidence.append(label)
 
-    if re.search(r"\bpuppy\s+(?:school|preschool|preschooling|class|classes|training)\b", lowered) or "puppy" in lowered:
-        add("puppy_training", "puppy keyword")
-    if re.search(r"\bprivate\b|\bone[- ]on[- ]one\b|\b1:1\b|\bin[- ]home\b|\bhome visit\b|\bpersonalis(?:e|z)ed\b", lowered):
-        add("private_training", "private training keyword")
-    if re.search(r"\bgroup\b|\bclass\b|\bclasses\b|\bschool\b|\bacademy\b|\bworkshop\b|\bfacility[- ]based\b", lowered):
-        add("group_classes", "group/class keyword")
-    if re.search(r"\bobedience\b|\bmanners\b|\bfoundation skills\b|\bfoundation\b|\bbasic training\b|\btraining\b", lowered):
-        add("obedience_training", "obedience/training keyword")
-    if re.search(r"\bbehavio[u]?r(?:al)?\b|\bconsultation\b|\bconsultancy\b|\bassessment\b|\bbehaivour\b", lowered):
-        add("behaviour_consultations", "behaviour keyword")
+@lru_cache(maxsize=1)
+def taxonomy_scanner() -> re.Pattern[str]:
+    return compile_taxonomy_scanner(SCANNED_TAXONOMY_RULES)
 
-    if not matches and re.search(r"\btraining\b", lowered):
-        add("obedience_training", "generic training fallback")
 
-    return matches, evidence
+def scan_taxonomy_rules(text: str) -> set[TaxonomyRule]:
+    hits: set[TaxonomyRule] = set()
+    for match in taxonomy_scanner().finditer(text.lower()):
+        for rule, value in zip(SCANNED_TAXONOMY_RULES, match.groups()):
+            if value is not None:
+                hits.add(rule)
+        if len(hits) == len(SCANNED_TAXONOMY_RULES):
+            break
+    return hits
 
 
-def infer_age_specialties(text: str) -> tuple[list[str], list[str]]:
-    lowered = text.lower()
-    matches: list[str] = []
-    evidence: list[str] = []
+def infer_taxonomy(text: str) -> dict[str, tuple[list[str], list[str]]]:
+    hits = scan_taxonomy_rules(text)
+    inferred: dict[str, tuple[list[str], list[str]]] = {}
+    for field_name in TAXONOMY_FIELDS:
+        matches: list[str] = []
+        evidence: list[str] = []
+        for fallback in (False, True):
+            if matches:
+                break
+            for rule in TAXONOMY_RULES:
+                if rule.field != field_name or rule.fallback != fallback:
+                    continue
+                if (rule.patterns and rule not in hits) or rule.value in matches:
+                    continue
+                matches.append(rule.value)
+                evidence.append(rule.evidence)
+                if field_name in SINGLE_VALUE_TAXONOMY_FIELDS:
+                    break
+        inferred[field_name] = (matches, evidence)
+    return inferred
+
 
-    def add(age: str, label: str) -> None:
-        if age not in matches:
-            matches.append(age)
-            evidence.append(label)
+def infer_resource_type(text: str) -> tuple[str, list[str]]:
+    matches, evidence = infer_taxonomy(text)["resource_type"]
+    return matches[0], evidence
 
-    if re.search(r"\bpuppy\b|\bpreschool\b|\bpre-school\b", lowered):
-        add("puppies_0_6m", "puppy keyword")
-    if re.search(r"\badolescent\b|\bteen\b|\byoung dog\b|\bjuvenile\b", lowered):
-        add("adolescent_6_18m", "adolescent keyword")
-    if re.search(r"\bsenior\b|\bold dog\b|\bgeriatric\b", lowered):
-        add("senior_7y_plus", "senior keyword")
-    if re.search(r"\brescue\b|\brehomed\b|\badopted\b|\bshelter\b", lowered):
-        add("rescue_dogs", "rescue keyword")
-    if re.search(r"\badult\b|\bgeneral\b|\ball ages\b|\bany age\b", lowered):
-        add("adult_18m_7y", "adult/general keyword")
 
-    if not matches and re.search(r"\btraining\b|\bbehavio[u]?r\b", lowered):
-        add("adult_18m_7y", "generic trainer fallback")
+def infer_service_types(text: str) -> tuple[list[str], list[str]]:
+    return infer_taxonomy(text)["service_types"]
+
 
-    return matches, evidence
+def infer_age_specialties(text: str) -> tuple[list[str], list[str]]:
+    return infer_taxonomy(text)["age_specialties"]
 
 
 def infer_behavior_issues(text: str) -> tuple[list[str], list[str]]:
-    lowered = text.lower()
-    matches: list[str] = []
-    evidence: list[str] = []
+    return infer_taxonomy(text)["behavior_issues"]
+
 
-    def add(issue: str, label: str) -> None:
-        if issue not in matches:
-            matches.append(issue)
-            evidence.append(label)
-
-    if re.search(r"\bpull(?:ing|s)? on (?:the )?(?:lead|leash)\b|\bloose leash\b", lowered):
-        add("pulling_on_lead", "lead/leash keyword")
-    if re.search(r"\bseparation anxiety\b|\bseparation\b|\balone\b", lowered):
-        add("separation_anxiety", "separation keyword")
-    if re.search(r"\bbark(?:ing)?\b", lowered):
-        add("excessive_barking", "barking keyword")
-    if re.search(r"\baggress(?:ion|ive)?\b", lowered):
-        add("dog_aggression", "aggression keyword")
-    if re.search(r"\bleash reactiv", lowered):
-        add("leash_reactivity", "leash reactivity keyword")
-    if re.search(r"\bjump(?:ing|s)? up\b|\bjumping\b", lowered):
-        add("jumping_up", "jumping keyword")
-    if re.search(r"\bdestruct(?:ive|ion)\b|\bchew(?:ing|s)?\b", lowered):
-        add("destructive_behaviour", "destructive/chewing keyword")
-    if re.search(r"\brecall\b|\bcome when called\b", lowered):
-        add("recall_issues", "recall keyword")
-    if re.search(r"\banxiety\b|\bfearful\b|\bnervous\b", lowered):
-        add("anxiety_general", "anxiety keyword")
-    if re.search(r"\bresource guard(?:ing|)\b|\bguard(?:ing)? food\b", lowered):
-        add("resource_guarding", "resource guarding keyword")
-    if re.search(r"\bmouth(?:ing)?\b|\bnip(?:ping|s)?\b|\bbit(?:ing|es|e)?\b", lowered):
-        add("mouthing_nipping_biting", "mouthing/nipping/biting keyword")
-    if re.search(r"\brescue\b|\brehome\b|\badopt\b", lowered):
-        add("rescue_dog_support", "rescue keyword")
-    if re.search(r"\bsocialis(?:ation|ation)\b|\bsocialization\b", lowered):
-        add("socialisation", "socialisation keyword")
-
-    return matches, evidence
+@lru_cache(maxsize=8)
+def council_matcher(council_names: tuple[str, ...]) -> PhraseMatcher:
+    return PhraseMatcher((name, name) for name in council_names)
 
 
 def find_council_mentions(text: str, councils: Iterable[str]) -> list[str]:
-    lowered = text.lower()
-    hits = []
-    for council in councils:
-        if council.lower() in lowered:
-            hits.append(council)
-    return hits
+    council_names = tuple(councils)
+    mentioned = set(council_matcher(council_names).find_all(text))
+    return [council for council in council_names if council in mentioned]
+
+
+@dataclass(frozen=True)
+class AddressLocality:
+    """Canon suburbs implied by a source page's address, geo coordinates and postcode."""
+
+    point: tuple[float, float] | None
+    point_source: str
+    geocoded: bool
+    postcode: str
+    named: tuple[SuburbRecord, ...]
+    nearest: tuple[tuple[float, SuburbRecord], ...]
+
+    @property
+    def has_signal(self) -> bool:
+        return bool(self.named or self.nearest or self.postcode)
+
+    def supports(self, record: SuburbRecord) -> bool:
+        suburb_key = norm(record.name)
+        return (
+            any(norm(named.name) == suburb_key for named in self.named)
+            or record.postcode == self.postcode
+            or any(norm(near.name) == suburb_key for _, near in self.nearest)
+        )
+
+    def describe(self) -> str:
+        if self.named:
+            return f"{self.named[0].name} ({self.named[0].postcode})"
+        if self.nearest:
+            distance, record = self.nearest[0]
+            return f"{record.name} ({record.postcode}, {distance:.1f} km from {self.point_source})"
+        return f"postcode {self.postcode}"
+
+
+def infer_address_locality(address: str, snapshot: dict[str, Any], canon: LocalityCanon) -> AddressLocality:
+    postcode_match = ADDRESS_POSTCODE_RE.search(address)
+    postcode = postcode_match.group(1) if postcode_match else ""
+    # The street part precedes the first comma; matching only the rest keeps "12 Carlton St" from naming Carlton.
+    locality_text = address.split(",", 1)[1] if "," in address else ""
+    named_keys = canon.suburb_matcher.matched(locality_text)
+    named = tuple(record for key in named_keys for record in canon.by_suburb.get(key, ()))
+    if postcode and canon.suburbs_with_postcode(postcode):
+        narrowed = tuple(record for record in named if record.postcode == postcode)
+        named = narrowed or named
+
+    point, geo_evidence = extract_geo_from_snapshot(snapshot)
+    point_source = geo_evidence[0] if geo_evidence else ""
+    if point is None and postcode in canon.postcode_centroids:
+        point, point_source = canon.postcode_centroids[postcode], f"postcode {postcode}"
+    nearest: tuple[tuple[float, SuburbRecord], ...] = ()
+    if point is not None:
+        nearest = tuple(
+            canon.centroid_index.nearest(*point, limit=ADDRESS_CANDIDATE_LIMIT, max_km=ADDRESS_CANDIDATE_MAX_KM)
+        )
+    if postcode and not canon.suburbs_with_postcode(postcode) and not nearest and not named:
+        postcode = ""
+    return AddressLocality(
+        point=point,
+        point_source=point_source,
+        geocoded=bool(geo_evidence),
+        postcode=postcode,
+        named=named,
+        nearest=nearest,
+    )
+
+
+def resolve_council_by_proximity(
+    matches: tuple[SuburbRecord, ...],
+    address_locality: AddressLocality,
+    canon: LocalityCanon,
+) -> SuburbRecord | None:
+    # Same-name suburbs share one centroid, so the council owning the nearest other suburb decides.
+    # Only page coordinates count: a postcode centroid carries no evidence about the council boundary.
+    if not address_locality.geocoded or address_locality.point is None:
+        return None
+    by_council = {record.council_name: record for record in matches}
+    suburb_key = norm(matches[0].name)
+    for _, record in canon.centroid_index.nearest(*address_locality.point, limit=len(canon.suburbs), max_km=ADDRESS_CANDIDATE_MAX_KM * 2):
+        if norm(record.name) != suburb_key and record.council_name in by_council:
+            return by_council[record.council_name]
+    return None
 
 
 def resolve_suburb(
     suburb_hint: str,
     snapshot: dict[str, Any],
-    suburb_lookup: dict[tuple[str, str], SuburbRecord],
-    councils: dict[str, CouncilRecord],
+    canon: LocalityCanon,
+    address_locality: AddressLocality | None = None,
 ) -> tuple[SuburbRecord | None, list[str]]:
-    hint_key = norm(suburb_hint)
-    matches = [record for (suburb_key, _), record in suburb_lookup.items() if suburb_key == hint_key]
+    matches = canon.suburbs_named(suburb_hint)
     if not matches:
         return None, [f"no canonical suburb match for hint '{suburb_hint}'"]
     if len(matches) == 1:
         return matches[0], []
 
     evidence_text = " ".join([snapshot["title"], snapshot["headings"]["h1"], snapshot["body_text"], snapshot["meta"].get("description", "")])
-    council_mentions = find_council_mentions(evidence_text, councils.keys())
+    council_mentions = find_council_mentions(evidence_text, canon.councils.keys())
     if council_mentions:
         for mention in council_mentions:
             filtered = [record for record in matches if record.council_name == mention]
             if len(filtered) == 1:
                 return filtered[0], [f"resolved ambiguous suburb using council evidence '{mention}'"]
+    if address_locality is not None:
+        nearest = resolve_council_by_proximity(matches, address_locality, canon)
+        if nearest is not None:
+            return nearest, [f"resolved ambiguous suburb using address proximity ({address_locality.point_source})"]
     return None, [f"ambiguous canonical suburb match for hint '{suburb_hint}'"]
 
 
+def address_locality_warnings(
+    suburb_hint: str,
+    matched_suburb: SuburbRecord | None,
+    address_locality: AddressLocality,
+) -> list[str]:
+    if matched_suburb is None or not address_locality.has_signal or address_locality.supports(matched_suburb):
+        return []
+    return [f"source address suggests {address_locality.describe()}, not suburb hint '{suburb_hint}'"]
+
+
 def join_text(*parts: str) -> str:
     return collapse_spaces(" ".join(part for part in parts if part))
 
 
-def extract_page_fields(url: str, business_name_hint: str, service_hint: str) -> dict[str, Any]:
-    status = None
-    final_url = url
-    content_type = ""
-    charset = "utf-8"
-    html_text = ""
-    error = ""
+@dataclass(frozen=True)
+class SourceFetch:
+    url: str
+    final_url: str
+    status: int | None
+    content_type: str
+    charset: str
+    # None once a streamed parse has packed the snapshot: only the packed form crosses to CPU workers.
+    html_text: str | None
+    cache_status: str
+    content_encoding: str
+    wire_bytes: int
+    decoded_bytes: int
+    stopped_early: bool
+    error: str
+    packed_snapshot: tuple[Any, ...] | None = None
+    content_sha256: str = ""
+    attempts: int = 1
+    failure_class: str = ""
+    spans: tuple[Span, ...] = ()
+
+    @property
+    def has_body(self) -> bool:
+        return bool(self.html_text) or self.packed_snapshot is not None
+
+
+def pack_snapshot(snapshot: dict[str, Any]) -> tuple[Any, ...]:
+    # Flat tuple of strings for the process boundary: no per-record dict keys to pickle
+    # and JSON-LD travels as one compact JSON string instead of nested containers.
+    links: list[str] = []
+    for link in snapshot["links"]:
+        links.extend((link["href"], link["text"]))
+    meta: list[str] = []
+    for key, value in snapshot["meta"].items():
+        meta.extend((key, value))
+    return (
+        snapshot["title"],
+        snapshot["headings"]["h1"],
+        snapshot["headings"]["h2"],
+        snapshot["headings"]["h3"],
+        tuple(meta),
+        snapshot["canonical_url"],
+        tuple(links),
+        snapshot["body_text"],
+        json.dumps(snapshot["jsonld"], separators=(",", ":")) if snapshot["jsonld"] else "",
+    )
+
+
+def unpack_snapshot(packed: tuple[Any, ...]) -> dict[str, Any]:
+    title, h1, h2, h3, meta, canonical_url, links, body_text, jsonld = packed
+    return {
+        "title": title,
+        "headings": {"h1": h1, "h2": h2, "h3": h3},
+        "meta": dict(zip(meta[::2], meta[1::2])),
+        "canonical_url": canonical_url,
+        "links": [{"href": href, "text": text} for href, text in zip(links[::2], links[1::2])],
+        "body_text": body_text,
+        "jsonld": json.loads(jsonld) if jsonld else [],
+    }
+
+
+@dataclass
+class FetchProgress:
+    """A page fetch between attempts: what the last attempt saw and how many have run."""
+
+    url: str
+    options: FetchOptions
+    final_url: str
+    status: int | None = None
+    page: FetchedPage | None = None
+    error: str = ""
+    failure_class: str = ""
+    attempts: int = 0
+    timer: StageTimer = field(default_factory=StageTimer)
+    deferred_at: float | None = None
+
+
+def fetch_attempt(progress: FetchProgress) -> float | None:
+    """Run the next attempt; the seconds to wait before another one, or None once the fetch is settled."""
+    options = progress.options
+    policy = options.retry_policy
+    breaker = options.circuit_breaker
+    deadline = options.deadline
+    host = normalize_domain(progress.url)
+    timeout = deadline.request_timeout(options.timeout) if deadline else options.timeout
+    if timeout is None:
+        if progress.attempts == 0:
+            progress.error = f"DeadlineExceeded: the run's {deadline.seconds:g}s fetch budget ran out before this page was fetched"
+            progress.failure_class = "deadline_exceeded"
+        return None
+    if breaker is not None and not breaker.allow(host):
+        if progress.attempts == 0:
+            progress.error = f"CircuitOpen: {host} failed {breaker.threshold} consecutive fetches; not fetched"
+            progress.failure_class = "circuit_open"
+        return None
+    progress.attempts += 1
+    retry_after: float | None = None
     try:
-        status, final_url, content_type, charset, html_text = fetch_html(url)
+        progress.page = fetch_html(
+            progress.url,
+            timeout,
+            min(options.max_bytes, options.stream_byte_budget) if options.stream_parse else options.max_bytes,
+            cache=options.cache,
+            parser=create_snapshot_parser(options.parser_backend) if options.stream_parse else None,
+            min_body_chars=options.stream_min_body_chars,
+            recorder=options.recorder,
+            replay_url=options.replay_url,
+            timer=progress.timer,
+        )
+        progress.error = progress.failure_class = ""
+        if breaker is not None:
+            breaker.record(host, failed=False)
+        return None
     except HTTPError as exc:
-        status = exc.code
-        final_url = getattr(exc, "url", url) or url
-        error = f"HTTPError {exc.code}: {exc.reason}"
+        progress.status = exc.code
+        progress.final_url = getattr(exc, "url", progress.url) or progress.url
+        progress.error = f"HTTPError {exc.code}: {exc.reason}"
+        retry_after = retry_after_seconds(exc.headers)
+        progress.failure_class = classify_fetch_error(exc)
     except URLError as exc:
-        error = f"URLError: {exc.reason}"
+        progress.status, progress.final_url = None, progress.url
+        progress.error = f"URLError: {exc.reason}"
+        progress.failure_class = classify_fetch_error(exc)
     except Exception as exc:
-        error = f"{type(exc).__name__}: {exc}"
+        progress.status, progress.final_url = None, progress.url
+        progress.error = f"{type(exc).__name__}: {exc}"
+        progress.failure_class = classify_fetch_error(exc)
+    if deadline is not None and progress.failure_class == "timeout" and deadline.expired:
+        # Cut short by the shrunk timeout, not evidence that the host is down.
+        progress.error = f"DeadlineExceeded: the run's {deadline.seconds:g}s fetch budget ran out while fetching ({progress.error})"
+        progress.failure_class = "deadline_exceeded"
+        if breaker is not None:
+            # No verdict on the host either way, but a half-open probe must not stay claimed.
+            breaker.release_probe(host)
+        return None
+    if breaker is not None:
+        breaker.record(host, failed=progress.failure_class in HOST_FAILURES)
+    if progress.failure_class not in RETRYABLE_FAILURES or progress.attempts >= policy.max_attempts:
+        return None
+    delay = policy.delay(progress.attempts, retry_after)
+    # A retry that cannot start before the deadline would only hold a fetch slot.
+    if delay is None or (deadline is not None and delay >= deadline.remaining()):
+        return None
+    return delay
+
+
+def fetch_source_page(url: str, fetch_options: FetchOptions | None = None) -> SourceFetch:
+    task = current_scheduled_fetch()
+    progress = task.retry_state.pop(url, None) if task is not None else None
+    if progress is None:
+        progress = FetchProgress(url, fetch_options or FetchOptions(), final_url=url)
+    elif progress.deferred_at is not None:
+        progress.timer.add("fetch.backoff", progress.deferred_at, time.perf_counter() - progress.deferred_at)
+    while True:
+        delay = fetch_attempt(progress)
+        if delay is None:
+            break
+        if task is not None:
+            # On a scheduler worker the backoff is not slept: the task goes back to the scheduler
+            # behind every unfetched row, and this fetch resumes from `progress` when it is rerun.
+            # Scheduled functions fetch before doing anything else, so rerunning them repeats nothing.
+            progress.deferred_at = time.perf_counter()
+            task.retry_state[url] = progress
+            raise RetryLater(delay)
+        with progress.timer.stage("fetch.backoff"):
+            time.sleep(delay)
+    progress.timer.lap("fetch")
+    page = progress.page or FetchedPage(progress.status, progress.final_url, "", "utf-8", "")
+    html_text = page.html_text
+    packed_snapshot = pack_snapshot(snapshot_from_parser(page.parser)) if page.parser and html_text else None
+
+    return SourceFetch(
+        url=url,
+        final_url=page.final_url,
+        status=page.status,
+        content_type=page.content_type,
+        charset=page.charset,
+        html_text=None if packed_snapshot is not None else html_text,
+        cache_status=page.cache_status,
+        content_encoding=page.content_encoding,
+        wire_bytes=page.wire_bytes,
+        decoded_bytes=page.decoded_bytes,
+        stopped_early=page.stopped_early,
+        error=progress.error,
+        packed_snapshot=packed_snapshot,
+        content_sha256=hashlib.sha256(html_text.encode("utf-8")).hexdigest() if html_text else "",
+        attempts=progress.attempts,
+        failure_class=progress.failure_class,
+        spans=tuple(progress.timer.spans),
+    )
+
+
+def fetch_record(fetched: SourceFetch, domain: str, extraction_reused: bool = False) -> dict[str, Any]:
+    return {
+        "source_url": fetched.url,
+        "final_url": fetched.final_url,
+        "http_status": fetched.status,
+        "content_type": fetched.content_type,
+        "charset": fetched.charset,
+        "error": fetched.error,
+        "domain": domain,
+        "cache_status": fetched.cache_status,
+        "content_encoding": fetched.content_encoding,
+        "wire_bytes": fetched.wire_bytes,
+        "decoded_bytes": fetched.decoded_bytes,
+        "stopped_early": fetched.stopped_early,
+        "content_sha256": fetched.content_sha256,
+        "extraction_reused": extraction_reused,
+        "attempts": fetched.attempts,
+        "retries": max(fetched.attempts - 1, 0),
+        "failure_class": fetched.failure_class,
+    }
 
-    snapshot: dict[str, Any] = {
+
+def reuse_previous_extraction(fetched: SourceFetch, previous: dict[str, Any] | None) -> dict[str, Any] | None:
+    # The same body from the same final URL extracts to the same fields, so only the fetch block is refreshed.
+    if previous is None or fetched.error or not fetched.content_sha256:
+        return None
+    previous_fetch = previous.get("fetch", {})
+    if previous_fetch.get("content_sha256") != fetched.content_sha256 or previous_fetch.get("final_url") != fetched.final_url:
+        return None
+    return {
+        **previous,
+        "fetch": fetch_record(fetched, previous_fetch.get("domain", ""), extraction_reused=True),
+        "timings": StageTimer(fetched.spans).export(),
+    }
+
+
+def fetched_snapshot(fetched: SourceFetch, parser_backend: str = DEFAULT_PARSER_BACKEND) -> dict[str, Any]:
+    if fetched.packed_snapshot is not None:
+        return unpack_snapshot(fetched.packed_snapshot)
+    if fetched.html_text:
+        return parse_snapshot(fetched.html_text, parser_backend)
+    return {
         "title": "",
         "headings": {"h1": "", "h2": "", "h3": ""},
         "meta": {},
@@ -711,10 +1908,10 @@ def extract_page_fields(url: str, business_name_hint: str, service_hint: str) ->
         "body_text": "",
         "jsonld": [],
     }
-    if html_text:
-        snapshot = parse_snapshot(html_text)
 
-    text_blob = join_text(
+
+def snapshot_text_blob(snapshot: dict[str, Any]) -> str:
+    return join_text(
         snapshot["title"],
         snapshot["headings"]["h1"],
         snapshot["headings"]["h2"],
@@ -723,18 +1920,43 @@ def extract_page_fields(url: str, business_name_hint: str, service_hint: str) ->
         snapshot["meta"].get("og:description", ""),
         snapshot["body_text"],
     )
+
+
+def extract_snapshot_contacts(snapshot: dict[str, Any], text_blob: str) -> tuple[str, str, str, list[str]]:
+    """Return (email, phone, address, address_evidence); tel:/mailto: links win over text matches."""
     linked_emails, linked_phones = extract_contact_from_links(snapshot["links"])
     regex_emails, regex_phones = extract_regex_contacts(text_blob)
-
-    contact_email = linked_emails[0] if linked_emails else (regex_emails[0] if regex_emails else "")
-    contact_phone = linked_phones[0] if linked_phones else (regex_phones[0] if regex_phones else "")
+    email = linked_emails[0] if linked_emails else (regex_emails[0] if regex_emails else "")
+    phone = linked_phones[0] if linked_phones else (regex_phones[0] if regex_phones else "")
     address, address_evidence = extract_address_from_snapshot(snapshot)
+    return email, phone, address, address_evidence
+
+
+def extract_fetched_fields(
+    fetched: SourceFetch,
+    business_name_hint: str,
+    service_hint: str,
+    parser_backend: str = DEFAULT_PARSER_BACKEND,
+) -> dict[str, Any]:
+    url = fetched.url
+    final_url = fetched.final_url
+    error = fetched.error
+    timer = StageTimer(fetched.spans)
+    extract_started = time.perf_counter()
+    snapshot = fetched_snapshot(fetched, parser_backend)
+    timer.lap("extract.parse")
+    text_blob = snapshot_text_blob(snapshot)
+    contact_email, contact_phone, address, address_evidence = extract_snapshot_contacts(snapshot, text_blob)
     business_name, name_evidence = pick_business_name(snapshot, business_name_hint)
+    timer.lap("extract.fields")
     hint_text = join_text(business_name_hint, service_hint, text_blob)
-    resource_type, resource_evidence = infer_resource_type(hint_text)
-    services, service_evidence = infer_service_types(hint_text)
-    ages, age_evidence = infer_age_specialties(hint_text)
-    behavior_issues, issue_evidence = infer_behavior_issues(hint_text)
+    taxonomy = infer_taxonomy(hint_text)
+    timer.lap("extract.taxonomy")
+    resource_types, resource_evidence = taxonomy["resource_type"]
+    resource_type = resource_types[0]
+    services, service_evidence = taxonomy["service_types"]
+    ages, age_evidence = taxonomy["age_specialties"]
+    behavior_issues, issue_evidence = taxonomy["behavior_issues"]
 
     website = snapshot["canonical_url"] or final_url or url
     domain = normalize_domain(website)
@@ -743,7 +1965,7 @@ def extract_page_fields(url: str, business_name_hint: str, service_hint: str) ->
 
     if error:
         blocked_issues.append(error)
-    if not html_text:
+    if not fetched.has_body:
         blocked_issues.append("no page body could be fetched")
     if not services:
         blocked_issues.append("no supported service taxonomy could be inferred")
@@ -752,7 +1974,7 @@ def extract_page_fields(url: str, business_name_hint: str, service_hint: str) ->
     if not business_name:
         advisory_warnings.append("business name fallback is empty")
     if not contact_phone and not contact_email and not address:
-        advisory_warnings.append("no direct contact fields extracted from source")
+        advisory_warnings.append(NO_CONTACT_FIELDS_WARNING)
     review_text = join_text(
         snapshot["title"],
         snapshot["headings"]["h1"],
@@ -767,17 +1989,10 @@ def extract_page_fields(url: str, business_name_hint: str, service_hint: str) ->
         advisory_warnings.append("source looks like a veterinary business; confirm training listing scope")
     if "trainer" not in text_blob.lower() and "training" not in text_blob.lower() and "behavio" not in text_blob.lower():
         advisory_warnings.append("trainer/service signal is weak in source copy")
+    timer.add("extract", extract_started, time.perf_counter() - extract_started)
 
     return {
-        "fetch": {
-            "source_url": url,
-            "final_url": final_url,
-            "http_status": status,
-            "content_type": content_type,
-            "charset": charset,
-            "error": error,
-            "domain": domain,
-        },
+        "fetch": fetch_record(fetched, domain),
         "snapshot": snapshot,
         "text_blob": text_blob,
         "contacts": {
@@ -803,9 +2018,573 @@ def extract_page_fields(url: str, business_name_hint: str, service_hint: str) ->
         },
         "blocked_issues": blocked_issues,
         "advisory_warnings": advisory_warnings,
+        "timings": timer.export(),
+    }
+
+
+def extract_page_fields(
+    url: str,
+    business_name_hint: str,
+    service_hint: str,
+    fetch_options: FetchOptions | None = None,
+) -> dict[str, Any]:
+    options = fetch_options or FetchOptions()
+    return extract_fetched_fields(
+        fetch_source_page(url, options),
+        business_name_hint,
+        service_hint,
+        options.parser_backend,
+    )
+
+
+def extract_queue_row(row: dict[str, str], fetch_options: FetchOptions | None = None) -> dict[str, Any]:
+    return extract_page_fields(
+        row["source_url"].strip(),
+        row["business_name_hint"].strip(),
+        row.get("service_hint", "").strip(),
+        fetch_options=fetch_options,
+    )
+
+
+def fetch_queue_row(row: dict[str, str], fetch_options: FetchOptions | None = None) -> SourceFetch:
+    return fetch_source_page(row["source_url"].strip(), fetch_options)
+
+
+def extract_or_reuse_row(
+    row: dict[str, str],
+    fetch_options: FetchOptions | None,
+    previous: dict[str, Any],
+) -> dict[str, Any]:
+    fetched = fetch_queue_row(row, fetch_options)
+    reused = reuse_previous_extraction(fetched, previous)
+    if reused is not None:
+        return reused
+    return extract_fetched_fields(
+        fetched,
+        row["business_name_hint"].strip(),
+        row.get("service_hint", "").strip(),
+        (fetch_options or FetchOptions()).parser_backend,
+    )
+
+
+def contact_page_urls(snapshot: dict[str, Any], page_url: str, limit: int) -> list[str]:
+    """Same-site links that look like contact or about pages, contact pages first, at most `limit`."""
+    if limit < 1 or not page_url:
+        return []
+    site = normalize_domain(page_url)
+    seen = {urldefrag(page_url)[0].rstrip("/")}
+    ranked: list[tuple[int, str]] = []
+    for link in snapshot["links"]:
+        url = urldefrag(urljoin(page_url, link["href"].strip()))[0]
+        parsed = urlparse(url)
+        if parsed.scheme not in {"http", "https"} or normalize_domain(url) != site or url.rstrip("/") in seen:
+            continue
+        label = f"{parsed.path} {link['text']}"
+        rank = next((rank for rank, pattern in enumerate(CONTACT_PAGE_PATTERNS) if pattern.search(label)), None)
+        if rank is None:
+            continue
+        seen.add(url.rstrip("/"))
+        ranked.append((rank, url))
+    ranked.sort(key=lambda entry: entry[0])
+    return [url for _, url in ranked[:limit]]
+
+
+def merge_contact_pages(
+    source_data: dict[str, Any],
+    pages: list[SourceFetch],
+    parser_backend: str = DEFAULT_PARSER_BACKEND,
+) -> dict[str, Any]:
+    """Fill contact fields the landing page lacked from crawled pages, recording which page supplied each."""
+    contacts = dict(source_data["contacts"])
+    landing_url = source_data["fetch"]["final_url"]
+    # A reused extraction already carries the sources of fields an earlier crawl filled.
+    known = source_data["evidence"].get("contact_sources", {})
+    sources = {field_name: known.get(field_name) or (landing_url if contacts[field_name] else "") for field_name in CONTACT_FIELDS}
+    crawled: list[dict[str, Any]] = []
+    timer = StageTimer.from_export(source_data.get("timings"))
+    for fetched in pages:
+        timer.extend(fetched.spans, prefix=CONTACT_CRAWL_PREFIX)
+        crawled.append(
+            {
+                "url": fetched.url,
+                "final_url": fetched.final_url,
+                "http_status": fetched.status,
+                "error": fetched.error,
+                "cache_status": fetched.cache_status,
+                "wire_bytes": fetched.wire_bytes,
+            }
+        )
+        if fetched.error or not fetched.has_body:
+            continue
+        with timer.stage(f"{CONTACT_CRAWL_PREFIX}extract"):
+            snapshot = fetched_snapshot(fetched, parser_backend)
+            email, phone, address, address_evidence = extract_snapshot_contacts(snapshot, snapshot_text_blob(snapshot))
+        for field_name, value in (("phone", phone), ("email", email), ("address", address)):
+            if value and not contacts[field_name]:
+                contacts[field_name] = value
+                sources[field_name] = fetched.final_url
+                if field_name == "address":
+                    contacts["address_evidence"] = [f"crawl:{item}" for item in address_evidence]
+    advisory_warnings = list(source_data["advisory_warnings"])
+    if any(contacts[field_name] for field_name in CONTACT_FIELDS) and NO_CONTACT_FIELDS_WARNING in advisory_warnings:
+        advisory_warnings.remove(NO_CONTACT_FIELDS_WARNING)
+    return {
+        **source_data,
+        "fetch": {**source_data["fetch"], "crawled_pages": crawled},
+        "contacts": contacts,
+        "evidence": {**source_data["evidence"], "contact_sources": sources},
+        "advisory_warnings": advisory_warnings,
+        "timings": timer.export(),
     }
 
 
+def submit_contact_crawl(
+    extracted: Future[dict[str, Any]],
+    scheduler: HostFetchScheduler,
+    fetch_options: FetchOptions,
+) -> Future[dict[str, Any]]:
+    # Contact pages go through the same per-host scheduler as landing pages, so the crawl stays
+    # inside the site's politeness budget; pages of one site are fetched concurrently up to it.
+    crawled: Future[dict[str, Any]] = Future()
+
+    def on_extracted(done: Future[dict[str, Any]]) -> None:
+        try:
+            source_data = done.result()
+            contacts = source_data["contacts"]
+            fetch = source_data["fetch"]
+            urls = (
+                []
+                if all(contacts[field_name] for field_name in CONTACT_FIELDS)
+                or fetch["error"]
+                or (fetch_options.deadline is not None and fetch_options.deadline.expired)
+                else contact_page_urls(source_data["snapshot"], fetch["final_url"], fetch_options.contact_crawl_pages)
+            )
+            if not urls:
+                crawled.set_result(merge_contact_pages(source_data, [], fetch_options.parser_backend))
+                return
+            page_futures = [
+                scheduler.submit(normalize_domain(url), fetch_source_page, url, fetch_options, priority=FOLLOW_UP_FETCH_PRIORITY)
+                for url in urls
+            ]
+        except BaseException as exc:
+            crawled.set_exception(exc)
+            return
+        remaining = [len(page_futures)]
+        lock = threading.Lock()
+
+        def on_page(_: Future[SourceFetch]) -> None:
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            try:
+                pages = [future.result() for future in page_futures]
+                crawled.set_result(merge_contact_pages(source_data, pages, fetch_options.parser_backend))
+            except BaseException as exc:
+                crawled.set_exception(exc)
+
+        for page_future in page_futures:
+            page_future.add_done_callback(on_page)
+
+    extracted.add_done_callback(on_extracted)
+    return crawled
+
+
+def extract_fetched_row_packed(
+    fetched: SourceFetch,
+    business_name_hint: str,
+    service_hint: str,
+    parser_backend: str,
+) -> dict[str, Any]:
+    # Runs in a CPU worker process; the snapshot goes back packed and the parent unpacks it.
+    source_data = extract_fetched_fields(fetched, business_name_hint, service_hint, parser_backend)
+    source_data["snapshot"] = pack_snapshot(source_data["snapshot"])
+    return source_data
+
+
+def submit_cpu_stage(
+    fetch_future: Future[SourceFetch],
+    row: dict[str, str],
+    cpu_pool: Executor,
+    parser_backend: str,
+    previous: dict[str, Any] | None = None,
+) -> Future[dict[str, Any]]:
+    extracted: Future[dict[str, Any]] = Future()
+
+    def on_extracted(done: Future[dict[str, Any]]) -> None:
+        try:
+            source_data = done.result()
+            source_data["snapshot"] = unpack_snapshot(source_data["snapshot"])
+            extracted.set_result(source_data)
+        except BaseException as exc:
+            extracted.set_exception(exc)
+
+    def on_fetched(done: Future[SourceFetch]) -> None:
+        try:
+            reused = reuse_previous_extraction(done.result(), previous)
+            if reused is not None:
+                extracted.set_result(reused)
+                return
+            cpu_future = cpu_pool.submit(
+                extract_fetched_row_packed,
+                done.result(),
+                row["business_name_hint"].strip(),
+                row.get("service_hint", "").strip(),
+                parser_backend,
+            )
+        except BaseException as exc:
+            extracted.set_exception(exc)
+            return
+        cpu_future.add_done_callback(on_extracted)
+
+    fetch_future.add_done_callback(on_fetched)
+    return extracted
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def delay_until_available(self, now: float) -> float:
+        if self.rate <= 0:
+            return 0.0
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1.0:
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        if self.rate > 0:
+            self.tokens -= 1.0
+
+
+@dataclass
+class HostFetchStats:
+    host: str
+    requests: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+@dataclass
+class ScheduledFetch:
+    host: str
+    submitted_at: float
+    future: Future[Any]
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    # Fetches waiting out a retry backoff, by URL; see fetch_source_page.
+    retry_state: dict[str, Any] = field(default_factory=dict)
+
+
+class RetryLater(Exception):
+    """Raised by a fetch on a scheduler worker to be rerun after `delay` seconds instead of sleeping."""
+
+    def __init__(self, delay: float) -> None:
+        super().__init__(delay)
+        self.delay = delay
+
+
+_scheduled_fetch = threading.local()
+
+
+def current_scheduled_fetch() -> ScheduledFetch | None:
+    return getattr(_scheduled_fetch, "task", None)
+
+
+class HostFetchScheduler:
+    def __init__(
+        self,
+        workers: int = DEFAULT_FETCH_WORKERS,
+        per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+        per_host_rps: float = DEFAULT_PER_HOST_RPS,
+    ) -> None:
+        self.workers = max(workers, 1)
+        self.per_host_concurrency = max(per_host_concurrency, 1)
+        self.per_host_rps = per_host_rps
+        self._condition = threading.Condition()
+        self._queues: dict[str, tuple[deque[ScheduledFetch], ...]] = {}
+        self._host_order: deque[str] = deque()
+        self._active: dict[str, int] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._stats: dict[str, HostFetchStats] = {}
+        self._closed = False
+        self._stopping = False
+        # (not-before, sequence, task) for retries waiting out their backoff off the worker threads.
+        self._deferred: list[tuple[float, int, ScheduledFetch]] = []
+        self._deferred_count = 0
+        self._threads: list[threading.Thread] = []
+
+    def __enter__(self) -> HostFetchScheduler:
+        for number in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"concierge-fetch-{number}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: Any) -> None:
+        abandoned: list[ScheduledFetch] = []
+        with self._condition:
+            self._closed = True
+            if exc_type is not None:
+                # The consumer is gone (an error, or a closed generator): drop queued fetches
+                # instead of draining the whole fetch-ahead window before re-raising.
+                self._stopping = True
+                for host in self._host_order:
+                    for queue in self._queues[host]:
+                        self._stats[host].queue_depth -= len(queue)
+                        abandoned.extend(queue)
+                        queue.clear()
+                self._host_order.clear()
+                abandoned.extend(task for _, _, task in self._deferred)
+                self._deferred.clear()
+            self._condition.notify_all()
+        # Outside the lock: cancelling runs done callbacks, which may submit follow-up fetches.
+        for task in abandoned:
+            self._abandon(task)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def submit(
+        self,
+        host: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: int = ROW_FETCH_PRIORITY,
+    ) -> Future[Any]:
+        future: Future[Any] = Future()
+        with self._condition:
+            if self._stopping:
+                future.cancel()
+                return future
+            if host not in self._queues:
+                self._queues[host] = (deque(), deque())
+                self._active.setdefault(host, 0)
+                self._buckets.setdefault(host, TokenBucket(self.per_host_rps, self.per_host_concurrency))
+                self._stats.setdefault(host, HostFetchStats(host=host))
+            if not any(self._queues[host]):
+                self._host_order.append(host)
+            self._queues[host][priority].append(ScheduledFetch(host, time.monotonic(), future, fn, args))
+            stats = self._stats[host]
+            stats.queue_depth += 1
+            stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+            self._condition.notify()
+        return future
+
+    @staticmethod
+    def _abandon(task: ScheduledFetch) -> None:
+        # A retry has already started running, so its future can no longer be cancelled.
+        if not task.future.cancel():
+            task.future.set_exception(CancelledError())
+
+    def _defer(self, task: ScheduledFetch, not_before: float) -> None:
+        self._deferred_count += 1
+        heapq.heappush(self._deferred, (not_before, self._deferred_count, task))
+
+    def _requeue_due(self, now: float) -> None:
+        # A retry whose backoff is over queues with the follow-up fetches, behind every unfetched row.
+        while self._deferred and self._deferred[0][0] <= now:
+            not_before, _, task = heapq.heappop(self._deferred)
+            queues = self._queues[task.host]
+            if not any(queues):
+                self._host_order.append(task.host)
+            task.submitted_at = not_before
+            queues[FOLLOW_UP_FETCH_PRIORITY].append(task)
+            stats = self._stats[task.host]
+            stats.queue_depth += 1
+            stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+
+    def _next_runnable(self, now: float) -> tuple[ScheduledFetch | None, float | None]:
+        self._requeue_due(now)
+        retry_in: float | None = self._deferred[0][0] - now if self._deferred else None
+        # Any host's row fetch goes before any host's follow-up fetch, so under a deadline the
+        # remaining budget is spent on rows that have not been fetched at all.
+        for priority in (ROW_FETCH_PRIORITY, FOLLOW_UP_FETCH_PRIORITY):
+            for _ in range(len(self._host_order)):
+                host = self._host_order[0]
+                self._host_order.rotate(-1)
+                queue = self._queues[host][priority]
+                if not queue or self._active[host] >= self.per_host_concurrency:
+                    continue
+                delay = self._buckets[host].delay_until_available(now)
+                if delay > 0:
+                    retry_in = delay if retry_in is None else min(retry_in, delay)
+                    continue
+                self._buckets[host].consume()
+                task = queue.popleft()
+                if not any(self._queues[host]):
+                    self._host_order.remove(host)
+                self._active[host] += 1
+                stats = self._stats[host]
+                waited = now - task.submitted_at
+                stats.requests += 1
+                stats.queue_depth -= 1
+                stats.total_wait_seconds += waited
+                stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+                return task, None
+        return None, retry_in
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    task, retry_in = self._next_runnable(time.monotonic())
+                    if task is not None:
+                        break
+                    if self._stopping or (self._closed and not self._host_order and not self._deferred):
+                        return
+                    self._condition.wait(timeout=retry_in)
+            retry_at: float | None = None
+            # A rerun retry's future is already running.
+            if task.future.running() or task.future.set_running_or_notify_cancel():
+                _scheduled_fetch.task = task
+                try:
+                    task.future.set_result(task.fn(*task.args))
+                except RetryLater as retry:
+                    retry_at = time.monotonic() + retry.delay
+                except BaseException as exc:
+                    task.future.set_exception(exc)
+                finally:
+                    _scheduled_fetch.task = None
+            with self._condition:
+                self._active[task.host] -= 1
+                if retry_at is not None and not self._stopping:
+                    self._defer(task, retry_at)
+                    retry_at = None
+                self._condition.notify_all()
+            if retry_at is not None:
+                self._abandon(task)
+
+    def summary(self) -> dict[str, Any]:
+        with self._condition:
+            hosts = sorted(self._stats.values(), key=lambda stats: (-stats.total_wait_seconds, stats.host))
+            return {
+                "workers": self.workers,
+                "per_host_concurrency": self.per_host_concurrency,
+                "per_host_rps": self.per_host_rps,
+                "host_count": len(hosts),
+                "hosts": [
+                    {
+                        "host": stats.host,
+                        "requests": stats.requests,
+                        "max_queue_depth": stats.max_queue_depth,
+                        "total_wait_seconds": round(stats.total_wait_seconds, 3),
+                        "max_wait_seconds": round(stats.max_wait_seconds, 3),
+                    }
+                    for stats in hosts
+                ],
+            }
+
+
+def extraction_settings(fetch_options: FetchOptions | None = None) -> list[Any]:
+    # Everything that changes what extraction returns for a row; cache settings only change how it was fetched.
+    options = fetch_options or FetchOptions()
+    return [
+        options.timeout,
+        options.max_bytes,
+        options.stream_parse,
+        options.stream_byte_budget,
+        options.stream_min_body_chars,
+        options.parser_backend,
+        options.contact_crawl_pages,
+    ]
+
+
+def checkpoint_run_key(input_csv_path: Path, fetch_options: FetchOptions | None = None) -> str:
+    return json.dumps({"input_csv": str(input_csv_path.resolve()), "extraction": extraction_settings(fetch_options)})
+
+
+def load_previous_extractions(path: Path, fetch_options: FetchOptions | None = None) -> dict[str, dict[str, Any]] | None:
+    """Completed rows of the previous run's extraction store, or None if it is missing or incompatible."""
+    try:
+        header, completed, _ = read_journal(path)
+    except CheckpointMismatch:
+        return None
+    if header is None:
+        return None
+    try:
+        settings = json.loads(header.get("run_key", ""))["extraction"]
+    except (ValueError, TypeError, KeyError):
+        return None
+    return completed if settings == extraction_settings(fetch_options) else None
+
+
+def journal_on_completion(
+    future: Future[dict[str, Any]],
+    checkpoint: CheckpointJournal,
+    row: dict[str, str],
+) -> Future[dict[str, Any]]:
+    # Consumers wait on the chained future, which resolves only after the row is journaled: a
+    # plain done callback can still be running when the last result is consumed and the journal closed.
+    journaled: Future[dict[str, Any]] = Future()
+
+    def on_done(done: Future[dict[str, Any]]) -> None:
+        try:
+            source_data = done.result()
+            # A row the deadline cut off was never fetched; leave it for a resumed run to fetch.
+            if source_data["fetch"].get("failure_class") != "deadline_exceeded":
+                # Timings describe this run only; a replayed or reused row must not report them again.
+                checkpoint.record(row, {key: value for key, value in source_data.items() if key != "timings"})
+            journaled.set_result(source_data)
+        except BaseException as exc:
+            journaled.set_exception(exc)
+
+    future.add_done_callback(on_done)
+    return journaled
+
+
+def iter_source_data(
+    input_rows: Iterable[dict[str, str]],
+    scheduler: HostFetchScheduler,
+    fetch_options: FetchOptions | None = None,
+    cpu_pool: Executor | None = None,
+    checkpoint: CheckpointJournal | None = None,
+    previous_extractions: dict[str, dict[str, Any]] | None = None,
+) -> Iterator[tuple[dict[str, str], dict[str, Any]]]:
+    # Fetch ahead on a bounded window of rows but always yield in input-row order so the
+    # sequential duplicate-detection pass sees exactly what a serial run would. Rows are
+    # pulled lazily, so a streaming queue reader is consumed only as far as the window.
+    window = scheduler.workers * FETCH_AHEAD_PER_WORKER
+    pending: deque[tuple[dict[str, str], Future[dict[str, Any]]]] = deque()
+    parser_backend = (fetch_options or FetchOptions()).parser_backend
+    with scheduler, cpu_pool or nullcontext(), checkpoint or nullcontext():
+        for row in input_rows:
+            replayed = checkpoint.lookup(row) if checkpoint else None
+            if replayed is not None:
+                future: Future[dict[str, Any]] = Future()
+                future.set_result(replayed)
+                pending.append((row, future))
+            else:
+                host = normalize_domain(row["source_url"].strip())
+                previous = previous_extractions.get(checkpoint_row_key(row)) if previous_extractions else None
+                if cpu_pool is not None:
+                    fetch_future = scheduler.submit(host, fetch_queue_row, row, fetch_options)
+                    future = submit_cpu_stage(fetch_future, row, cpu_pool, parser_backend, previous)
+                elif previous is not None:
+                    future = scheduler.submit(host, extract_or_reuse_row, row, fetch_options, previous)
+                else:
+                    future = scheduler.submit(host, extract_queue_row, row, fetch_options)
+                if fetch_options is not None and fetch_options.contact_crawl_pages > 0:
+                    future = submit_contact_crawl(future, scheduler, fetch_options)
+                if checkpoint is not None:
+                    # Journal rows as they complete, not when they reach the in-order yield.
+                    future = journal_on_completion(future, checkpoint, row)
+                pending.append((row, future))
+            if len(pending) >= window:
+                row, future = pending.popleft()
+                yield row, future.result()
+        while pending:
+            row, future = pending.popleft()
+            yield row, future.result()
+
+
 def format_list(values: list[str]) -> str:
     return "|".join(values)
 
@@ -864,10 +2643,9 @@ def load_existing_inventory_snapshot(page_size: int = 500) -> tuple[list[Existin
             "result_offset": offset,
             "p_key": decrypt_key,
         }
-        request = Request(endpoint, data=json.dumps(payload).encode("utf-8"), headers=headers, method="POST")
-        context = ssl.create_default_context()
+        body = json.dumps(payload).encode("utf-8")
         try:
-            with urlopen(request, timeout=20, context=context) as response:
+            with shared_pool().request("POST", endpoint, headers=headers, body=body, timeout=20) as response:
                 page_rows = json.loads(response.read().decode("utf-8"))
         except HTTPError as exc:
             metadata["status"] = "error"
@@ -1038,7 +2816,7 @@ def build_mapping_candidate(record: dict[str, Any]) -> dict[str, Any]:
         mapping_warnings.append("no direct contact field extracted; source URL remains the fallback contact path")
 
     for warning in record["publish_readiness_warnings"]:
-        if record["publish_status"] == "blocked":
+        if record["publish_status"] in {"blocked", "deadline_exceeded"}:
             if warning not in mapping_blockers:
                 mapping_blockers.append(warning)
         elif warning not in mapping_warnings:
@@ -1065,13 +2843,22 @@ def build_mapping_candidate(record: dict[str, Any]) -> dict[str, Any]:
 
 
 def build_review_artifact(
-    input_rows: list[dict[str, str]],
-    councils: dict[str, CouncilRecord],
-    suburb_lookup: dict[tuple[str, str], SuburbRecord],
+    input_rows: Iterable[dict[str, str]],
+    canon: LocalityCanon,
     input_csv_path: Path,
     existing_inventory: list[ExistingInventoryRecord],
     inventory_check: dict[str, Any],
+    workers: int = DEFAULT_FETCH_WORKERS,
+    per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+    per_host_rps: float = DEFAULT_PER_HOST_RPS,
+    fetch_options: FetchOptions | None = None,
+    cpu_workers: int = DEFAULT_CPU_WORKERS,
+    checkpoint: CheckpointJournal | None = None,
+    previous_extractions: dict[str, dict[str, Any]] | None = None,
+    profiler: RunProfiler | None = None,
+    scheduler: HostFetchScheduler | None = None,
 ) -> dict[str, Any]:
+    run_timer = profiler.run_timer if profiler else StageTimer()
     results: list[dict[str, Any]] = []
     seen_domains_by_locality: dict[tuple[str, str], int] = {}
     seen_names_by_locality: dict[tuple[str, str], int] = {}
@@ -1094,16 +2881,55 @@ def build_review_artifact(
             inventory_phones.setdefault(record.phone, []).append(record)
         if record.email:
             inventory_emails.setdefault(record.email, []).append(record)
-
-    for index, row in enumerate(input_rows, start=1):
+    run_timer.lap("inventory_index")
+
+    # A caller that wants the per-host wait and queue figures passes its own scheduler and reads
+    # its summary afterwards: they are wall-clock measurements and stay out of the artifact.
+    scheduler = scheduler or HostFetchScheduler(workers, per_host_concurrency, per_host_rps)
+    cpu_pool: Executor | None = None
+    if cpu_workers > 0:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Spawned (not forked) CPU workers: the fetch threads and pooled sockets must not leak into children.
+        cpu_pool = ProcessPoolExecutor(max_workers=cpu_workers, mp_context=multiprocessing.get_context("spawn"))
+    source_data_rows = iter_source_data(input_rows, scheduler, fetch_options, cpu_pool, checkpoint, previous_extractions)
+    waiting_since = time.perf_counter()
+    for position, (row, source_data) in enumerate(source_data_rows, start=1):
+        # Queue rows are numbered as in the CSV, counting any the reader rejected.
+        index = int(row.get("input_row_index") or position)
+        # Time blocked on the next in-order row: high when the run is fetch-bound.
+        review_timer = StageTimer(since=waiting_since)
+        review_timer.lap("review.wait")
+        review_started = time.perf_counter()
         source_url = row["source_url"].strip()
         suburb_hint = row["suburb_hint"].strip()
         business_name_hint = row["business_name_hint"].strip()
         service_hint = row.get("service_hint", "").strip()
-        source_data = extract_page_fields(source_url, business_name_hint, service_hint)
         fetch = source_data["fetch"]
         snapshot = source_data["snapshot"]
-        matched_suburb, suburb_warnings = resolve_suburb(suburb_hint, snapshot, suburb_lookup, councils)
+        address_locality = infer_address_locality(source_data["contacts"]["address"], snapshot, canon)
+        matched_suburb, suburb_warnings = resolve_suburb(suburb_hint, snapshot, canon, address_locality)
+        suburb_correction: tuple[str, float] | None = None
+        if matched_suburb is None and not canon.suburbs_named(suburb_hint):
+            # The queue reader has already chosen a catchment suburb for a hint it accepted as a misspelling.
+            carried_correction = row.get("suburb_hint_correction", "")
+            correction = correct_suburb_hint(suburb_hint, canon, allowed=[carried_correction] if carried_correction else None)
+            if correction is not None:
+                corrected_suburb, corrected_warnings = resolve_suburb(correction[0], snapshot, canon, address_locality)
+                if corrected_suburb is not None:
+                    matched_suburb, suburb_warnings, suburb_correction = corrected_suburb, corrected_warnings, correction
+            if suburb_correction is None:
+                suburb_warnings = [suburb_warnings[0] + format_suburb_suggestions(suggest_suburbs(suburb_hint, canon))]
+        locality_warnings = address_locality_warnings(suburb_hint, matched_suburb, address_locality)
+        if suburb_correction is not None:
+            # Advisory only: the reviewer confirms the corrected suburb before publishing.
+            locality_warnings.insert(
+                0,
+                f"suburb hint '{suburb_hint}' auto-resolved to '{suburb_correction[0]}' "
+                f"(trigram similarity {suburb_correction[1]:.2f})",
+            )
+        review_timer.lap("review.locality")
         duplicate_signal_hits: list[dict[str, Any]] = []
         current_locality_key = (
             locality_key(matched_suburb.name, matched_suburb.council_name)
@@ -1258,6 +3084,13 @@ def build_review_artifact(
                 "council_id": None,
                 "postcode": "",
             }
+        locality["suburb_hint_correction"] = suburb_correction[0] if suburb_correction else ""
+        locality["address_postcode"] = address_locality.postcode
+        locality["address_point_source"] = address_locality.point_source
+        locality["address_candidates"] = [
+            {"suburb": record.name, "council": record.council_name, "distance_km": round(distance, 2)}
+            for distance, record in address_locality.nearest
+        ]
 
         previous_candidate_signals[index] = {
             "name_key": normalized_name,
@@ -1269,7 +3102,14 @@ def build_review_artifact(
             current_locality_key=current_locality_key,
         )
         duplicate_warnings = list(duplicate_assessment["warnings"])
-        publish_warnings = list(source_data["blocked_issues"]) + list(source_data["advisory_warnings"]) + suburb_warnings + duplicate_warnings
+        review_timer.lap("review.dedupe")
+        publish_warnings = (
+            list(source_data["blocked_issues"])
+            + list(source_data["advisory_warnings"])
+            + suburb_warnings
+            + locality_warnings
+            + duplicate_warnings
+        )
         if inventory_check["status"] != "available":
             publish_warnings.append(inventory_check["warning"])
         if matched_suburb is None:
@@ -1280,7 +3120,13 @@ def build_review_artifact(
             publish_warnings.append("no age specialty mapped")
         if not source_data["contacts"]["website"]:
             publish_warnings.append("no canonical website extracted")
-        publish_status = compute_publish_status(source_data["blocked_issues"] + suburb_warnings, source_data["advisory_warnings"] + duplicate_warnings)
+        publish_status = compute_publish_status(
+            source_data["blocked_issues"] + suburb_warnings,
+            source_data["advisory_warnings"] + locality_warnings + duplicate_warnings,
+        )
+        if fetch.get("failure_class") == "deadline_exceeded":
+            # Not a verdict on the source: the run's deadline passed before it could be fetched.
+            publish_status = "deadline_exceeded"
 
         review_score = 0
         review_score += 25 if fetch["http_status"] and 200 <= int(fetch["http_status"]) < 400 else 0
@@ -1306,6 +3152,17 @@ def build_review_artifact(
                 "charset": fetch["charset"],
                 "error": fetch["error"],
                 "domain": fetch["domain"],
+                "cache_status": fetch.get("cache_status", ""),
+                "content_encoding": fetch.get("content_encoding", ""),
+                "wire_bytes": fetch.get("wire_bytes", 0),
+                "decoded_bytes": fetch.get("decoded_bytes", 0),
+                "stopped_early": fetch.get("stopped_early", False),
+                "content_sha256": fetch.get("content_sha256", ""),
+                "extraction_reused": fetch.get("extraction_reused", False),
+                "crawled_pages": fetch.get("crawled_pages", []),
+                "attempts": fetch.get("attempts", 1),
+                "retries": fetch.get("retries", 0),
+                "failure_class": fetch.get("failure_class", ""),
             },
             "extracted": {
                 "business_name": source_data["business_name"],
@@ -1329,13 +3186,28 @@ def build_review_artifact(
         }
         result.update(build_mapping_candidate(result))
         results.append(result)
+        review_timer.lap("review.record")
+        review_timer.add("review", review_started, time.perf_counter() - review_started)
+        if profiler is not None:
+            profiler.add_row(source_url, source_data.get("timings"), review_timer)
+        waiting_since = time.perf_counter()
+    run_timer.lap("rows")
 
     ready = sum(1 for row in results if row["publish_status"] == "ready")
     needs_review = sum(1 for row in results if row["publish_status"] == "needs_review")
     blocked = sum(1 for row in results if row["publish_status"] == "blocked")
+    deadline_exceeded = sum(1 for row in results if row["publish_status"] == "deadline_exceeded")
     mapping_ready = sum(1 for row in results if row["mapping_status"] == "mapping_ready")
     mapping_needs_review = sum(1 for row in results if row["mapping_status"] == "needs_review")
     mapping_blocked = sum(1 for row in results if row["mapping_status"] == "blocked")
+    cache = fetch_options.cache if fetch_options else None
+    cache_statuses = [row["fetch"]["cache_status"] for row in results]
+    contact_crawl_pages = fetch_options.contact_crawl_pages if fetch_options else 0
+    retry_policy = fetch_options.retry_policy if fetch_options else RetryPolicy()
+    breaker = fetch_options.circuit_breaker if fetch_options else None
+    deadline = fetch_options.deadline if fetch_options else None
+    recorder = fetch_options.recorder if fetch_options else None
+    crawled_pages = [page for row in results for page in row["fetch"]["crawled_pages"]]
 
     return {
         "pipeline": "concierge_seed_pipeline",
@@ -1346,10 +3218,67 @@ def build_review_artifact(
         "inventory_duplicate_check": inventory_check,
         "approved_source_only": True,
         "manual_steps": ["lead sourcing", "pre-publish review"],
+        "snapshot_cache": {
+            "enabled": cache is not None,
+            "cache_dir": str(cache.root.resolve()) if cache else None,
+            "max_age_seconds": cache.max_age if cache else None,
+            "offline": bool(cache and cache.offline),
+            "hits": cache_statuses.count("hit"),
+            "revalidated": cache_statuses.count("revalidated"),
+            "misses": cache_statuses.count("miss"),
+        },
+        "checkpoint": {"enabled": checkpoint is not None, **(checkpoint.summary() if checkpoint else {})},
+        "incremental": {
+            "enabled": previous_extractions is not None,
+            "previous_rows": len(previous_extractions or {}),
+            "reused": sum(1 for row in results if row["fetch"]["extraction_reused"]),
+            "re_extracted": sum(1 for row in results if not row["fetch"]["extraction_reused"]),
+        },
+        "deadline": {
+            "enabled": deadline is not None,
+            "budget_seconds": deadline.seconds if deadline else None,
+            "expired": bool(deadline and deadline.expired),
+            "rows_deadline_exceeded": deadline_exceeded,
+        },
+        "response_corpus": {
+            "recording": recorder.summary() if recorder else None,
+            "replay_url": fetch_options.replay_url if fetch_options and fetch_options.replay_url else None,
+        },
+        "fetch_retries": {
+            "max_attempts": retry_policy.max_attempts,
+            "rows_retried": sum(1 for row in results if row["fetch"]["retries"]),
+            "retries": sum(row["fetch"]["retries"] for row in results),
+            "failure_classes": dict(
+                sorted(Counter(row["fetch"]["failure_class"] for row in results if row["fetch"]["failure_class"]).items())
+            ),
+            "circuit_breaker": breaker.summary() if breaker else None,
+        },
+        "contact_crawl": {
+            "enabled": contact_crawl_pages > 0,
+            "max_pages_per_site": contact_crawl_pages,
+            "rows_crawled": sum(1 for row in results if row["fetch"]["crawled_pages"]),
+            "pages_fetched": len(crawled_pages),
+            "page_errors": sum(1 for page in crawled_pages if page["error"]),
+            "wire_bytes": sum(page["wire_bytes"] for page in crawled_pages),
+            "fields_filled": {
+                field_name: sum(
+                    1
+                    for row in results
+                    if row["evidence"].get("contact_sources", {}).get(field_name, "") not in {"", row["fetch"]["final_url"]}
+                )
+                for field_name in CONTACT_FIELDS
+            },
+        },
+        "transfer_bytes": {
+            "accept_encoding": ACCEPT_ENCODING,
+            "wire_bytes": sum(row["fetch"]["wire_bytes"] for row in results),
+            "decoded_bytes": sum(row["fetch"]["decoded_bytes"] for row in results),
+        },
         "review_counts": {
             "ready": ready,
             "needs_review": needs_review,
             "blocked": blocked,
+            "deadline_exceeded": deadline_exceeded,
             "total": len(results),
         },
         "mapping_counts": {
@@ -1358,6 +3287,11 @@ def build_review_artifact(
             "blocked": mapping_blocked,
             "total": len(results),
         },
+        "performance": (
+            {**profiler.summary(), "fetch_schedule": {**scheduler.summary(), "cpu_workers": cpu_workers}}
+            if profiler
+            else {"enabled": False}
+        ),
         "records": results,
     }
 
@@ -1536,20 +3470,236 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--csv-name", default="concierge_review_artifact.csv", help="CSV output file name")
     parser.add_argument("--mapping-json-name", default="concierge_mapping_artifact.json", help="JSON mapping output file name")
     parser.add_argument("--mapping-csv-name", default="concierge_mapping_artifact.csv", help="CSV mapping output file name")
+    parser.add_argument(
+        "--checkpoint-name",
+        default="concierge_checkpoint.jsonl",
+        help="Checkpoint journal file name in --output-dir; removed once a run completes",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Replay the checkpoint journal of an interrupted run and fetch only the rows it is missing",
+    )
+    parser.add_argument(
+        "--extractions-name",
+        default="concierge_extractions.jsonl",
+        help="Per-row extraction store in --output-dir; a completed run's checkpoint journal becomes this file",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse the previous run's extraction for pages whose content hash and final URL are unchanged",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_FETCH_WORKERS,
+        help="Concurrent source fetch workers (1 fetches serially)",
+    )
+    parser.add_argument(
+        "--cpu-workers",
+        type=int,
+        default=DEFAULT_CPU_WORKERS,
+        help="Worker processes for snapshot parsing and field extraction (0 extracts in the fetch threads)",
+    )
+    parser.add_argument(
+        "--per-host-concurrency",
+        type=int,
+        default=DEFAULT_PER_HOST_CONCURRENCY,
+        help="Maximum in-flight fetches per source host",
+    )
+    parser.add_argument(
+        "--per-host-rps",
+        type=float,
+        default=DEFAULT_PER_HOST_RPS,
+        help="Maximum fetch requests per second per source host (0 disables the rate limit)",
+    )
+    parser.add_argument("--cache-dir", type=Path, default=None, help="Directory for the local HTML snapshot cache")
+    parser.add_argument(
+        "--canon-cache-dir",
+        type=Path,
+        default=DEFAULT_CANON_CACHE_DIR,
+        help="Directory for the compiled suburb/council canon, keyed by hashes of its SQL and CSV sources",
+    )
+    parser.add_argument("--no-canon-cache", action="store_true", help="Always re-parse the suburb/council canon sources")
+    parser.add_argument(
+        "--max-age",
+        default="0",
+        help="Serve cached snapshots younger than this without revalidating (seconds or 15m/2h/1d; 0 always revalidates)",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve every source from the snapshot cache and never touch the network",
+    )
+    parser.add_argument(
+        "--stream-parse",
+        action="store_true",
+        help="Parse pages while they download and stop once head, JSON-LD and enough body text have arrived",
+    )
+    parser.add_argument(
+        "--stream-byte-budget",
+        type=int,
+        default=DEFAULT_STREAM_BYTE_BUDGET,
+        help="Maximum decoded bytes downloaded per page in --stream-parse mode",
+    )
+    parser.add_argument(
+        "--stream-min-body-chars",
+        type=int,
+        default=DEFAULT_STREAM_MIN_BODY_CHARS,
+        help="Body text characters to collect before --stream-parse stops downloading",
+    )
+    parser.add_argument(
+        "--record-corpus",
+        type=Path,
+        default=None,
+        help="Record every fetched response (redirects and errors included) into this corpus directory",
+    )
+    parser.add_argument(
+        "--replay-url",
+        default="",
+        help="Fetch every page from a concierge_replay.py server at this base URL instead of the live site",
+    )
+    parser.add_argument(
+        "--deadline",
+        default=None,
+        help="Time budget for the whole run (seconds or 15m/2h); rows not fetched in time are marked deadline_exceeded",
+    )
+    parser.add_argument(
+        "--fetch-attempts",
+        type=int,
+        default=DEFAULT_MAX_ATTEMPTS,
+        help="Attempts per page for transient failures (connection errors, timeouts, 429 and 5xx); 1 disables retries",
+    )
+    parser.add_argument(
+        "--circuit-breaker-threshold",
+        type=int,
+        default=DEFAULT_BREAKER_THRESHOLD,
+        help="Consecutive host-level failures that stop fetching from a host for a cool-down (0 disables)",
+    )
+    parser.add_argument(
+        "--crawl-contact-pages",
+        type=int,
+        default=0,
+        help="Follow up to N same-site contact/about links per source that lacks a phone, email or address (0 disables)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Add a performance block (per-stage p50/p95/max, slowest URLs, peak RSS) to the review artifact",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Also sample Python allocations with tracemalloc (slower; implies --profile)",
+    )
+    parser.add_argument(
+        "--trace-output",
+        type=Path,
+        default=None,
+        help="Write the run's stage spans as Chrome trace-event JSON for chrome://tracing or Perfetto (implies --profile)",
+    )
+    parser.add_argument(
+        "--parser-backend",
+        choices=sorted({"auto", "stdlib", "lxml"}),
+        default=DEFAULT_PARSER_BACKEND,
+        help="HTML snapshot parser; lxml is a C-accelerated drop-in when installed, auto picks it when importable",
+    )
     args = parser.parse_args(argv)
-
-    councils, suburb_lookup, _ = load_councils_and_suburbs()
-    input_rows = parse_seed_queue(args.input)
+    deadline: RunDeadline | None = None
+    if args.deadline is not None:
+        try:
+            deadline = RunDeadline(parse_duration(args.deadline))
+        except ValueError as exc:
+            parser.error(f"--deadline: {exc}")
+        if deadline.seconds <= 0:
+            parser.error("--deadline must be positive")
+    try:
+        parser_backend = resolve_parser_backend(args.parser_backend)
+    except ValueError as exc:
+        parser.error(f"--parser-backend: {exc}")
+    try:
+        max_age = parse_duration(args.max_age)
+    except ValueError as exc:
+        parser.error(f"--max-age: {exc}")
+    if args.offline and args.cache_dir is None:
+        parser.error("--offline requires --cache-dir")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.per_host_concurrency < 1:
+        parser.error("--per-host-concurrency must be at least 1")
+    if args.cpu_workers < 0:
+        parser.error("--cpu-workers must not be negative")
+    if args.per_host_rps < 0:
+        parser.error("--per-host-rps must not be negative")
+    if args.stream_byte_budget < 1:
+        parser.error("--stream-byte-budget must be at least 1")
+    if args.fetch_attempts < 1:
+        parser.error("--fetch-attempts must be at least 1")
+    if args.circuit_breaker_threshold < 0:
+        parser.error("--circuit-breaker-threshold must not be negative")
+    if args.record_corpus is not None and args.replay_url:
+        parser.error("--record-corpus cannot be combined with --replay-url")
+    if args.crawl_contact_pages < 0:
+        parser.error("--crawl-contact-pages must not be negative")
+
+    profiler: RunProfiler | None = None
+    if args.profile or args.trace_memory or args.trace_output is not None:
+        profiler = RunProfiler(trace_memory=args.trace_memory)
+    cache = SnapshotCache(args.cache_dir, max_age=max_age, offline=args.offline) if args.cache_dir else None
+    canon = load_councils_and_suburbs(None if args.no_canon_cache else args.canon_cache_dir)
+    if profiler is not None:
+        profiler.run_timer.lap("load_canon")
+    fetch_options = FetchOptions(
+        cache=cache,
+        stream_parse=args.stream_parse,
+        stream_byte_budget=args.stream_byte_budget,
+        stream_min_body_chars=args.stream_min_body_chars,
+        parser_backend=parser_backend,
+        contact_crawl_pages=args.crawl_contact_pages,
+        retry_policy=RetryPolicy(max_attempts=args.fetch_attempts),
+        circuit_breaker=CircuitBreaker(args.circuit_breaker_threshold) if args.circuit_breaker_threshold else None,
+        deadline=deadline,
+        recorder=CorpusRecorder(args.record_corpus) if args.record_corpus else None,
+        replay_url=args.replay_url,
+    )
+    try:
+        checkpoint = CheckpointJournal(
+            args.output_dir / args.checkpoint_name,
+            checkpoint_run_key(args.input, fetch_options),
+            resume=args.resume,
+        )
+    except CheckpointMismatch as exc:
+        parser.error(f"--resume: {exc}; rerun without --resume to start over")
+    previous_extractions: dict[str, dict[str, Any]] | None = None
+    if args.incremental:
+        previous_extractions = load_previous_extractions(args.output_dir / args.extractions_name, fetch_options)
+        if previous_extractions is None:
+            print(f"Incremental: no compatible extraction store at {args.output_dir / args.extractions_name}; extracting every row")
+            previous_extractions = {}
+    queue_reader = SeedQueueReader(args.input, canon)
     existing_inventory, inventory_check = load_existing_inventory_snapshot()
+    if profiler is not None:
+        profiler.run_timer.lap("load_inventory")
+    scheduler = HostFetchScheduler(args.workers, args.per_host_concurrency, args.per_host_rps)
     artifact = build_review_artifact(
-        input_rows,
-        councils,
-        suburb_lookup,
+        queue_reader,
+        canon,
         args.input,
         existing_inventory,
         inventory_check,
+        workers=args.workers,
+        per_host_concurrency=args.per_host_concurrency,
+        per_host_rps=args.per_host_rps,
+        cpu_workers=args.cpu_workers,
+        fetch_options=fetch_options,
+        checkpoint=checkpoint,
+        previous_extractions=previous_extractions,
+        profiler=profiler,
+        scheduler=scheduler,
     )
     artifact["generated_at"] = datetime.now().astimezone().isoformat()
+    artifact["input_validation"] = queue_reader.summary()
     args.output_dir.mkdir(parents=True, exist_ok=True)
     json_path = args.output_dir / args.json_name
     csv_path = args.output_dir / args.csv_name
@@ -1560,6 +3710,17 @@ def main(argv: list[str] | None = None) -> int:
     write_csv(artifact, csv_path)
     write_mapping_artifact_json(artifact, mapping_json_path)
     write_mapping_csv(artifact, mapping_csv_path)
+    if args.trace_output is not None:
+        profiler.run_timer.lap("write_artifacts")
+        profiler.write_trace(args.trace_output)
+    deadline_exceeded = artifact["review_counts"]["deadline_exceeded"]
+    if deadline_exceeded:
+        # The journal holds every row fetched in time; --resume fetches only the rows the deadline cut off.
+        checkpoint.close()
+    else:
+        # Every row made it into the artifacts, so the journal has nothing left to resume; it becomes
+        # the extraction store the next --incremental run compares against.
+        checkpoint.promote(args.output_dir / args.extractions_name)
 
     summary = artifact["review_counts"]
     mapping_summary = artifact["mapping_counts"]
@@ -1572,7 +3733,98 @@ def main(argv: list[str] | None = None) -> int:
         f"status={artifact['inventory_duplicate_check']['status']} "
         f"records={artifact['inventory_duplicate_check']['record_count']}"
     )
-    print(f"Summary: ready={summary['ready']} needs_review={summary['needs_review']} blocked={summary['blocked']} total={summary['total']}")
+    fetch_schedule = scheduler.summary()
+    print(
+        "Fetch schedule: "
+        f"workers={fetch_schedule['workers']} "
+        f"hosts={fetch_schedule['host_count']} "
+        f"per_host_concurrency={fetch_schedule['per_host_concurrency']} "
+        f"per_host_rps={fetch_schedule['per_host_rps']} "
+        f"cpu_workers={args.cpu_workers}"
+    )
+    for host_stats in fetch_schedule["hosts"][:5]:
+        if host_stats["max_queue_depth"] < 2 and host_stats["total_wait_seconds"] < 0.1:
+            continue
+        print(
+            f"  {host_stats['host']}: requests={host_stats['requests']} "
+            f"max_queue_depth={host_stats['max_queue_depth']} "
+            f"wait_total={host_stats['total_wait_seconds']}s wait_max={host_stats['max_wait_seconds']}s"
+        )
+    snapshot_cache = artifact["snapshot_cache"]
+    if snapshot_cache["enabled"]:
+        print(
+            "Snapshot cache: "
+            f"hits={snapshot_cache['hits']} "
+            f"revalidated={snapshot_cache['revalidated']} "
+            f"misses={snapshot_cache['misses']} "
+            f"offline={snapshot_cache['offline']}"
+        )
+    if args.resume:
+        print(
+            "Checkpoint: "
+            f"replayed={artifact['checkpoint']['replayed_rows']} "
+            f"fetched={artifact['checkpoint']['recorded_rows']}"
+        )
+    if args.incremental:
+        print(f"Incremental: reused={artifact['incremental']['reused']} re_extracted={artifact['incremental']['re_extracted']}")
+    response_corpus = artifact["response_corpus"]
+    if response_corpus["recording"]:
+        recording = response_corpus["recording"]
+        print(f"Recorded corpus: responses={recording['recorded_responses']} dir={recording['corpus_dir']}")
+    if response_corpus["replay_url"]:
+        print(f"Replayed from: {response_corpus['replay_url']}")
+    fetch_retries = artifact["fetch_retries"]
+    if fetch_retries["retries"] or fetch_retries["failure_classes"]:
+        failure_classes = " ".join(f"{name}={count}" for name, count in fetch_retries["failure_classes"].items())
+        print(f"Fetch retries: rows={fetch_retries['rows_retried']} retries={fetch_retries['retries']} failures: {failure_classes or 'none'}")
+        breaker_summary = fetch_retries["circuit_breaker"]
+        for host_circuit in breaker_summary["hosts_opened"] if breaker_summary else []:
+            print(f"  circuit opened for {host_circuit['host']}: rejected={host_circuit['rejected_requests']}")
+    contact_crawl = artifact["contact_crawl"]
+    if contact_crawl["enabled"]:
+        filled = contact_crawl["fields_filled"]
+        print(
+            "Contact crawl: "
+            f"rows={contact_crawl['rows_crawled']} "
+            f"pages={contact_crawl['pages_fetched']} "
+            f"errors={contact_crawl['page_errors']} "
+            f"filled_phone={filled['phone']} filled_email={filled['email']} filled_address={filled['address']}"
+        )
+    performance = artifact["performance"]
+    if performance["enabled"]:
+        stage_times = " ".join(
+            f"{name}={performance['stages'][name]['p50_seconds']}/{performance['stages'][name]['p95_seconds']}s"
+            for name in ("fetch", "extract", "review")
+            if name in performance["stages"]
+        )
+        print(f"Performance (p50/p95): {stage_times or 'no rows'} peak_rss_bytes={performance['memory']['peak_rss_bytes']}")
+        for slow in performance["slowest_urls"][:3]:
+            print(f"  slowest: {slow['source_url']} {slow['seconds']}s")
+        if args.trace_output is not None:
+            print(f"Wrote Chrome trace: {args.trace_output}")
+    transfer_bytes = artifact["transfer_bytes"]
+    print(
+        "Transfer: "
+        f"wire_bytes={transfer_bytes['wire_bytes']} "
+        f"decoded_bytes={transfer_bytes['decoded_bytes']} "
+        f"accept_encoding={transfer_bytes['accept_encoding']!r}"
+    )
+    input_validation = artifact["input_validation"]
+    print(
+        "Input queue: "
+        f"rows_read={input_validation['rows_read']} "
+        f"accepted={input_validation['rows_accepted']} "
+        f"rejected={input_validation['rows_rejected']}"
+    )
+    print(
+        f"Summary: ready={summary['ready']} needs_review={summary['needs_review']} blocked={summary['blocked']} "
+        f"deadline_exceeded={summary['deadline_exceeded']} total={summary['total']}"
+    )
+    if deadline_exceeded:
+        print(
+            f"Deadline: {deadline_exceeded} rows were not fetched within --deadline {args.deadline}; "
+            f"rerun with --resume to fetch only those rows"
+        )
     print(
         "Mapping summary: "
         f"mapping_ready={mapping_summary['mapping_ready']} "
@@ -1580,6 +3832,9 @@ def main(argv: list[str] | None = None) -> int:
         f"blocked={mapping_summary['blocked']} "
         f"total={mapping_summary['total']}"
     )
+    if queue_reader.errors:
+        # Valid rows were still processed and written; the non-zero exit flags the rejected ones.
+        raise SystemExit(queue_reader.report())
     return 0
 
 
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Stage timing and memory sampling for concierge pipeline runs.
+
+Every row records the spans its fetch, extraction and review stages took
+(a few perf_counter reads, cheap enough to leave on). A RunProfiler
+aggregates them into per-stage p50/p95/max and the slowest URLs, adds peak
+RSS and optional tracemalloc figures, and can export the spans as Chrome
+trace-event JSON for chrome://tracing or Perfetto.
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+# (stage, perf_counter start, seconds, pid, native thread id)
+Span = tuple[str, float, float, int, int]
+CONTACT_CRAWL_PREFIX = "contact_crawl."
+DEFAULT_SLOWEST_URLS = 10
+DEFAULT_TOP_ALLOCATIONS = 10
+
+
+def current_span_owner() -> tuple[int, int]:
+    return os.getpid(), threading.get_native_id()
+
+
+def is_row_stage(name: str) -> bool:
+    """Stages that add up to a row's time; dotted names are phases inside one of them."""
+    return "." not in name.removeprefix(CONTACT_CRAWL_PREFIX)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    # Nearest rank: always a value that was observed.
+    return sorted_values[min(len(sorted_values) - 1, max(math.ceil(fraction * len(sorted_values)) - 1, 0))]
+
+
+def peak_rss_bytes(who: str = "self") -> int | None:
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if who == "children" else resource.RUSAGE_SELF)
+    # ru_maxrss is kilobytes on Linux and bytes on macOS.
+    return usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+
+
+class StageTimer:
+    def __init__(self, spans: Iterable[Span] = (), since: float | None = None) -> None:
+        self.spans: list[Span] = list(spans)
+        self.memory: list[tuple[float, int]] = []
+        self._last = time.perf_counter() if since is None else since
+
+    @classmethod
+    def from_export(cls, exported: dict[str, Any] | None) -> StageTimer:
+        timer = cls((tuple(span) for span in (exported or {}).get("spans", ())))
+        timer.memory = [tuple(sample) for sample in (exported or {}).get("memory", ())]
+        return timer
+
+    def add(self, name: str, started: float, seconds: float) -> None:
+        self.spans.append((name, started, seconds, *current_span_owner()))
+        if tracemalloc.is_tracing():
+            self.memory.append((started + seconds, tracemalloc.get_traced_memory()[0]))
+
+    def extend(self, spans: Iterable[Span], prefix: str = "") -> None:
+        self.spans.extend((prefix + name, *rest) for name, *rest in spans)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, started, time.perf_counter() - started)
+
+    def lap(self, name: str) -> None:
+        """Record the time since the previous lap (or construction) as `name`."""
+        now = time.perf_counter()
+        self.add(name, self._last, now - self._last)
+        self._last = now
+
+    def export(self) -> dict[str, Any]:
+        return {"spans": list(self.spans), "memory": list(self.memory)}
+
+
+class RunProfiler:
+    def __init__(self, trace_memory: bool = False, slowest_urls: int = DEFAULT_SLOWEST_URLS) -> None:
+        self.trace_memory = trace_memory
+        self.slowest_urls = slowest_urls
+        self.started = time.perf_counter()
+        self.rows: list[tuple[str, StageTimer]] = []
+        self.run_timer = StageTimer(since=self.started)
+        self._started_tracing = False
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def add_row(self, source_url: str, timings: dict[str, Any] | None, review_timer: StageTimer) -> None:
+        timer = StageTimer.from_export(timings)
+        timer.extend(review_timer.spans)
+        timer.memory.extend(review_timer.memory)
+        self.rows.append((source_url, timer))
+
+    def memory_summary(self) -> dict[str, Any]:
+        traced: dict[str, Any] | None = None
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            top = tracemalloc.take_snapshot().statistics("lineno")[:DEFAULT_TOP_ALLOCATIONS]
+            traced = {
+                "current_bytes": current,
+                "peak_bytes": peak,
+                "top_allocations": [
+                    {"location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", "size_bytes": stat.size, "count": stat.count}
+                    for stat in top
+                ],
+            }
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        return {
+            "peak_rss_bytes": peak_rss_bytes(),
+            # CPU worker processes, once they have exited.
+            "children_peak_rss_bytes": peak_rss_bytes("children"),
+            "tracemalloc": traced,
+        }
+
+    def summary(self) -> dict[str, Any]:
+        durations: dict[str, list[float]] = {}
+        row_totals: list[tuple[float, str, dict[str, float]]] = []
+        for source_url, timer in self.rows:
+            row_stages: dict[str, float] = {}
+            for name, _, seconds, _, _ in timer.spans:
+                durations.setdefault(name, []).append(seconds)
+                if is_row_stage(name):
+                    row_stages[name] = row_stages.get(name, 0.0) + seconds
+            row_totals.append((sum(row_stages.values()), source_url, row_stages))
+        stages = {}
+        for name, values in sorted(durations.items()):
+            values.sort()
+            stages[name] = {
+                "count": len(values),
+                "total_seconds": round(sum(values), 6),
+                "p50_seconds": round(percentile(values, 0.5), 6),
+                "p95_seconds": round(percentile(values, 0.95), 6),
+                "max_seconds": round(values[-1], 6),
+            }
+        row_totals.sort(key=lambda item: item[0], reverse=True)
+        return {
+            "enabled": True,
+            "rows": len(self.rows),
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "run_stages": {name: round(seconds, 6) for name, _, seconds, _, _ in self.run_timer.spans},
+            "stages": stages,
+            "slowest_urls": [
+                {
+                    "source_url": source_url,
+                    "seconds": round(total, 6),
+                    "stages": {name: round(seconds, 6) for name, seconds in sorted(row_stages.items())},
+                }
+                for total, source_url, row_stages in row_totals[: self.slowest_urls]
+            ],
+            "memory": self.memory_summary(),
+        }
+
+    def trace_events(self) -> dict[str, Any]:
+        events: list[dict[str, Any]] = []
+
+        def microseconds(at: float) -> float:
+            return round((at - self.started) * 1_000_000, 3)
+
+        def add_timer(timer: StageTimer, category: str, args: dict[str, Any]) -> None:
+            for name, started, seconds, pid, tid in timer.spans:
+                events.append(
+                    {
+                        "name": name,
+                        "cat": category,
+                        "ph": "X",
+                        "ts": microseconds(started),
+                        "dur": round(seconds * 1_000_000, 3),
+                        "pid": pid,
+                        "tid": tid,
+                        "args": args,
+                    }
+                )
+            for at, traced_bytes in timer.memory:
+                events.append(
+                    {"name": "traced_memory", "ph": "C", "ts": microseconds(at), "pid": os.getpid(), "args": {"bytes": traced_bytes}}
+                )
+
+        add_timer(self.run_timer, "run", {})
+        for source_url, timer in self.rows:
+            add_timer(timer, "row", {"url": source_url})
+        events.sort(key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.trace_events(), separators=(",", ":")), encoding="utf-8")
@@ -13,7 +13,6 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import ssl
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
@@ -21,7 +20,8 @@ from pathlib import Path
 from typing import Any
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+
+from concierge_http import ConnectionPool, shared_pool
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -59,7 +59,7 @@ class SupabaseRestPublisher:
         self.service_role_key = service_role_key
         self.connection_string = connection_string
         self.encrypt_key = encrypt_key
-        self.context = ssl.create_default_context()
+        self.http: ConnectionPool = shared_pool()
 
     def _request(
         self,
@@ -81,9 +81,8 @@ class SupabaseRestPublisher:
         if extra_headers:
             headers.update(extra_headers)
 
-        request = Request(f"{self.supabase_url}{path}", data=body, headers=headers, method=method)
         try:
-            with urlopen(request, timeout=20, context=self.context) as response:
+            with self.http.request(method, f"{self.supabase_url}{path}", headers=headers, body=body, timeout=20) as response:
                 raw = response.read().decode("utf-8")
         except HTTPError as exc:
             detail = exc.read().decode("utf-8", errors="replace")
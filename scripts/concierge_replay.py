@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Recorded response corpus and local replay server for the concierge pipeline.
+
+Record mode stores every response a pipeline run receives, redirect hops,
+error responses and pages served from the snapshot cache included, one entry
+per requested URL with bodies kept content-addressed. Replay mode serves that corpus from a local HTTP server,
+optionally with injected latency, error responses and dropped connections, so
+fetch, parse and end-to-end runs can be load-tested without the network.
+
+Source URLs are mapped onto the server as /<scheme>/<host><path>, and a
+leading "replica-<n>." host label is ignored on lookup so a queue can be
+multiplied into distinct hosts that all replay the same recorded pages.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from concierge_snapshot_cache import CachedSnapshot, atomic_write_bytes, url_key
+
+
+CORPUS_FORMAT = 1
+REPLICA_HOST_RE = re.compile(r"^replica-\d+\.")
+# The recorded body is stored decoded, so transfer framing and encoding headers are not replayed.
+UNREPLAYED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"})
+
+
+def replay_request_url(url: str, replay_base: str) -> str:
+    parts = urlsplit(url)
+    return f"{replay_base.rstrip('/')}/{parts.scheme}/{parts.netloc}{parts.path or '/'}" + (f"?{parts.query}" if parts.query else "")
+
+
+def source_url_from_replay(url: str, replay_base: str) -> str:
+    prefix = replay_base.rstrip("/") + "/"
+    if not url.startswith(prefix):
+        return url
+    return source_url_for_path("/" + url[len(prefix) :])
+
+
+def source_url_for_path(path: str) -> str:
+    scheme, _, rest = path.lstrip("/").partition("/")
+    netloc, slash, tail = rest.partition("/")
+    target = urlsplit("/" + tail if slash else "/")
+    return urlunsplit((scheme, netloc, target.path, target.query, ""))
+
+
+def corpus_lookup_url(url: str) -> str:
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, REPLICA_HOST_RE.sub("", parts.netloc), parts.path or "/", parts.query, ""))
+
+
+class CorpusRecorder:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.recorded = 0
+        self._lock = threading.Lock()
+        atomic_write_bytes(root / "corpus.json", json.dumps({"corpus_format": CORPUS_FORMAT}).encode("utf-8"))
+
+    def _write_entry(self, entry: dict[str, Any]) -> None:
+        atomic_write_bytes(
+            self.root / "responses" / f"{url_key(entry['url'])}.json",
+            json.dumps(entry, indent=2, sort_keys=True).encode("utf-8"),
+        )
+        with self._lock:
+            self.recorded += 1
+
+    def record_response(
+        self,
+        url: str,
+        status: int,
+        headers: dict[str, str],
+        body: bytes,
+        truncated: bool = False,
+    ) -> None:
+        body_sha256 = hashlib.sha256(body).hexdigest() if body else ""
+        if body:
+            blob_path = self.root / "bodies" / body_sha256[:2] / body_sha256
+            if not blob_path.exists():
+                atomic_write_bytes(blob_path, body)
+        self._write_entry(
+            {
+                "url": url,
+                "status": status,
+                "headers": {key.lower(): value for key, value in headers.items() if key.lower() not in UNREPLAYED_HEADERS},
+                "body_sha256": body_sha256,
+                "truncated": truncated,
+                "error": "",
+                "recorded_at": time.time(),
+            }
+        )
+
+    def record_snapshot(self, snapshot: CachedSnapshot, record_redirect: bool = True) -> None:
+        # A cache hit never touches the network, so its redirect chain is recorded as one hop.
+        if record_redirect and snapshot.url != snapshot.final_url:
+            self.record_response(snapshot.url, 302, {"location": snapshot.final_url}, b"")
+        self.record_response(snapshot.final_url, snapshot.status, snapshot.headers, snapshot.body)
+
+    def record_failure(self, url: str, error: str) -> None:
+        self._write_entry(
+            {
+                "url": url,
+                "status": None,
+                "headers": {},
+                "body_sha256": "",
+                "truncated": False,
+                "error": error,
+                "recorded_at": time.time(),
+            }
+        )
+
+    def summary(self) -> dict[str, Any]:
+        return {"corpus_dir": str(self.root.resolve()), "recorded_responses": self.recorded}
+
+
+class ReplayCorpus:
+    def __init__(self, root: Path) -> None:
+        try:
+            header = json.loads((root / "corpus.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise ValueError(f"{root} is not a recorded corpus: {exc}") from exc
+        if header.get("corpus_format") != CORPUS_FORMAT:
+            raise ValueError(f"{root} has corpus format {header.get('corpus_format')}, expected {CORPUS_FORMAT}")
+        self.root = root
+
+    def __len__(self) -> int:
+        return sum(1 for _ in (self.root / "responses").glob("*.json"))
+
+    def lookup(self, url: str) -> tuple[dict[str, Any], bytes] | None:
+        try:
+            entry = json.loads((self.root / "responses" / f"{url_key(corpus_lookup_url(url))}.json").read_text(encoding="utf-8"))
+            body_sha256 = entry["body_sha256"]
+            body = (self.root / "bodies" / body_sha256[:2] / body_sha256).read_bytes() if body_sha256 else b""
+        except (OSError, ValueError, KeyError):
+            return None
+        return entry, body
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: ReplayServer
+
+    def do_GET(self) -> None:
+        source_url = source_url_for_path(self.path)
+        fault = self.server.next_fault()
+        if fault == "drop":
+            # No status line at all: the client sees the connection reset mid-request.
+            self.close_connection = True
+            return
+        if fault == "error":
+            self._send(self.server.error_status, {"retry-after": "0"}, b"")
+            return
+        found = self.server.corpus.lookup(source_url)
+        if found is None:
+            self.server.count("misses")
+            self._send(404, {}, b"")
+            return
+        entry, body = found
+        if entry["error"]:
+            self.close_connection = True
+            return
+        headers = dict(entry["headers"])
+        if "location" in headers:
+            location = urljoin(source_url, headers["location"])
+            headers["location"] = replay_request_url(location, self.server.base_url)
+        etag = headers.get("etag", "")
+        if etag and self.headers.get("If-None-Match") == etag:
+            self._send(304, {"etag": etag}, b"")
+            return
+        self._send(int(entry["status"]), headers, body)
+
+    def _send(self, status: int, headers: dict[str, str], body: bytes) -> None:
+        self.server.count("responses")
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        corpus_dir: Path,
+        *,
+        port: int = 0,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        drop_rate: float = 0.0,
+        seed: int = 23,
+    ) -> None:
+        self.corpus = ReplayCorpus(corpus_dir)
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.drop_rate = drop_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "responses": 0, "misses": 0, "injected_errors": 0, "dropped": 0}
+        self._thread: threading.Thread | None = None
+        super().__init__(("127.0.0.1", port), ReplayHandler)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def next_fault(self) -> str:
+        # Draw every random number under the lock so a seed reproduces the same fault sequence.
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = max(self.latency_ms + self._rng.uniform(-1, 1) * self.latency_jitter_ms, 0.0) / 1000
+            roll = self._rng.random()
+            fault = "drop" if roll < self.drop_rate else "error" if roll < self.drop_rate + self.error_rate else ""
+            if fault == "drop":
+                self.stats["dropped"] += 1
+            elif fault == "error":
+                self.stats["injected_errors"] += 1
+        if delay:
+            time.sleep(delay)
+        return fault
+
+    def __enter__(self) -> ReplayServer:
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.1,), name="concierge-replay", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def replicate_queue(rows: list[dict[str, str]], copies: int) -> list[dict[str, str]]:
+    """The queue repeated `copies` times; each extra copy moves its rows onto replica-<n>. hosts."""
+    replicated = list(rows)
+    for copy in range(1, copies):
+        for row in rows:
+            parts = urlsplit(row["source_url"].strip())
+            url = urlunsplit((parts.scheme, f"replica-{copy}.{parts.netloc}", parts.path, parts.query, parts.fragment))
+            replicated.append({**row, "source_url": url})
+    return replicated
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve a recorded concierge corpus locally or multiply a seed queue for load tests.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_cmd = subparsers.add_parser("serve", help="Serve a corpus recorded with concierge_pipeline.py --record-corpus")
+    serve_cmd.add_argument("--corpus-dir", type=Path, required=True, help="Recorded corpus directory")
+    serve_cmd.add_argument("--port", type=int, default=0, help="Port to listen on (0 picks a free port)")
+    serve_cmd.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per response")
+    serve_cmd.add_argument("--latency-jitter-ms", type=float, default=0.0, help="Uniform +/- jitter on the added latency")
+    serve_cmd.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with --error-status")
+    serve_cmd.add_argument("--error-status", type=int, default=503, help="Status code for injected errors")
+    serve_cmd.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of requests whose connection is dropped")
+    serve_cmd.add_argument("--seed", type=int, default=23, help="Seed for latency jitter and fault injection")
+
+    queue_cmd = subparsers.add_parser("queue", help="Write a seed queue multiplied onto replica hosts")
+    queue_cmd.add_argument("--input", type=Path, required=True, help="Seed queue CSV whose pages were recorded")
+    queue_cmd.add_argument("--copies", type=int, required=True, help="Total copies of the queue (10 gives 10x the rows)")
+    queue_cmd.add_argument("--output", type=Path, required=True, help="Multiplied seed queue CSV")
+
+    args = parser.parse_args(argv)
+    if args.command == "queue":
+        if args.copies < 1:
+            parser.error("--copies must be at least 1")
+        with args.input.open(newline="", encoding="utf-8") as fh:
+            reader = csv.DictReader(fh)
+            fieldnames = list(reader.fieldnames or [])
+            rows = list(reader)
+        replicated = replicate_queue(rows, args.copies)
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with args.output.open("w", newline="", encoding="utf-8") as fh:
+            writer = csv.DictWriter(fh, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(replicated)
+        print(f"Wrote {len(replicated)} rows to {args.output}")
+        return 0
+
+    for name in ("error_rate", "drop_rate"):
+        if not 0 <= getattr(args, name) <= 1:
+            parser.error(f"--{name.replace('_', '-')} must be between 0 and 1")
+    if args.error_rate + args.drop_rate > 1:
+        parser.error("--error-rate plus --drop-rate must not exceed 1")
+    try:
+        server = ReplayServer(
+            args.corpus_dir,
+            port=args.port,
+            latency_ms=args.latency_ms,
+            latency_jitter_ms=args.latency_jitter_ms,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            drop_rate=args.drop_rate,
+            seed=args.seed,
+        )
+    except ValueError as exc:
+        parser.error(f"--corpus-dir: {exc}")
+    with server:
+        print(f"Replaying {len(server.corpus)} recorded responses at {server.base_url}", flush=True)
+        print(f"Run: python scripts/concierge_pipeline.py --replay-url {server.base_url}", flush=True)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    print(json.dumps(server.stats, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Fetch retry classification, jittered backoff, per-host circuit breaking and
+the run-level fetch deadline.
+
+Failures are sorted into classes so only transient ones (connection drops,
+timeouts, TLS resets, 429 and 5xx responses) are retried, with full-jitter
+exponential backoff that honours Retry-After. A per-host circuit breaker
+stops sending requests to a host after repeated host-level failures and lets
+a single probe through once its cool-down has passed. A run deadline caps
+every request timeout and retry wait at the time left in the run's budget.
+"""
+from __future__ import annotations
+
+import random
+import socket
+import ssl
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http.client import HTTPException
+from typing import Any, Callable
+from urllib.error import HTTPError, URLError
+
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 8.0
+DEFAULT_MAX_RETRY_AFTER = 30.0
+DEFAULT_BREAKER_THRESHOLD = 5
+DEFAULT_BREAKER_COOLDOWN = 60.0
+RETRYABLE_FAILURES = frozenset({"connect", "reset", "timeout", "tls", "http_429", "http_5xx"})
+# Failures that say the host itself is unhealthy; a 404 or 429 is a live host answering.
+HOST_FAILURES = frozenset({"connect", "reset", "timeout", "tls", "http_5xx"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    backoff_base: float = DEFAULT_BACKOFF_BASE
+    backoff_max: float = DEFAULT_BACKOFF_MAX
+    max_retry_after: float = DEFAULT_MAX_RETRY_AFTER
+
+    def delay(self, attempt: int, retry_after: float | None = None, rng: random.Random | None = None) -> float | None:
+        """Seconds to wait before retry number `attempt` (1-based), or None when Retry-After is too long to wait."""
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_retry_after else None
+        # Full jitter: concurrent rows failing on one host spread their retries instead of stampeding it.
+        return (rng or random).uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+
+def classify_fetch_error(exc: BaseException) -> str:
+    if isinstance(exc, HTTPError):
+        if exc.code == 429:
+            return "http_429"
+        if exc.code >= 500:
+            return "http_5xx"
+        return "http_4xx"
+    reason: Any = exc.reason if isinstance(exc, URLError) else exc
+    if isinstance(reason, ssl.SSLCertVerificationError):
+        return "tls_certificate"
+    if isinstance(reason, (ssl.SSLEOFError, ssl.SSLZeroReturnError)):
+        return "reset"
+    if isinstance(reason, ssl.SSLError):
+        return "tls"
+    if isinstance(reason, (socket.timeout, TimeoutError)):
+        return "timeout"
+    if isinstance(reason, socket.gaierror):
+        return "dns"
+    if isinstance(reason, (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, HTTPException)):
+        return "reset"
+    if isinstance(reason, OSError):
+        return "connect"
+    return "other"
+
+
+def retry_after_seconds(headers: Any, now: float | None = None) -> float | None:
+    value = (headers.get("Retry-After") if headers is not None else None) or ""
+    value = value.strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    current = datetime.fromtimestamp(time.time() if now is None else now, timezone.utc)
+    return max((when - current).total_seconds(), 0.0)
+
+
+class RunDeadline:
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.seconds = seconds
+        self._clock = clock
+        self.expires_at = clock() + seconds
+
+    def remaining(self) -> float:
+        return self.expires_at - self._clock()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def request_timeout(self, timeout: float) -> float | None:
+        """The per-request timeout shrunk to the time left, or None once the deadline has passed."""
+        remaining = self.remaining()
+        return min(timeout, remaining) if remaining > 0 else None
+
+
+@dataclass
+class HostCircuit:
+    consecutive_failures: int = 0
+    opened_at: float | None = None
+    probing: bool = False
+    times_opened: int = 0
+    rejected: int = 0
+
+
+class CircuitBreaker:
+    def __init__(self, threshold: int = DEFAULT_BREAKER_THRESHOLD, cooldown: float = DEFAULT_BREAKER_COOLDOWN) -> None:
+        self.threshold = max(threshold, 1)
+        self.cooldown = cooldown
+        self._hosts: dict[str, HostCircuit] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, host: str, now: float | None = None) -> bool:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            circuit = self._hosts.setdefault(host, HostCircuit())
+            if circuit.opened_at is None:
+                return True
+            if not circuit.probing and now - circuit.opened_at >= self.cooldown:
+                # Half-open: one request tests the host; its outcome closes or re-opens the circuit.
+                circuit.probing = True
+                return True
+            circuit.rejected += 1
+            return False
+
+    def record(self, host: str, failed: bool, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            circuit = self._hosts.setdefault(host, HostCircuit())
+            circuit.probing = False
+            if not failed:
+                circuit.consecutive_failures = 0
+                circuit.opened_at = None
+                return
+            circuit.consecutive_failures += 1
+            if circuit.consecutive_failures >= self.threshold:
+                if circuit.opened_at is None:
+                    circuit.times_opened += 1
+                circuit.opened_at = now
+
+    def release_probe(self, host: str) -> None:
+        """End a half-open probe without an outcome, so the next request after the cool-down probes again."""
+        with self._lock:
+            circuit = self._hosts.get(host)
+            if circuit is not None:
+                circuit.probing = False
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            tripped = sorted((item for item in self._hosts.items() if item[1].times_opened), key=lambda item: item[0])
+            return {
+                "threshold": self.threshold,
+                "cooldown_seconds": self.cooldown,
+                "hosts_opened": [
+                    {
+                        "host": host,
+                        "times_opened": circuit.times_opened,
+                        "rejected_requests": circuit.rejected,
+                        "open": circuit.opened_at is not None,
+                    }
+                    for host, circuit in tripped
+                ],
+            }
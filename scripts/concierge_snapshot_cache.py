@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Local HTML snapshot cache for the concierge seed pipeline.
+
+Decoded response bodies are stored content-addressed under blobs/ and indexed by
+source URL under index/, together with the final URL, headers, charset and the
+HTTP validators needed for conditional revalidation.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+# Bodies are stored decoded, so headers describing the encoded wire body are not kept.
+WIRE_BODY_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def stored_headers(headers: dict[str, str]) -> dict[str, str]:
+    return {key.lower(): value for key, value in headers.items() if key.lower() not in WIRE_BODY_HEADERS}
+
+
+class SnapshotCacheMiss(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class CachedSnapshot:
+    url: str
+    final_url: str
+    status: int
+    headers: dict[str, str]
+    content_type: str
+    charset: str
+    body_sha256: str
+    fetched_at: float
+    body: bytes
+
+    @property
+    def etag(self) -> str:
+        return self.headers.get("etag", "")
+
+    @property
+    def last_modified(self) -> str:
+        return self.headers.get("last-modified", "")
+
+
+def url_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+class SnapshotCache:
+    def __init__(self, root: Path, max_age: float = 0.0, offline: bool = False) -> None:
+        self.root = root
+        self.max_age = max_age
+        self.offline = offline
+
+    def _index_path(self, url: str) -> Path:
+        return self.root / "index" / f"{url_key(url)}.json"
+
+    def _blob_path(self, body_sha256: str) -> Path:
+        return self.root / "blobs" / body_sha256[:2] / body_sha256
+
+    def lookup(self, url: str) -> CachedSnapshot | None:
+        index_path = self._index_path(url)
+        try:
+            entry = json.loads(index_path.read_text(encoding="utf-8"))
+            body = self._blob_path(entry["body_sha256"]).read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+        if hashlib.sha256(body).hexdigest() != entry["body_sha256"]:
+            return None
+        return CachedSnapshot(
+            url=entry["url"],
+            final_url=entry["final_url"],
+            status=int(entry["status"]),
+            # Entries written before wire headers were dropped still carry them.
+            headers=stored_headers(entry.get("headers") or {}),
+            content_type=entry.get("content_type", ""),
+            charset=entry.get("charset", "utf-8"),
+            body_sha256=entry["body_sha256"],
+            fetched_at=float(entry["fetched_at"]),
+            body=body,
+        )
+
+    def is_fresh(self, snapshot: CachedSnapshot, now: float | None = None) -> bool:
+        if self.max_age <= 0:
+            return False
+        return ((now if now is not None else time.time()) - snapshot.fetched_at) <= self.max_age
+
+    def conditional_headers(self, snapshot: CachedSnapshot) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if snapshot.etag:
+            headers["If-None-Match"] = snapshot.etag
+        if snapshot.last_modified:
+            headers["If-Modified-Since"] = snapshot.last_modified
+        return headers
+
+    def _write_index(self, snapshot: CachedSnapshot) -> None:
+        entry: dict[str, Any] = {
+            "url": snapshot.url,
+            "final_url": snapshot.final_url,
+            "status": snapshot.status,
+            "headers": snapshot.headers,
+            "content_type": snapshot.content_type,
+            "charset": snapshot.charset,
+            "body_sha256": snapshot.body_sha256,
+            "fetched_at": snapshot.fetched_at,
+        }
+        atomic_write_bytes(
+            self._index_path(snapshot.url),
+            json.dumps(entry, indent=2, sort_keys=True).encode("utf-8"),
+        )
+
+    def store(
+        self,
+        url: str,
+        *,
+        final_url: str,
+        status: int,
+        headers: dict[str, str],
+        content_type: str,
+        charset: str,
+        body: bytes,
+    ) -> CachedSnapshot:
+        body_sha256 = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(body_sha256)
+        if not blob_path.exists():
+            atomic_write_bytes(blob_path, body)
+        snapshot = CachedSnapshot(
+            url=url,
+            final_url=final_url,
+            status=status,
+            headers=stored_headers(headers),
+            content_type=content_type,
+            charset=charset,
+            body_sha256=body_sha256,
+            fetched_at=time.time(),
+            body=body,
+        )
+        self._write_index(snapshot)
+        return snapshot
+
+    def refresh(self, snapshot: CachedSnapshot, headers: dict[str, str] | None = None) -> CachedSnapshot:
+        merged_headers = dict(snapshot.headers)
+        for key, value in (headers or {}).items():
+            if key.lower() in {"etag", "last-modified", "cache-control", "expires", "date"}:
+                merged_headers[key.lower()] = value
+        refreshed = CachedSnapshot(
+            url=snapshot.url,
+            final_url=snapshot.final_url,
+            status=snapshot.status,
+            headers=merged_headers,
+            content_type=snapshot.content_type,
+            charset=snapshot.charset,
+            body_sha256=snapshot.body_sha256,
+            fetched_at=time.time(),
+            body=snapshot.body,
+        )
+        self._write_index(refreshed)
+        return refreshed
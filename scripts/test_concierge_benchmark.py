@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Focused verification for the concierge pipeline benchmark and its baseline diff."""
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import concierge_benchmark  # noqa: E402
+
+
+def stage(seconds: float) -> dict[str, float]:
+    return {"seconds": seconds}
+
+
+def test_baseline_comparison_flags_slowdowns_beyond_tolerance_and_noise():
+    baseline = {"stages": {"a": stage(1.0), "b": stage(1.0), "c": stage(0.001), "d": stage(1.0), "gone": stage(1.0)}}
+    report = {"stages": {"a": stage(1.5), "b": stage(1.1), "c": stage(0.002), "d": stage(0.5), "new": stage(1.0)}}
+    comparison = concierge_benchmark.compare_to_baseline(report, baseline, tolerance=0.2)
+    assert [entry["stage"] for entry in comparison["regressions"]] == ["a"]
+    assert comparison["regressions"][0]["ratio"] == 1.5
+    assert [entry["stage"] for entry in comparison["improvements"]] == ["d"]
+    assert comparison["new_stages"] == ["new"]
+    assert comparison["missing_stages"] == ["gone"]
+
+
+def test_pipeline_benchmark_times_every_stage_on_a_small_synthetic_corpus():
+    report = concierge_benchmark.benchmark_pipeline_stages((3, 5), (20,), repeat=1, workers=2)
+    stages = report["stages"]
+    for name in (
+        "load_councils_and_suburbs/parse",
+        "load_councils_and_suburbs/cached",
+        "parse_snapshot",
+        "infer_taxonomy",
+        "infer_address_locality",
+        "resolve_suburb",
+        "build_review_artifact/rows=3/inventory=20",
+        "build_review_artifact/rows=5/inventory=20",
+        "write_csv/rows=5",
+        "write_mapping_csv/rows=5",
+    ):
+        assert stages[name]["seconds"] >= 0, name
+    assert stages["parse_snapshot"]["items"] == 5
+    assert report["replay_requests"] == 8
+
+    with tempfile.TemporaryDirectory(prefix="dtd-bench-") as tmp:
+        baseline_path = Path(tmp) / "baseline.json"
+        slow = {"stages": {name: {"seconds": value["seconds"] + 10} for name, value in stages.items()}}
+        baseline_path.write_text(json.dumps(slow), encoding="utf-8")
+        exit_code = concierge_benchmark.main(
+            ["pipeline", "--rows", "2", "--inventory", "10", "--repeat", "1", "--baseline", str(baseline_path)]
+        )
+    assert exit_code == 0
+
+
+if __name__ == "__main__":
+    test_baseline_comparison_flags_slowdowns_beyond_tolerance_and_noise()
+    test_pipeline_benchmark_times_every_stage_on_a_small_synthetic_corpus()
+    print("OK test_concierge_benchmark.py")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Focused verification for the concierge checkpoint journal."""
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import concierge_checkpoint  # noqa: E402
+
+
+def queue_row(index: int) -> dict[str, str]:
+    return {"source_url": f"https://t{index}.example/", "business_name_hint": f"Trainer {index}", "suburb_hint": "Carlton"}
+
+
+def test_journal_replays_completed_rows_and_drops_a_torn_tail():
+    with tempfile.TemporaryDirectory(prefix="dtd-checkpoint-") as tmp:
+        path = Path(tmp) / "out" / "checkpoint.jsonl"
+        with concierge_checkpoint.CheckpointJournal(path, "run-a") as journal:
+            for index in range(3):
+                journal.record(queue_row(index), {"business_name": f"Trainer {index}", "evidence": {"phone": ["body"]}})
+        with path.open("ab") as fh:
+            fh.write(b'{"key":"[\\"https://t3.example/\\"')
+
+        resumed = concierge_checkpoint.CheckpointJournal(path, "run-a", resume=True)
+        assert resumed.replayed == 3
+        assert resumed.lookup(queue_row(1)) == {"business_name": "Trainer 1", "evidence": {"phone": ["body"]}}
+        assert resumed.lookup(dict(queue_row(1), service_hint=" ", notes="ignored")) is not None
+        assert resumed.lookup(queue_row(3)) is None
+        with resumed:
+            resumed.record(queue_row(3), {"business_name": "Trainer 3"})
+
+        again = concierge_checkpoint.CheckpointJournal(path, "run-a", resume=True)
+        assert again.replayed == 4
+        assert path.read_bytes().count(b"\n") == 5
+
+
+def test_journal_rejects_other_runs_and_starts_fresh_without_one():
+    with tempfile.TemporaryDirectory(prefix="dtd-checkpoint-") as tmp:
+        path = Path(tmp) / "checkpoint.jsonl"
+        fresh = concierge_checkpoint.CheckpointJournal(path, "run-a", resume=True)
+        assert fresh.replayed == 0
+        with fresh:
+            fresh.record(queue_row(0), {})
+
+        try:
+            concierge_checkpoint.CheckpointJournal(path, "run-b", resume=True)
+        except concierge_checkpoint.CheckpointMismatch as exc:
+            assert "different input or fetch options" in str(exc)
+        else:
+            raise AssertionError("Expected a checkpoint from another run to be rejected")
+
+        with concierge_checkpoint.CheckpointJournal(path, "run-b"):
+            pass
+        assert concierge_checkpoint.CheckpointJournal(path, "run-b", resume=True).replayed == 0
+        with concierge_checkpoint.CheckpointJournal(path, "run-b") as finished:
+            finished.record(queue_row(1), {"business_name": "Trainer 1"})
+        finished.promote(Path(tmp) / "store.jsonl")
+        assert not path.exists()
+        header, completed, _ = concierge_checkpoint.read_journal(Path(tmp) / "store.jsonl")
+        assert header["run_key"] == "run-b"
+        assert list(completed.values()) == [{"business_name": "Trainer 1"}]
+
+
+if __name__ == "__main__":
+    test_journal_replays_completed_rows_and_drops_a_torn_tail()
+    test_journal_rejects_other_runs_and_starts_fresh_without_one()
+    print("OK test_concierge_checkpoint.py")
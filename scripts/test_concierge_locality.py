@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Focused verification for the concierge locality matchers."""
+from __future__ import annotations
+
+import math
+import random
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import concierge_locality  # noqa: E402
+
+
+def test_phrase_matcher_finds_overlapping_word_bounded_phrases():
+    matcher = concierge_locality.PhraseMatcher(
+        [
+            ("City of Yarra", "yarra"),
+            ("Shire of Yarra Ranges", "yarra_ranges"),
+            ("Yarra Ranges", "ranges"),
+            ("City of Merri-bek", "merri_bek"),
+            ("Kew", "kew"),
+            ("Kew East", "kew_east"),
+        ]
+    )
+
+    text = "Serving the Shire of Yarra Ranges, City of Merri bek and KEW EAST. Not Kewell or Yarraville."
+    assert matcher.find_all(text) == ["yarra_ranges", "ranges", "merri_bek", "kew", "kew_east"]
+    assert matcher.matched("city of yarra - City of Yarra") == ["yarra"]
+    assert matcher.find_all("Kew. East Melbourne") == ["kew"]
+    assert matcher.find_all("City of Yarra's parks") == ["yarra"]
+    assert matcher.find_all("") == []
+
+
+def test_phrase_matcher_uses_failure_links_for_shared_prefixes():
+    matcher = concierge_locality.PhraseMatcher(
+        [("St Kilda", "st_kilda"), ("St Kilda East", "st_kilda_east"), ("Kilda East Road", "road")]
+    )
+
+    assert matcher.find_all("st kilda east road") == ["st_kilda", "st_kilda_east", "road"]
+    assert matcher.find_all("St St Kilda") == ["st_kilda"]
+
+
+def test_trigram_index_ranks_misspellings_and_ignores_word_order():
+    index = concierge_locality.TrigramIndex(
+        [(name, name) for name in ("Fitzroy", "Fitzroy North", "St Kilda", "East St Kilda", "Richmond", "Kew")]
+    )
+
+    assert [name for _, name in index.search("Fitzory", limit=2)] == ["Fitzroy", "Fitzroy North"]
+    assert index.search("St Kilda East", limit=1) == [(1.0, "East St Kilda")]
+    assert index.search("kew", limit=1) == [(1.0, "Kew")]
+    assert [name for _, name in index.search("Richmnd", min_similarity=0.3)] == ["Richmond"]
+    assert index.search("Zzz") == []
+    assert index.search("") == []
+
+
+def test_centroid_grid_nearest_matches_linear_scan():
+    rng = random.Random(15)
+    points = [(rng.uniform(-38.4, -37.4), rng.uniform(144.4, 145.9), index) for index in range(400)]
+    points.append((points[0][0], points[0][1], "twin"))
+    grid = concierge_locality.CentroidGrid(points)
+
+    def linear(latitude: float, longitude: float, limit: int, max_km: float | None) -> list:
+        x, y = grid.project(latitude, longitude)
+        hits = []
+        for order, (lat, lon, value) in enumerate(points):
+            px, py = grid.project(lat, lon)
+            distance = math.hypot(px - x, py - y)
+            if max_km is None or distance <= max_km:
+                hits.append((distance, order, value))
+        return [value for _, _, value in sorted(hits)[:limit]]
+
+    for _ in range(200):
+        latitude, longitude = rng.uniform(-38.8, -37.0), rng.uniform(144.0, 146.3)
+        for limit, max_km in ((1, None), (5, None), (3, 6.0)):
+            assert [value for _, value in grid.nearest(latitude, longitude, limit, max_km)] == linear(latitude, longitude, limit, max_km)
+    assert [value for _, value in grid.nearest(points[0][0], points[0][1], 2)] == [0, "twin"]
+    assert grid.nearest(0.0, 0.0, 1, max_km=50) == []
+    assert concierge_locality.CentroidGrid([]).nearest(-37.8, 145.0) == []
+
+
+if __name__ == "__main__":
+    test_phrase_matcher_finds_overlapping_word_bounded_phrases()
+    test_phrase_matcher_uses_failure_links_for_shared_prefixes()
+    test_trigram_index_ranks_misspellings_and_ignores_word_order()
+    test_centroid_grid_nearest_matches_linear_scan()
+    print("OK test_concierge_locality.py")
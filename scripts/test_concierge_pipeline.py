@@ -3,17 +3,31 @@
 from __future__ import annotations
 
 import csv
+import io
 import json
+import pickle
+import re
+import subprocess
 import sys
 import tempfile
+import threading
+import time
+import tracemalloc
+import zlib
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Iterator
 from unittest.mock import patch
+from urllib.error import URLError
 from urllib.parse import urlparse
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT / "scripts"))
 
 import concierge_pipeline  # noqa: E402
+import concierge_profile  # noqa: E402
+import concierge_replay  # noqa: E402
 
 PILOT_CSV = REPO_ROOT / "data" / "concierge_seed_queue_inner_melbourne_pilot_19.csv"
 SUBURBS_SQL = REPO_ROOT / "supabase" / "data-import.sql"
@@ -23,7 +37,12 @@ def load_csv_rows(path: Path) -> list[dict[str, str]]:
     return list(csv.DictReader(path.read_text(encoding="utf-8").splitlines()))
 
 
-def fake_extract_page_fields(url: str, business_name_hint: str, service_hint: str) -> dict[str, object]:
+def fake_extract_page_fields(
+    url: str,
+    business_name_hint: str,
+    service_hint: str,
+    fetch_options: concierge_pipeline.FetchOptions | None = None,
+) -> dict[str, object]:
     parsed = urlparse(url)
     safe_domain = parsed.netloc[4:] if parsed.netloc.startswith("www.") else parsed.netloc
     domain_score = sum(ord(char) for char in safe_domain) % 1000
@@ -72,6 +91,67 @@ def fake_extract_page_fields(url: str, business_name_hint: str, service_hint: st
     }
 
 
+class LocalPageHandler(BaseHTTPRequestHandler):
+    pages: dict[str, dict[str, object]] = {}
+    requests: list[dict[str, str]] = []
+
+    def do_GET(self) -> None:
+        self.requests.append({"path": self.path, **{key.lower(): value for key, value in self.headers.items()}})
+        page = self.pages.get(self.path)
+        if page is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        failures = page.get("fail_with")
+        if failures:
+            self.send_response(int(failures.pop(0)))
+            self.send_header("Retry-After", str(page.get("retry_after", "0")))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = str(page.get("etag", ""))
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = str(page["body"]).encode("utf-8")
+        encoding = str(page.get("encoding", ""))
+        if encoding == "gzip" and "gzip" in self.headers.get("Accept-Encoding", ""):
+            compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+            body = compressor.compress(body) + compressor.flush()
+        else:
+            encoding = ""
+        self.send_response(int(page.get("status", 200)))
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if etag:
+            self.send_header("ETag", etag)
+        if "location" in page:
+            self.send_header("Location", str(page["location"]))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+@contextmanager
+def serve_pages(pages: dict[str, dict[str, object]]) -> Iterator[tuple[str, list[dict[str, str]]]]:
+    handler = type("Handler", (LocalPageHandler,), {"pages": pages, "requests": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", handler.requests
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 def fake_inventory_snapshot(
     records: list[concierge_pipeline.ExistingInventoryRecord] | None = None,
     *,
@@ -143,6 +223,167 @@ def test_rejects_out_of_catchment_suburb_hints_before_fetch():
             raise AssertionError("Expected parse_seed_queue to reject out-of-catchment suburb hints")
 
 
+def test_rejection_suggests_catchment_suburbs_for_misspelled_hints():
+    with tempfile.TemporaryDirectory(prefix="dtd-concierge-misspelled-") as tmp:
+        temp_csv = Path(tmp) / "queue.csv"
+        temp_csv.write_text(
+            "\n".join(
+                [
+                    "source_url,business_name_hint,suburb_hint,service_hint,notes",
+                    "https://example.com/listing,Example Trainer,Fitz,private training,",
+                ]
+            ),
+            encoding="utf-8",
+        )
+
+        # Too far from any catchment suburb to auto-correct, so it is rejected with suggestions.
+        try:
+            concierge_pipeline.parse_seed_queue(temp_csv)
+        except SystemExit as exc:
+            assert str(exc).endswith("catchment: Fitz (did you mean Fitzroy?)")
+        else:
+            raise AssertionError("Expected parse_seed_queue to reject misspelled suburb hints")
+
+
+def test_misspelled_suburb_hints_auto_resolve_as_advisory():
+    canon = concierge_pipeline.load_councils_and_suburbs()
+    assert concierge_pipeline.correct_suburb_hint("Fitzory", canon)[0] == "Fitzroy"
+    assert concierge_pipeline.correct_suburb_hint("collingwod", canon)[0] == "Collingwood"
+    # A dropped or extra word is a different suburb, and ties have no clear winner.
+    assert concierge_pipeline.correct_suburb_hint("St Kilda East", canon) is None
+    assert concierge_pipeline.correct_suburb_hint("Melborne", canon) is None
+    # A sole candidate still needs to be close: a truncated name is not a typo.
+    assert concierge_pipeline.correct_suburb_hint("Fitz", canon) is None
+    assert [name for _, name in concierge_pipeline.suggest_suburbs("St Kilda East", canon)][0] == "St Kilda"
+
+    rows = [
+        {"source_url": "https://fitzroy.example/", "business_name_hint": "Fitzroy Dogs", "suburb_hint": "Fitzory", "service_hint": "private training", "notes": ""},
+        {"source_url": "https://stkilda.example/", "business_name_hint": "Kilda Dogs", "suburb_hint": "St Kilda East", "service_hint": "private training", "notes": ""},
+    ]
+    with patch.object(concierge_pipeline, "extract_page_fields", side_effect=fake_extract_page_fields):
+        artifact = concierge_pipeline.build_review_artifact(rows, canon, PILOT_CSV, [], fake_inventory_snapshot()[1])
+
+    corrected, unresolved = artifact["records"]
+    assert corrected["locality"]["resolved_suburb"] == "Fitzroy"
+    assert corrected["locality"]["suburb_hint_correction"] == "Fitzroy"
+    assert corrected["publish_status"] == "needs_review"
+    assert any(warning.startswith("suburb hint 'Fitzory' auto-resolved to 'Fitzroy'") for warning in corrected["publish_readiness_warnings"])
+    assert unresolved["locality"]["resolved_suburb"] == ""
+    assert unresolved["publish_status"] == "blocked"
+    assert "no canonical suburb match for hint 'St Kilda East' (did you mean St Kilda" in " ".join(unresolved["publish_readiness_warnings"])
+
+
+def test_seed_queue_reader_accepts_misspelled_catchment_hints_as_advisory_corrections():
+    canon = concierge_pipeline.load_councils_and_suburbs()
+    with tempfile.TemporaryDirectory(prefix="dtd-queue-correct-") as tmp:
+        queue_path = Path(tmp) / "queue.csv"
+        queue_path.write_text(
+            "source_url,business_name_hint,suburb_hint,service_hint,notes\n"
+            "https://fitzroy.example/,Fitzroy Dogs,Fitzory,private training,\n"
+            "https://fitz.example/,Fitz Dogs,Fitz,private training,\n",
+            encoding="utf-8",
+        )
+        reader = concierge_pipeline.SeedQueueReader(queue_path, canon)
+        with patch.object(concierge_pipeline, "extract_page_fields", side_effect=fake_extract_page_fields):
+            artifact = concierge_pipeline.build_review_artifact(reader, canon, queue_path, [], fake_inventory_snapshot()[1])
+
+    assert reader.rows_accepted == 1
+    assert len(reader.errors) == 1 and "suburb_hint outside the approved Inner Melbourne catchment: Fitz (did you mean Fitzroy" in reader.errors[0]
+    (record,) = artifact["records"]
+    assert record["locality"]["resolved_suburb"] == "Fitzroy"
+    assert record["locality"]["suburb_hint_correction"] == "Fitzroy"
+    assert record["publish_status"] == "needs_review"
+    assert any(warning.startswith("suburb hint 'Fitzory' auto-resolved to 'Fitzroy'") for warning in record["publish_readiness_warnings"])
+
+
+def test_rejected_queue_rows_keep_csv_numbering_for_row_indexes_and_duplicates():
+    canon = concierge_pipeline.load_councils_and_suburbs()
+    with tempfile.TemporaryDirectory(prefix="dtd-queue-numbering-") as tmp:
+        queue_path = Path(tmp) / "queue.csv"
+        queue_path.write_text(
+            "source_url,business_name_hint,suburb_hint,service_hint,notes\n"
+            "https://example.com/a,Trainer A,Carlton,private training,\n"
+            "ftp://example.com/b,Trainer B,Carlton,private training,\n"
+            "https://example.com/c,Trainer C,Carlton,private training,\n",
+            encoding="utf-8",
+        )
+        reader = concierge_pipeline.SeedQueueReader(queue_path, canon)
+        with patch.object(concierge_pipeline, "extract_page_fields", side_effect=fake_extract_page_fields):
+            artifact = concierge_pipeline.build_review_artifact(reader, canon, queue_path, [], fake_inventory_snapshot()[1])
+
+    assert [record["input_row_index"] for record in artifact["records"]] == [1, 3]
+    assert "domain+locality duplicates row 1 (example.com / Carlton)" in artifact["records"][1]["duplicate_warnings"]
+
+def test_seed_queue_reader_collects_every_row_error():
+    with tempfile.TemporaryDirectory(prefix="dtd-concierge-row-errors-") as tmp:
+        temp_csv = Path(tmp) / "queue.csv"
+        temp_csv.write_text(
+            "\n".join(
+                [
+                    "source_url,business_name_hint,suburb_hint,service_hint,notes",
+                    "https://example.com/a,Trainer A,Carlton,private training,",
+                    "ftp://example.com/b,Trainer B,Werribee,private training,",
+                    "https://example.com/a,Trainer A again,Carlton,private training,",
+                    "https://example.com/c",
+                    "https://example.com/d,Trainer D,Fitzroy,private training,",
+                ]
+            ),
+            encoding="utf-8",
+        )
+
+        reader = concierge_pipeline.SeedQueueReader(temp_csv)
+        assert [row["source_url"] for row in reader] == ["https://example.com/a", "https://example.com/d"]
+        assert [error.split(" in ")[0] for error in reader.errors] == ["Row 2", "Row 2", "Duplicate approved source_url", "Row 4"]
+        assert "non-approved source_url" in reader.errors[0]
+        assert reader.errors[1].endswith("catchment: Werribee")
+        assert reader.errors[2] == "Duplicate approved source_url in queue at row 3: https://example.com/a"
+        assert reader.summary() == {"rows_read": 5, "rows_accepted": 2, "rows_rejected": 3, "errors": reader.errors}
+
+        try:
+            concierge_pipeline.parse_seed_queue(temp_csv)
+        except SystemExit as exc:
+            assert str(exc).splitlines() == [f"Input queue {temp_csv} has 4 invalid row error(s) in 5 rows:"] + [
+                f"  {error}" for error in reader.errors
+            ]
+        else:
+            raise AssertionError("Expected parse_seed_queue to report every invalid row")
+
+
+def test_seed_queue_reader_feeds_fetch_before_the_queue_is_read():
+    rows_read_at_fetch: list[int] = []
+
+    with tempfile.TemporaryDirectory(prefix="dtd-concierge-streaming-") as tmp:
+        temp_csv = Path(tmp) / "queue.csv"
+        lines = ["source_url,business_name_hint,suburb_hint,service_hint,notes"]
+        lines += [f"https://host{index}.example/,Trainer {index},Carlton,private training," for index in range(200)]
+        lines.append("not-a-url,Trainer X,Carlton,private training,")
+        temp_csv.write_text("\n".join(lines), encoding="utf-8")
+        reader = concierge_pipeline.SeedQueueReader(temp_csv)
+
+        def record_extract(
+            url: str,
+            business_name_hint: str,
+            service_hint: str,
+            fetch_options: concierge_pipeline.FetchOptions | None = None,
+        ) -> dict[str, object]:
+            rows_read_at_fetch.append(reader.rows_read)
+            return fake_extract_page_fields(url, business_name_hint, service_hint)
+
+        with patch.object(concierge_pipeline, "extract_page_fields", side_effect=record_extract):
+            artifact = concierge_pipeline.build_review_artifact(
+                reader,
+                concierge_pipeline.load_councils_and_suburbs(),
+                temp_csv,
+                [],
+                fake_inventory_snapshot()[1],
+                workers=1,
+            )
+
+    assert len(artifact["records"]) == 200
+    assert min(rows_read_at_fetch) <= concierge_pipeline.FETCH_AHEAD_PER_WORKER
+    assert reader.summary()["rows_rejected"] == 1
+
+
 def test_accepts_valid_inner_city_suburb_not_present_in_pilot_batch():
     with tempfile.TemporaryDirectory(prefix="dtd-concierge-inner-city-") as tmp:
         temp_csv = Path(tmp) / "queue.csv"
@@ -162,7 +403,7 @@ def test_accepts_valid_inner_city_suburb_not_present_in_pilot_batch():
 
 
 def test_resolve_suburb_uses_council_evidence_for_ambiguous_localities():
-    councils, suburb_lookup, _ = concierge_pipeline.load_councils_and_suburbs()
+    canon = concierge_pipeline.load_councils_and_suburbs()
     snapshot = {
         "title": "Eltham Dog Training",
         "headings": {"h1": "", "h2": "", "h3": ""},
@@ -176,8 +417,7 @@ def test_resolve_suburb_uses_council_evidence_for_ambiguous_localities():
     match, warnings = concierge_pipeline.resolve_suburb(
         "Eltham",
         snapshot,
-        suburb_lookup,
-        councils,
+        canon,
     )
 
     assert match is not None
@@ -185,6 +425,119 @@ def test_resolve_suburb_uses_council_evidence_for_ambiguous_localities():
     assert warnings == ["resolved ambiguous suburb using council evidence 'Shire of Nillumbik'"]
 
 
+def test_address_locality_resolves_ambiguous_hints_and_flags_mismatches():
+    canon = concierge_pipeline.load_councils_and_suburbs()
+
+    def geo_snapshot(latitude: float, longitude: float) -> dict:
+        return {
+            "title": "Eltham Dog Training",
+            "headings": {"h1": "", "h2": "", "h3": ""},
+            "meta": {},
+            "canonical_url": "",
+            "links": [],
+            "body_text": "",
+            "jsonld": [{"@type": "LocalBusiness", "name": "Trainer", "geo": {"latitude": latitude, "longitude": longitude}}],
+        }
+
+    # North of Eltham the nearest other suburb is Diamond Creek (Nillumbik); west of it, Greensborough (Banyule).
+    for point, council in (((-37.695, 145.150), "Shire of Nillumbik"), ((-37.712, 145.125), "City of Banyule")):
+        snapshot = geo_snapshot(*point)
+        address_locality = concierge_pipeline.infer_address_locality("", snapshot, canon)
+        match, warnings = concierge_pipeline.resolve_suburb("Eltham", snapshot, canon, address_locality)
+        assert match is not None and match.council_name == council
+        assert warnings == ["resolved ambiguous suburb using address proximity (jsonld:Trainer:geo)"]
+        assert concierge_pipeline.address_locality_warnings("Eltham", match, address_locality) == []
+
+    # A postcode centroid maps to candidates but is no evidence about the council boundary.
+    snapshot = dict(geo_snapshot(0, 0), jsonld=[])
+    address_locality = concierge_pipeline.infer_address_locality("1 Main Rd, Eltham VIC 3095", snapshot, canon)
+    assert address_locality.point_source == "postcode 3095" and not address_locality.geocoded
+    assert concierge_pipeline.resolve_suburb("Eltham", snapshot, canon, address_locality)[0] is None
+
+    carlton = canon.suburbs_named("Carlton")[0]
+    address_locality = concierge_pipeline.infer_address_locality("12 Carlton St, Richmond VIC 3121", snapshot, canon)
+    assert [record.name for record in address_locality.named] == ["Richmond"]
+    assert address_locality.nearest[0][1].name == "Richmond"
+    assert concierge_pipeline.address_locality_warnings("Carlton", carlton, address_locality) == [
+        "source address suggests Richmond (3121), not suburb hint 'Carlton'"
+    ]
+    richmond = canon.suburbs_named("Richmond")[0]
+    assert concierge_pipeline.address_locality_warnings("Richmond", richmond, address_locality) == []
+    unknown = concierge_pipeline.infer_address_locality("1 Beach Rd, Bondi NSW 2026", snapshot, canon)
+    assert not unknown.has_signal
+    assert concierge_pipeline.address_locality_warnings("Carlton", carlton, unknown) == []
+
+
+def test_locality_canon_indexes_suburbs_postcodes_and_pairs():
+    canon = concierge_pipeline.load_councils_and_suburbs()
+
+    assert len(canon.suburbs) == len(canon.mapping_rows)
+    assert [record.council_name for record in canon.suburbs_named("ELTHAM")] == [
+        record.council_name for record in canon.suburbs if record.name == "Eltham"
+    ]
+    assert len(canon.suburbs_named("Eltham")) > 1
+    richmond = canon.lookup("richmond", "city of yarra")
+    assert richmond is not None and richmond.name == "Richmond"
+    assert richmond in canon.suburbs_with_postcode(f" {richmond.postcode} ")
+    assert all(record.postcode == richmond.postcode for record in canon.suburbs_with_postcode(richmond.postcode))
+    assert canon.lookup("Richmond", "City of Melbourne") is None
+    assert canon.suburbs_named("Atlantis") == ()
+
+
+def test_locality_canon_cache_skips_parsing_until_a_source_changes():
+    with tempfile.TemporaryDirectory(prefix="dtd-canon-cache-") as tmp:
+        tmp_path = Path(tmp)
+        sql_path = tmp_path / "data-import.sql"
+        mapping_path = tmp_path / "suburbs_councils_mapping.csv"
+        sql_path.write_bytes(SUBURBS_SQL.read_bytes())
+        mapping_path.write_bytes(concierge_pipeline.SUBURB_MAPPING_CSV.read_bytes())
+        cache_dir = tmp_path / "cache"
+
+        cold = concierge_pipeline.load_councils_and_suburbs(cache_dir, sql_path, mapping_path)
+        assert cold == concierge_pipeline.load_councils_and_suburbs(None, sql_path, mapping_path)
+        assert len(list(cache_dir.glob("locality_canon-*.pickle"))) == 1
+
+        with patch.object(concierge_pipeline, "parse_locality_canon", side_effect=AssertionError("warm start re-parsed")):
+            warm = concierge_pipeline.load_councils_and_suburbs(cache_dir, sql_path, mapping_path)
+        assert warm == cold
+        assert warm.lookup("Richmond", "City of Yarra") == cold.lookup("Richmond", "City of Yarra")
+
+        mapping_path.write_bytes(mapping_path.read_bytes() + b"\n")
+        with patch.object(
+            concierge_pipeline,
+            "parse_locality_canon",
+            wraps=concierge_pipeline.parse_locality_canon,
+        ) as parse:
+            concierge_pipeline.load_councils_and_suburbs(cache_dir, sql_path, mapping_path)
+        assert parse.call_count == 1
+        assert len(list(cache_dir.glob("locality_canon-*.pickle"))) == 1
+
+        next(cache_dir.glob("locality_canon-*.pickle")).write_bytes(b"not a pickle")
+        assert concierge_pipeline.load_councils_and_suburbs(cache_dir, sql_path, mapping_path).suburbs
+
+
+def test_import_defers_canon_io_and_optional_backends():
+    probe = (
+        "import builtins, io, sys\n"
+        "opened = []\n"
+        "real_open = io.open\n"
+        "builtins.open = io.open = lambda file, *args, **kwargs: opened.append(str(file)) or real_open(file, *args, **kwargs)\n"
+        "import concierge_pipeline\n"
+        "print(sorted(path for path in opened if path.endswith(('.csv', '.sql'))))\n"
+        "print(concierge_pipeline.default_locality_canon.cache_info().currsize)\n"
+        "print('lxml.etree' in sys.modules, 'multiprocessing' in sys.modules)\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=REPO_ROOT / "scripts",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout.splitlines() == ["[]", "0", "False False"]
+    assert "Richmond" in concierge_pipeline.approved_mvp_catchment_suburbs()
+
+
 def test_pipeline_emits_review_artifact_for_the_canonical_pilot():
     with tempfile.TemporaryDirectory(prefix="dtd-concierge-") as tmp:
         output_dir = Path(tmp)
@@ -225,6 +578,7 @@ def test_pipeline_emits_review_artifact_for_the_canonical_pilot():
             "ready": 19,
             "needs_review": 0,
             "blocked": 0,
+            "deadline_exceeded": 0,
             "total": 19,
         }
         assert artifact["mapping_counts"] == {
@@ -275,7 +629,12 @@ def test_pipeline_processes_only_manual_queue_urls():
     )
     calls: list[str] = []
 
-    def record_extract(url: str, business_name_hint: str, service_hint: str) -> dict[str, object]:
+    def record_extract(
+        url: str,
+        business_name_hint: str,
+        service_hint: str,
+        fetch_options: concierge_pipeline.FetchOptions | None = None,
+    ) -> dict[str, object]:
         calls.append(url)
         return fake_extract_page_fields(url, business_name_hint, service_hint)
 
@@ -311,7 +670,12 @@ def test_duplicate_warnings_use_locality_scoped_multi_signal_matching():
         ]
     )
 
-    def duplicate_extract(url: str, business_name_hint: str, service_hint: str) -> dict[str, object]:
+    def duplicate_extract(
+        url: str,
+        business_name_hint: str,
+        service_hint: str,
+        fetch_options: concierge_pipeline.FetchOptions | None = None,
+    ) -> dict[str, object]:
         return fake_extract_page_fields(url, business_name_hint, service_hint)
 
     with tempfile.TemporaryDirectory(prefix="dtd-concierge-dupe-") as tmp:
@@ -353,7 +717,12 @@ def test_mapping_status_uses_possible_duplicate_without_blocking():
         ]
     )
 
-    def possible_duplicate_extract(url: str, business_name_hint: str, service_hint: str) -> dict[str, object]:
+    def possible_duplicate_extract(
+        url: str,
+        business_name_hint: str,
+        service_hint: str,
+        fetch_options: concierge_pipeline.FetchOptions | None = None,
+    ) -> dict[str, object]:
         payload = fake_extract_page_fields(url, business_name_hint, service_hint)
         if url.endswith("/b"):
             payload["contacts"]["phone"] = "0411 111 111"
@@ -438,15 +807,806 @@ def test_duplicate_detection_checks_existing_inventory():
         assert any("existing inventory business 77" in warning for warning in record["duplicate_warnings"])
 
 
+def test_concurrent_fetch_matches_serial_artifact():
+    rows = load_csv_rows(PILOT_CSV)
+    canon = concierge_pipeline.load_councils_and_suburbs()
+    delays = {row["source_url"]: 0.02 * ((len(rows) - position) % 4) for position, row in enumerate(rows)}
+
+    def slow_extract(
+        url: str,
+        business_name_hint: str,
+        service_hint: str,
+        fetch_options: concierge_pipeline.FetchOptions | None = None,
+    ) -> dict[str, object]:
+        time.sleep(delays[url])
+        return fake_extract_page_fields(url, business_name_hint, service_hint)
+
+    artifacts = []
+    for workers in (1, 6):
+        with patch.object(concierge_pipeline, "extract_page_fields", side_effect=slow_extract):
+            artifacts.append(
+                concierge_pipeline.build_review_artifact(
+                    rows,
+                    canon,
+                    PILOT_CSV,
+                    [],
+                    fake_inventory_snapshot()[1],
+                    workers=workers,
+                )
+            )
+
+    serial, concurrent = artifacts
+    assert [record["source_url"] for record in concurrent["records"]] == [row["source_url"] for row in rows]
+    assert json.dumps(concurrent, sort_keys=True) == json.dumps(serial, sort_keys=True)
+
+
+def test_resumed_run_fetches_only_missing_rows_and_matches_uninterrupted_artifact():
+    rows = load_csv_rows(PILOT_CSV)
+    canon = concierge_pipeline.load_councils_and_suburbs()
+    fetched: list[str] = []
+
+    def crashing_extract(
+        url: str,
+        business_name_hint: str,
+        service_hint: str,
+        fetch_options: concierge_pipeline.FetchOptions | None = None,
+    ) -> dict[str, object]:
+        if len(fetched) == 11:
+            raise KeyboardInterrupt("simulated kill")
+        fetched.append(url)
+        return fake_extract_page_fields(url, business_name_hint, service_hint)
+
+    def build(extract, checkpoint=None):
+        with patch.object(concierge_pipeline, "extract_page_fields", side_effect=extract):
+            artifact = concierge_pipeline.build_review_artifact(
+                rows, canon, PILOT_CSV, [], fake_inventory_snapshot()[1], workers=3, checkpoint=checkpoint
+            )
+        artifact.pop("checkpoint")
+        return artifact
+
+    with tempfile.TemporaryDirectory(prefix="dtd-concierge-resume-") as tmp:
+        journal_path = Path(tmp) / "checkpoint.jsonl"
+        run_key = concierge_pipeline.checkpoint_run_key(PILOT_CSV)
+        try:
+            build(crashing_extract, concierge_pipeline.CheckpointJournal(journal_path, run_key))
+        except KeyboardInterrupt:
+            pass
+        else:
+            raise AssertionError("Expected the simulated kill to abort the first run")
+
+        resumed = concierge_pipeline.CheckpointJournal(journal_path, run_key, resume=True)
+        assert resumed.replayed == 11
+        first_run = list(fetched)
+        fetched.clear()
+        resumed_artifact = build(crashing_extract, resumed)
+
+    assert resumed.recorded == len(rows) - 11
+    assert sorted(first_run + fetched) == sorted(row["source_url"] for row in rows)
+    fetched.clear()
+    uninterrupted = build(lambda *args, **kwargs: fake_extract_page_fields(*args[:3]))
+    assert json.dumps(resumed_artifact, sort_keys=True) == json.dumps(uninterrupted, sort_keys=True)
+
+
+def test_host_scheduler_enforces_per_host_budgets_and_interleaves_hosts():
+    in_flight: dict[str, int] = {}
+    peak_in_flight: dict[str, int] = {}
+    started: dict[str, list[float]] = {}
+    finished: list[str] = []
+
+    def fetch(host: str, delay: float) -> str:
+        started.setdefault(host, []).append(time.monotonic())
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak_in_flight[host] = max(peak_in_flight.get(host, 0), in_flight[host])
+        time.sleep(delay)
+        in_flight[host] -= 1
+        finished.append(host)
+        return host
+
+    scheduler = concierge_pipeline.HostFetchScheduler(workers=4, per_host_concurrency=1, per_host_rps=20)
+    with scheduler:
+        futures = [scheduler.submit("slow.example", fetch, "slow.example", 0.05) for _ in range(4)]
+        futures += [scheduler.submit(f"fast{number}.example", fetch, f"fast{number}.example", 0.0) for number in range(4)]
+        results = [future.result() for future in futures]
+
+    assert results == ["slow.example"] * 4 + [f"fast{number}.example" for number in range(4)]
+    assert peak_in_flight["slow.example"] == 1
+    slow_starts = started["slow.example"]
+    assert all(later - earlier >= 0.045 for earlier, later in zip(slow_starts, slow_starts[1:]))
+    assert finished.index("fast3.example") < finished.index("slow.example")
+
+    summary = scheduler.summary()
+    slow_stats = next(stats for stats in summary["hosts"] if stats["host"] == "slow.example")
+    assert summary["host_count"] == 5
+    assert slow_stats["requests"] == 4
+    assert slow_stats["max_queue_depth"] == 4
+    assert slow_stats["max_wait_seconds"] >= 0.1
+
+
+def test_token_bucket_limits_requests_per_second():
+    bucket = concierge_pipeline.TokenBucket(rate=2.0, capacity=1)
+    start = bucket.updated_at
+    assert bucket.delay_until_available(start) == 0.0
+    bucket.consume()
+    assert abs(bucket.delay_until_available(start) - 0.5) < 1e-9
+    assert bucket.delay_until_available(start + 0.5) == 0.0
+
+
+def test_snapshot_cache_revalidates_and_serves_offline():
+    pages = {
+        "/trainer": {
+            "etag": '"v1"',
+            "body": "<html><head><title>Example Dog Training</title></head><body><h1>Example Dog Training</h1></body></html>",
+        }
+    }
+    with tempfile.TemporaryDirectory(prefix="dtd-concierge-cache-") as tmp, serve_pages(pages) as (base_url, requests):
+        url = f"{base_url}/trainer"
+        cache = concierge_pipeline.SnapshotCache(Path(tmp))
+
+        first = concierge_pipeline.fetch_html(url, cache=cache)
+        second = concierge_pipeline.fetch_html(url, cache=cache)
+        assert first.cache_status == "miss"
+        assert second.cache_status == "revalidated"
+        assert second.html_text == first.html_text
+        assert second.final_url == url
+        assert requests[1]["if-none-match"] == '"v1"'
+
+        fresh = concierge_pipeline.fetch_html(url, cache=concierge_pipeline.SnapshotCache(Path(tmp), max_age=3600))
+        offline = concierge_pipeline.fetch_html(url, cache=concierge_pipeline.SnapshotCache(Path(tmp), offline=True))
+        assert fresh.cache_status == "hit"
+        assert offline.cache_status == "hit"
+        assert len(requests) == 2
+
+        offline_fields = concierge_pipeline.extract_page_fields(
+            f"{base_url}/never-fetched",
+            "Example Dog Training",
+            "private training",
+            fetch_options=concierge_pipeline.FetchOptions(cache=concierge_pipeline.SnapshotCache(Path(tmp), offline=True)),
+        )
+        assert offline_fields["fetch"]["error"].startswith("SnapshotCacheMiss: offline mode")
+        assert len(requests) == 2
+
+
+def test_corpus_recording_covers_cache_hits_and_revalidations():
+    pages = {
+        "/moved": {"body": "", "status": 301, "location": "/trainer"},
+        "/trainer": {
+            "etag": '"v1"',
+            "body": "<html><head><title>Example Dog Training</title></head><body><h1>Example Dog Training</h1></body></html>",
+        },
+    }
+    with tempfile.TemporaryDirectory(prefix="dtd-concierge-cache-record-") as tmp, serve_pages(pages) as (base_url, requests):
+        url = f"{base_url}/moved"
+        live = concierge_pipeline.fetch_html(url, cache=concierge_pipeline.SnapshotCache(Path(tmp) / "cache"))
+        for name, max_age, cache_status in (("hit", 3600, "hit"), ("revalidated", 0, "revalidated")):
+            recorder = concierge_pipeline.CorpusRecorder(Path(tmp) / name)
+            page = concierge_pipeline.fetch_html(
+                url, cache=concierge_pipeline.SnapshotCache(Path(tmp) / "cache", max_age=max_age), recorder=recorder
+            )
+            assert page.cache_status == cache_status
+            with concierge_replay.ReplayServer(Path(tmp) / name) as server:
+                replayed = concierge_pipeline.fetch_html(url, replay_url=server.base_url)
+            assert server.stats["misses"] == 0, name
+            assert (replayed.final_url, replayed.html_text) == (live.final_url, live.html_text), name
+    assert live.final_url == f"{base_url}/trainer"
+
+def test_parse_duration_accepts_suffixes():
+    assert concierge_pipeline.parse_duration("90") == 90
+    assert concierge_pipeline.parse_duration("15m") == 900
+    assert concierge_pipeline.parse_duration("2h") == 7200
+    try:
+        concierge_pipeline.parse_duration("soon")
+    except ValueError as exc:
+        assert "invalid duration" in str(exc)
+    else:
+        raise AssertionError("Expected parse_duration to reject malformed durations")
+
+
+def test_fetch_html_negotiates_gzip_and_caps_decoded_size():
+    body = "<html><body><h1>Example Dog Training</h1>" + ("<p>puppy school and private training</p>" * 20000) + "</body></html>"
+    pages = {"/gzip": {"body": body, "encoding": "gzip"}}
+    with tempfile.TemporaryDirectory(prefix="dtd-concierge-gzip-") as tmp, serve_pages(pages) as (base_url, requests):
+        cache = concierge_pipeline.SnapshotCache(Path(tmp), max_age=3600)
+        page = concierge_pipeline.fetch_html(f"{base_url}/gzip", cache=cache)
+        capped = concierge_pipeline.fetch_html(f"{base_url}/gzip", max_bytes=100_000)
+        cached = cache.lookup(f"{base_url}/gzip")
+        hit = concierge_pipeline.fetch_html(f"{base_url}/gzip", cache=cache)
+
+    assert "gzip" in requests[0]["accept-encoding"]
+    assert page.content_encoding == "gzip"
+    assert page.html_text == body
+    assert page.decoded_bytes == len(body)
+    assert page.wire_bytes < page.decoded_bytes // 20
+    assert capped.decoded_bytes == 100_000
+    assert capped.html_text == body[:100_000]
+    # The cache holds the decoded body, so it must not claim to be gzip-encoded.
+    assert cached.body == body.encode("utf-8")
+    assert "content-encoding" not in cached.headers and "content-length" not in cached.headers
+    assert (hit.cache_status, hit.content_encoding, hit.html_text) == ("hit", "", body)
+
+
+def test_content_decoder_accepts_zlib_and_raw_deflate():
+    payload = b"<html>" + b"obedience training " * 1000 + b"</html>"
+    raw_compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    raw_deflate = raw_compressor.compress(payload) + raw_compressor.flush()
+    for encoded in (zlib.compress(payload), raw_deflate):
+        decoder = concierge_pipeline.ContentDecoder("deflate")
+        decoded = decoder.decompress(encoded, len(payload)) + decoder.flush(len(payload))
+        assert decoded == payload
+    try:
+        concierge_pipeline.ContentDecoder("compress")
+    except ValueError as exc:
+        assert "unsupported content-encoding" in str(exc)
+    else:
+        raise AssertionError("Expected ContentDecoder to reject unknown encodings")
+
+
+def test_brotli_decoding_is_capped_per_call_against_decompression_bombs():
+    if concierge_pipeline.brotli is None:
+        return
+    brotli = concierge_pipeline.brotli
+    bomb = brotli.compress(b"\0" * 16_000_000, quality=1)
+    assert len(bomb) < 16_000
+    decoder = concierge_pipeline.ContentDecoder("br")
+    first = decoder.decompress(bomb, 65_536)
+    assert len(first) == 65_536
+    assert len(decoder._pending) <= 65_536
+    with patch.object(concierge_pipeline, "FETCH_CHUNK_SIZE", 65_536):
+        body, wire_bytes, _ = concierge_pipeline.read_decoded_body(io.BytesIO(bomb), "br", 1_000_000)
+    assert (len(body), wire_bytes) == (1_000_000, len(bomb))
+
+    payload = b"<html>" + b"behaviour consults " * 50_000 + b"</html>"
+    encoded = brotli.compress(payload)
+    body, _, _ = concierge_pipeline.read_decoded_body(io.BytesIO(encoded), "br", 10 * len(payload))
+    assert body == payload
+
+
+def test_stream_parse_stops_downloading_once_evidence_is_collected():
+    head = (
+        "<html><head><title>Example Dog Training</title>"
+        '<meta name="description" content="Puppy school in Carlton">'
+        '<script type="application/ld+json">{"@type": "LocalBusiness", "name": "Example Dog Training"}</script>'
+        "</head><body><h1>Example Dog Training</h1>"
+    )
+    body = head + ("<p>Private training and puppy school for every dog.</p>" * 4000) + "</body></html>"
+    small = head + "<p>Private training.</p></body></html>"
+    pages = {"/large": {"body": body, "encoding": "gzip"}, "/small": {"body": small}}
+    options = concierge_pipeline.FetchOptions(stream_parse=True, stream_min_body_chars=2_000)
+
+    with serve_pages(pages) as (base_url, _):
+        large = concierge_pipeline.extract_page_fields(f"{base_url}/large", "Example Dog Training", "", fetch_options=options)
+        small_streamed = concierge_pipeline.extract_page_fields(f"{base_url}/small", "Example Dog Training", "", fetch_options=options)
+
+    assert large["fetch"]["stopped_early"] is True
+    assert large["fetch"]["decoded_bytes"] < len(body) // 2
+    assert large["snapshot"]["title"] == "Example Dog Training"
+    assert large["snapshot"]["headings"]["h1"] == "Example Dog Training"
+    assert large["snapshot"]["jsonld"] == [{"@type": "LocalBusiness", "name": "Example Dog Training"}]
+    assert len(large["snapshot"]["body_text"]) >= 2_000
+    assert small_streamed["fetch"]["stopped_early"] is False
+    assert small_streamed["snapshot"] == concierge_pipeline.parse_snapshot(small)
+
+
+def test_snapshot_parser_captures_jsonld_in_a_single_pass():
+    html_text = """<html><head><title>Example</title>
+<script type="application/ld+json">{"@context": "https://schema.org", "@graph": [{"@type": "LocalBusiness", "name": "Example Dog Training", "address": {"streetAddress": "1 Lygon St", "addressLocality": "Carlton", "postalCode": "3053"}}, {"@type": "WebSite", "name": "Example"}]}</script>
+<script TYPE='application/ld+json'>[{"@type": "Person", "name": "Sam &amp; Co <trainer>"}]</script>
+<script type="application/ld+json">{not json}</script>
+<script type="text/javascript">var ignored = "<p>not body text</p>";</script>
+</head><body><h1>Example Dog Training</h1><p>Private training in Carlton.</p>
+<script type="application/ld+json">{"@type": "Organization", "name": "Footer Org"}</script></body></html>"""
+
+    legacy_blocks = re.findall(
+        r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+        html_text,
+        flags=re.I | re.S,
+    )
+    snapshot = concierge_pipeline.parse_snapshot(html_text)
+
+    assert snapshot["jsonld"] == concierge_pipeline.parse_jsonld_blocks(legacy_blocks)
+    assert [obj.get("name") for obj in snapshot["jsonld"]] == [
+        None,
+        "Example",
+        "Example Dog Training",
+        "Sam &amp; Co <trainer>",
+        "Footer Org",
+    ]
+    assert "ignored" not in snapshot["body_text"]
+    assert "Footer Org" not in snapshot["body_text"]
+    assert snapshot["body_text"] == "Example Dog Training Private training in Carlton."
+
+
+def test_lxml_parser_backend_matches_stdlib_on_conformance_corpus():
+    corpus_dir = REPO_ROOT / "scripts" / "fixtures" / "snapshot_parser_corpus"
+    documents = sorted(corpus_dir.glob("*.html"))
+    assert documents
+    assert concierge_pipeline.resolve_parser_backend("stdlib") == "stdlib"
+    if "lxml" not in concierge_pipeline.SNAPSHOT_PARSER_BACKENDS:
+        assert concierge_pipeline.resolve_parser_backend("auto") == "stdlib"
+        return
+
+    for path in documents:
+        html_text = path.read_text(encoding="utf-8")
+        reference = concierge_pipeline.parse_snapshot(html_text, "stdlib")
+        assert reference["title"] and reference["body_text"], path.name
+        assert concierge_pipeline.parse_snapshot(html_text, "lxml") == reference, path.name
+
+        streamed = concierge_pipeline.create_snapshot_parser("lxml")
+        for start in range(0, len(html_text), 61):
+            streamed.feed(html_text[start : start + 61])
+        assert concierge_pipeline.snapshot_from_parser(streamed) == reference, path.name
+
+
+def test_process_pool_cpu_stage_matches_in_process_extraction():
+    corpus_dir = REPO_ROOT / "scripts" / "fixtures" / "snapshot_parser_corpus"
+    pages = {f"/{path.stem}": {"body": path.read_text(encoding="utf-8")} for path in sorted(corpus_dir.glob("*.html"))}
+    pilot_rows = load_csv_rows(PILOT_CSV)
+    canon = concierge_pipeline.load_councils_and_suburbs()
+
+    for path in corpus_dir.glob("*.html"):
+        snapshot = concierge_pipeline.parse_snapshot(path.read_text(encoding="utf-8"))
+        packed = concierge_pipeline.pack_snapshot(snapshot)
+        assert all(isinstance(value, (str, tuple)) for value in packed)
+        assert concierge_pipeline.unpack_snapshot(packed) == snapshot
+
+    with serve_pages(pages) as (base_url, _):
+        rows = [
+            {
+                **pilot_rows[position % len(pilot_rows)],
+                "source_url": f"{base_url}{page_path}",
+            }
+            for position, page_path in enumerate([*pages, "/missing", *pages])
+        ]
+        artifacts = [
+            concierge_pipeline.build_review_artifact(
+                rows,
+                canon,
+                PILOT_CSV,
+                [],
+                fake_inventory_snapshot()[1],
+                workers=4,
+                per_host_concurrency=4,
+                per_host_rps=0,
+                cpu_workers=cpu_workers,
+                fetch_options=concierge_pipeline.FetchOptions(stream_parse=stream_parse),
+            )
+            for stream_parse in (False, True)
+            for cpu_workers in (0, 2)
+        ]
+        streamed = concierge_pipeline.fetch_source_page(rows[0]["source_url"], concierge_pipeline.FetchOptions(stream_parse=True))
+        whole = concierge_pipeline.fetch_source_page(rows[0]["source_url"])
+
+    # A stream-parsed page crosses to CPU workers as its packed snapshot alone.
+    assert streamed.html_text is None and streamed.has_body
+    assert streamed.content_sha256 == whole.content_sha256
+    assert len(pickle.dumps(streamed)) < len(pickle.dumps(whole))
+    for in_process, pooled in (artifacts[:2], artifacts[2:]):
+        assert [record["source_url"] for record in pooled["records"]] == [row["source_url"] for row in rows]
+        assert pooled["records"][len(pages)]["fetch"]["http_status"] == 404
+        assert json.dumps(pooled, sort_keys=True) == json.dumps(in_process, sort_keys=True)
+
+
+def test_incremental_run_reuses_unchanged_extractions_and_recomputes_the_rest():
+    corpus_dir = REPO_ROOT / "scripts" / "fixtures" / "snapshot_parser_corpus"
+    pages = {f"/{path.stem}": {"body": path.read_text(encoding="utf-8")} for path in sorted(corpus_dir.glob("*.html"))}
+    pilot_rows = load_csv_rows(PILOT_CSV)
+    canon = concierge_pipeline.load_councils_and_suburbs()
+
+    def build(rows, **kwargs):
+        artifact = concierge_pipeline.build_review_artifact(
+            rows, canon, PILOT_CSV, [], fake_inventory_snapshot()[1], workers=2, per_host_rps=0, **kwargs
+        )
+        for key in ("checkpoint", "incremental"):
+            artifact.pop(key)
+        for record in artifact["records"]:
+            record["fetch"].pop("extraction_reused")
+        return artifact
+
+    with tempfile.TemporaryDirectory(prefix="dtd-concierge-incremental-") as tmp, serve_pages(pages) as (base_url, _):
+        rows = [
+            {**pilot_rows[position], "source_url": f"{base_url}{page_path}"}
+            for position, page_path in enumerate([*pages, "/missing"])
+        ]
+        journal_path = Path(tmp) / "checkpoint.jsonl"
+        store_path = Path(tmp) / "extractions.jsonl"
+        run_key = concierge_pipeline.checkpoint_run_key(PILOT_CSV)
+        build(rows, checkpoint=concierge_pipeline.CheckpointJournal(journal_path, run_key))
+        concierge_pipeline.CheckpointJournal(journal_path, run_key).promote(store_path)
+        assert not journal_path.exists()
+
+        pages["/squarespace"] = {"body": pages["/squarespace"]["body"].replace("</body>", "<p>Now offering puppy school.</p></body>")}
+        previous = concierge_pipeline.load_previous_extractions(store_path)
+        assert previous is not None and len(previous) == len(rows)
+        assert concierge_pipeline.load_previous_extractions(store_path, concierge_pipeline.FetchOptions(parser_backend="lxml")) is None
+
+        with patch.object(concierge_pipeline, "extract_fetched_fields", wraps=concierge_pipeline.extract_fetched_fields) as extract:
+            artifact = concierge_pipeline.build_review_artifact(
+                rows, canon, PILOT_CSV, [], fake_inventory_snapshot()[1], workers=2, per_host_rps=0, previous_extractions=previous
+            )
+        re_extracted = sorted(call.args[0].url.rsplit("/", 1)[1] for call in extract.call_args_list)
+        incremental = build(rows, previous_extractions=previous)
+        full = build(rows)
+
+    assert re_extracted == ["missing", "squarespace"]
+    assert artifact["incremental"] == {"enabled": True, "previous_rows": len(rows), "reused": len(pages) - 1, "re_extracted": 2}
+    assert [record["fetch"]["extraction_reused"] for record in artifact["records"]] == [
+        not url.endswith(("/squarespace", "/missing")) for url in (row["source_url"] for row in rows)
+    ]
+    assert json.dumps(incremental, sort_keys=True) == json.dumps(full, sort_keys=True)
+
+
+def test_contact_crawl_fills_missing_fields_from_same_site_pages():
+    landing = (
+        "<html><head><title>Northside Dog Training</title></head><body>"
+        "<h1>Northside Dog Training</h1><p>Puppy training and adult dog obedience classes.</p>"
+        '<a href="/services">Services</a><a href="about.html#team">About us</a>'
+        '<a href="/contact-us">Get in touch</a><a href="https://elsewhere.example/contact">Partner</a>'
+        '<a href="#top">Top</a></body></html>'
+    )
+    pages = {
+        "/": {"body": landing},
+        "/contact-us": {"body": '<html><body><a href="tel:03 9000 1234">Call</a><a href="mailto:hi@northside.example">Email</a></body></html>'},
+        "/about.html": {"body": "<html><body><p>Visit us at 12 Smith Street, Fitzroy, VIC 3065</p></body></html>"},
+    }
+    snapshot = concierge_pipeline.parse_snapshot(landing)
+    assert concierge_pipeline.contact_page_urls(snapshot, "https://www.northside.example/", 5) == [
+        "https://www.northside.example/contact-us",
+        "https://www.northside.example/about.html",
+    ]
+    assert concierge_pipeline.contact_page_urls(snapshot, "https://northside.example/", 1) == ["https://northside.example/contact-us"]
+    assert concierge_pipeline.contact_page_urls(snapshot, "https://northside.example/", 0) == []
+
+    canon = concierge_pipeline.load_councils_and_suburbs()
+    row = load_csv_rows(PILOT_CSV)[0]
+    with serve_pages(pages) as (base_url, requests):
+        rows = [{**row, "source_url": f"{base_url}/", "suburb_hint": "Fitzroy"}]
+        plain = concierge_pipeline.build_review_artifact(rows, canon, PILOT_CSV, [], fake_inventory_snapshot()[1], per_host_rps=0)
+        assert [request["path"] for request in requests] == ["/"]
+        artifact = concierge_pipeline.build_review_artifact(
+            rows,
+            canon,
+            PILOT_CSV,
+            [],
+            fake_inventory_snapshot()[1],
+            per_host_rps=0,
+            fetch_options=concierge_pipeline.FetchOptions(contact_crawl_pages=2),
+        )
+        assert sorted(request["path"] for request in requests[1:]) == ["/", "/about.html", "/contact-us"]
+
+    assert plain["contact_crawl"]["enabled"] is False
+    assert "no direct contact fields extracted from source" in plain["records"][0]["publish_readiness_warnings"]
+    record = artifact["records"][0]
+    assert record["extracted"]["phone"] == "03 9000 1234"
+    assert record["extracted"]["email"] == "hi@northside.example"
+    assert record["extracted"]["address"] == "12 Smith Street, Fitzroy, VIC 3065"
+    assert record["evidence"]["contact_sources"] == {
+        "phone": f"{base_url}/contact-us",
+        "email": f"{base_url}/contact-us",
+        "address": f"{base_url}/about.html",
+    }
+    assert [page["url"] for page in record["fetch"]["crawled_pages"]] == [f"{base_url}/contact-us", f"{base_url}/about.html"]
+    assert "no direct contact fields extracted from source" not in record["publish_readiness_warnings"]
+    assert artifact["contact_crawl"]["pages_fetched"] == 2
+    assert artifact["contact_crawl"]["fields_filled"] == {"phone": 1, "email": 1, "address": 1}
+
+
+def test_profiled_run_reports_stage_percentiles_slowest_urls_and_a_chrome_trace():
+    pages = {
+        "/": {"body": "<html><body><h1>Northside Dog Training</h1><p>Puppy training classes.</p><a href=\"/contact\">Contact</a></body></html>"},
+        "/contact": {"body": '<html><body><a href="tel:03 9000 1234">Call</a></body></html>'},
+        "/other": {"body": "<html><body><h1>Other Dog Training</h1><a href=\"tel:03 9000 9999\">Call</a></body></html>"},
+    }
+    canon = concierge_pipeline.load_councils_and_suburbs()
+    row = load_csv_rows(PILOT_CSV)[0]
+    profiler = concierge_profile.RunProfiler(trace_memory=True)
+    with tempfile.TemporaryDirectory(prefix="dtd-profile-") as tmp, serve_pages(pages) as (base_url, _):
+        rows = [{**row, "source_url": f"{base_url}{path}", "suburb_hint": "Fitzroy"} for path in ("/", "/other")]
+        checkpoint = concierge_pipeline.CheckpointJournal(Path(tmp) / "checkpoint.jsonl", "profile-run")
+        artifact = concierge_pipeline.build_review_artifact(
+            rows,
+            canon,
+            PILOT_CSV,
+            [],
+            fake_inventory_snapshot()[1],
+            per_host_rps=0,
+            fetch_options=concierge_pipeline.FetchOptions(contact_crawl_pages=1),
+            checkpoint=checkpoint,
+            profiler=profiler,
+        )
+        _, journaled, _ = concierge_pipeline.read_journal(Path(tmp) / "checkpoint.jsonl")
+        trace_path = Path(tmp) / "trace.json"
+        profiler.write_trace(trace_path)
+        trace = json.loads(trace_path.read_text(encoding="utf-8"))
+
+    performance = artifact["performance"]
+    assert performance["enabled"] is True and performance["rows"] == 2
+    for stage in ("fetch", "fetch.connect", "fetch.wait", "fetch.download", "extract", "extract.parse", "review", "review.dedupe"):
+        assert performance["stages"][stage]["count"] >= 1, stage
+        assert 0 <= performance["stages"][stage]["p50_seconds"] <= performance["stages"][stage]["max_seconds"]
+    assert performance["stages"]["contact_crawl.fetch"]["count"] == 1
+    assert list(performance["run_stages"]) == ["inventory_index", "rows"]
+    assert sorted(slow["source_url"] for slow in performance["slowest_urls"]) == [f"{base_url}/", f"{base_url}/other"]
+    slowest = performance["slowest_urls"][0]
+    assert abs(slowest["seconds"] - sum(slowest["stages"].values())) < 1e-5
+    assert set(slowest["stages"]) <= {"fetch", "extract", "review", "contact_crawl.fetch", "contact_crawl.extract"}
+    assert performance["memory"]["tracemalloc"]["peak_bytes"] > 0
+    assert performance["fetch_schedule"]["host_count"] == 1
+    assert performance["fetch_schedule"]["hosts"][0]["requests"] == 3
+    assert not tracemalloc.is_tracing()
+    assert all("timings" not in source_data for source_data in journaled.values())
+
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert {event["args"].get("url") for event in spans if event["cat"] == "row"} == {f"{base_url}/", f"{base_url}/other"}
+    assert all(event["dur"] >= 0 and event["ts"] >= 0 for event in spans)
+    assert any(event["ph"] == "C" for event in trace["traceEvents"])
+
+    plain = concierge_pipeline.build_review_artifact(
+        load_csv_rows(PILOT_CSV)[:1], canon, PILOT_CSV, [], fake_inventory_snapshot()[1], per_host_rps=0
+    )
+    assert plain["performance"] == {"enabled": False}
+
+
+def test_transient_fetch_failures_are_retried_and_dead_hosts_trip_the_breaker():
+    pages = {
+        "/flaky": {"body": "<html><body><h1>Flaky Dog Training</h1></body></html>", "fail_with": [503, 429]},
+        "/gone": {"body": "", "status": 404},
+        "/down": {"body": "", "status": 500},
+        "/after-down": {"body": "<html><body><h1>Never fetched</h1></body></html>"},
+    }
+    policy = concierge_pipeline.RetryPolicy(max_attempts=3, backoff_base=0)
+    with serve_pages(pages) as (base_url, requests):
+        fetched = {
+            path: concierge_pipeline.fetch_source_page(f"{base_url}{path}", concierge_pipeline.FetchOptions(retry_policy=policy))
+            for path in ("/flaky", "/gone")
+        }
+        breaker = concierge_pipeline.CircuitBreaker(threshold=2)
+        options = concierge_pipeline.FetchOptions(retry_policy=policy, circuit_breaker=breaker)
+        down = concierge_pipeline.fetch_source_page(f"{base_url}/down", options)
+        skipped = concierge_pipeline.fetch_source_page(f"{base_url}/after-down", options)
+        paths = [request["path"] for request in requests]
+
+    assert (fetched["/flaky"].status, fetched["/flaky"].attempts, fetched["/flaky"].failure_class, fetched["/flaky"].error) == (200, 3, "", "")
+    assert (fetched["/gone"].attempts, fetched["/gone"].failure_class) == (1, "http_4xx")
+    assert (down.attempts, down.failure_class, down.status) == (2, "http_5xx", 500)
+    assert (skipped.attempts, skipped.failure_class, skipped.status) == (0, "circuit_open", None)
+    assert skipped.error.startswith("CircuitOpen: 127.0.0.1")
+    assert paths == ["/flaky"] * 3 + ["/gone", "/down", "/down"]
+    record = concierge_pipeline.fetch_record(down, "127.0.0.1")
+    assert (record["attempts"], record["retries"], record["failure_class"]) == (2, 1, "http_5xx")
+
+
+def test_deadline_shrinks_timeouts_and_marks_unfetched_rows():
+    pages = {f"/trainer-{index}": {"body": f"<html><body><h1>Trainer {index}</h1><p>Puppy training</p></body></html>"} for index in range(3)}
+    pilot_rows = load_csv_rows(PILOT_CSV)
+    canon = concierge_pipeline.load_councils_and_suburbs()
+    now = [0.0]
+    deadline = concierge_pipeline.RunDeadline(8.0, clock=lambda: now[0])
+    timeouts: list[float] = []
+    real_fetch_html = concierge_pipeline.fetch_html
+
+    def slow_fetch_html(url, timeout, *args, **kwargs):
+        timeouts.append(timeout)
+        page = real_fetch_html(url, timeout, *args, **kwargs)
+        now[0] += 5.0
+        return page
+
+    with tempfile.TemporaryDirectory(prefix="dtd-concierge-deadline-") as tmp, serve_pages(pages) as (base_url, requests):
+        rows = [{**pilot_rows[index], "source_url": f"{base_url}{path}"} for index, path in enumerate(pages)]
+        journal = concierge_pipeline.CheckpointJournal(Path(tmp) / "checkpoint.jsonl", concierge_pipeline.checkpoint_run_key(PILOT_CSV))
+        with patch.object(concierge_pipeline, "fetch_html", side_effect=slow_fetch_html):
+            artifact = concierge_pipeline.build_review_artifact(
+                rows,
+                canon,
+                PILOT_CSV,
+                [],
+                fake_inventory_snapshot()[1],
+                workers=1,
+                per_host_rps=0,
+                fetch_options=concierge_pipeline.FetchOptions(deadline=deadline),
+                checkpoint=journal,
+            )
+        assert [request["path"] for request in requests] == ["/trainer-0", "/trainer-1"]
+
+    assert timeouts == [8.0, 3.0]
+    statuses = [record["publish_status"] for record in artifact["records"]]
+    assert statuses[2] == "deadline_exceeded" and "deadline_exceeded" not in statuses[:2]
+    cut = artifact["records"][2]
+    assert cut["fetch"]["failure_class"] == "deadline_exceeded"
+    assert cut["fetch"]["attempts"] == 0
+    assert cut["mapping_status"] == "blocked"
+    assert artifact["review_counts"]["deadline_exceeded"] == 1
+    assert artifact["deadline"] == {"enabled": True, "budget_seconds": 8.0, "expired": True, "rows_deadline_exceeded": 1}
+    assert journal.recorded == 2
+
+
+def test_deadline_cut_probe_does_not_leave_the_circuit_stuck_half_open():
+    now = [0.0]
+    deadline = concierge_pipeline.RunDeadline(5.0, clock=lambda: now[0])
+    breaker = concierge_pipeline.CircuitBreaker(threshold=1, cooldown=0.0)
+    breaker.record("probe.example", failed=True)
+
+    def timed_out_fetch_html(url, timeout, *args, **kwargs):
+        now[0] += timeout
+        raise URLError(TimeoutError("timed out"))
+
+    with patch.object(concierge_pipeline, "fetch_html", side_effect=timed_out_fetch_html):
+        cut = concierge_pipeline.fetch_source_page(
+            "https://probe.example/", concierge_pipeline.FetchOptions(deadline=deadline, circuit_breaker=breaker)
+        )
+
+    assert (cut.failure_class, cut.attempts) == ("deadline_exceeded", 1)
+    # The probe the deadline cut short is released: the host can be probed again.
+    assert breaker.allow("probe.example")
+    assert breaker.summary()["hosts_opened"][0]["open"] is True
+
+
+def test_host_scheduler_runs_row_fetches_before_follow_up_fetches():
+    order: list[str] = []
+    scheduler = concierge_pipeline.HostFetchScheduler(workers=1, per_host_concurrency=1, per_host_rps=0)
+    follow_up = scheduler.submit("a.example", order.append, "a-contact", priority=concierge_pipeline.FOLLOW_UP_FETCH_PRIORITY)
+    rows = [scheduler.submit(host, order.append, host) for host in ("a.example", "b.example")]
+    with scheduler:
+        for future in [follow_up, *rows]:
+            future.result()
+    assert order == ["a.example", "b.example", "a-contact"]
+
+
+def test_retries_go_back_to_the_scheduler_behind_unfetched_rows():
+    page = {"body": "<html><body><h1>Example Dog Training</h1></body></html>"}
+    pages = {"/flaky": {**page, "fail_with": [503], "retry_after": "0"}, "/a": page, "/b": page}
+    options = concierge_pipeline.FetchOptions(retry_policy=concierge_pipeline.RetryPolicy(max_attempts=2))
+    scheduler = concierge_pipeline.HostFetchScheduler(workers=1, per_host_concurrency=1, per_host_rps=0)
+    with serve_pages(pages) as (base_url, requests):
+        futures = [
+            scheduler.submit("127.0.0.1", concierge_pipeline.fetch_source_page, f"{base_url}{path}", options)
+            for path in ("/flaky", "/a", "/b")
+        ]
+        with scheduler:
+            flaky = futures[0].result()
+
+    # The retry waits behind the rows that had not been fetched at all instead of holding the worker.
+    assert [request["path"] for request in requests] == ["/flaky", "/a", "/b", "/flaky"]
+    assert (flaky.status, flaky.attempts, flaky.error) == (200, 2, "")
+    assert [span[0] for span in flaky.spans].count("fetch.backoff") == 1
+    assert scheduler.summary()["hosts"][0]["requests"] == 4
+
+def test_host_scheduler_cancels_queued_fetches_when_the_consumer_fails():
+    started = threading.Event()
+    release = threading.Event()
+    ran: list[int] = []
+
+    def blocking(number: int) -> int:
+        started.set()
+        release.wait(timeout=5)
+        ran.append(number)
+        return number
+
+    scheduler = concierge_pipeline.HostFetchScheduler(workers=1, per_host_concurrency=1, per_host_rps=0)
+    futures = []
+    try:
+        with scheduler:
+            futures = [scheduler.submit("a.example", blocking, number) for number in range(20)]
+            # The running fetch finishes only once the queued ones have been cancelled.
+            futures[-1].add_done_callback(lambda _: release.set())
+            assert started.wait(timeout=5)
+            raise RuntimeError("consumer failed")
+    except RuntimeError:
+        pass
+    assert ran == [0]
+    assert futures[0].result() == 0
+    assert all(future.cancelled() for future in futures[1:])
+    assert scheduler.submit("a.example", blocking, 99).cancelled()
+    assert scheduler.summary()["hosts"][0]["requests"] == 1
+
+def test_recorded_corpus_replays_to_the_same_artifact_without_the_origin():
+    corpus_dir = REPO_ROOT / "scripts" / "fixtures" / "snapshot_parser_corpus"
+    pages: dict[str, dict[str, object]] = {
+        f"/{path.stem}": {"body": path.read_text(encoding="utf-8")} for path in sorted(corpus_dir.glob("*.html"))
+    }
+    pages["/moved"] = {"body": "", "status": 301, "location": "/wordpress"}
+    pilot_rows = load_csv_rows(PILOT_CSV)
+    canon = concierge_pipeline.load_councils_and_suburbs()
+
+    def build(rows, fetch_options):
+        artifact = concierge_pipeline.build_review_artifact(
+            rows, canon, PILOT_CSV, [], fake_inventory_snapshot()[1], workers=2, per_host_rps=0, fetch_options=fetch_options
+        )
+        artifact.pop("response_corpus")
+        return artifact
+
+    with tempfile.TemporaryDirectory(prefix="dtd-concierge-record-") as tmp:
+        record_dir = Path(tmp) / "corpus"
+        with serve_pages(pages) as (base_url, _):
+            rows = [
+                {**pilot_rows[position], "source_url": f"{base_url}{page_path}"}
+                for position, page_path in enumerate([*pages, "/missing"])
+            ]
+            recorder = concierge_pipeline.CorpusRecorder(record_dir)
+            recorded = build(rows, concierge_pipeline.FetchOptions(recorder=recorder))
+        assert recorder.recorded == len(rows) + 1
+        with concierge_replay.ReplayServer(record_dir) as server:
+            replayed = build(rows, concierge_pipeline.FetchOptions(replay_url=server.base_url))
+        assert server.stats["misses"] == 0
+
+    moved = next(record for record in recorded["records"] if record["source_url"].endswith("/moved"))
+    assert moved["fetch"]["final_url"].endswith("/wordpress")
+    assert json.dumps(replayed, sort_keys=True) == json.dumps(recorded, sort_keys=True)
+
+
+def test_taxonomy_scanner_matches_per_rule_search():
+    corpus_dir = REPO_ROOT / "scripts" / "fixtures" / "snapshot_parser_corpus"
+    texts = [path.read_text(encoding="utf-8") for path in sorted(corpus_dir.glob("*.html"))]
+    texts += [
+        "",
+        "Behavioural assessment and puppy preschool for rescue dogs",
+        "Behaviour training: pulls on the lead, jumps up, resource guarding, nips",
+        "One-on-one in-home sessions; all ages; come when called; socialisation",
+        "PUPPYISH adolescent teen senior shelter adopted leash reactivity",
+        "Dog walking only",
+    ]
+    for text in texts:
+        lowered = text.lower()
+        expected = {
+            rule
+            for rule in concierge_pipeline.SCANNED_TAXONOMY_RULES
+            if any(re.search(pattern, lowered) for pattern in rule.patterns)
+        }
+        assert concierge_pipeline.scan_taxonomy_rules(text) == expected
+
+    assert concierge_pipeline.infer_taxonomy("Behavioural assessment and puppy preschool for rescue dogs") == {
+        "resource_type": (["behaviour_consultant"], ["behaviour consultant keyword"]),
+        "service_types": (["puppy_training", "behaviour_consultations"], ["puppy keyword", "behaviour keyword"]),
+        "age_specialties": (["puppies_0_6m", "rescue_dogs"], ["puppy keyword", "rescue keyword"]),
+        "behavior_issues": (["rescue_dog_support"], ["rescue keyword"]),
+    }
+    assert concierge_pipeline.infer_resource_type("Dog walking only") == ("trainer", ["default trainer"])
+    assert concierge_pipeline.infer_service_types("Dog walking only") == ([], [])
+    assert concierge_pipeline.infer_age_specialties("Behavior help") == (["adult_18m_7y"], ["generic trainer fallback"])
+
+
 if __name__ == "__main__":
     test_canonical_pilot_rows()
     test_rejects_non_http_source_urls_before_fetch()
     test_rejects_out_of_catchment_suburb_hints_before_fetch()
+    test_rejection_suggests_catchment_suburbs_for_misspelled_hints()
+    test_seed_queue_reader_accepts_misspelled_catchment_hints_as_advisory_corrections()
+    test_rejected_queue_rows_keep_csv_numbering_for_row_indexes_and_duplicates()
+    test_seed_queue_reader_collects_every_row_error()
+    test_seed_queue_reader_feeds_fetch_before_the_queue_is_read()
     test_accepts_valid_inner_city_suburb_not_present_in_pilot_batch()
     test_resolve_suburb_uses_council_evidence_for_ambiguous_localities()
+    test_address_locality_resolves_ambiguous_hints_and_flags_mismatches()
+    test_misspelled_suburb_hints_auto_resolve_as_advisory()
+    test_locality_canon_indexes_suburbs_postcodes_and_pairs()
+    test_locality_canon_cache_skips_parsing_until_a_source_changes()
+    test_import_defers_canon_io_and_optional_backends()
     test_pipeline_emits_review_artifact_for_the_canonical_pilot()
     test_pipeline_processes_only_manual_queue_urls()
     test_duplicate_warnings_use_locality_scoped_multi_signal_matching()
     test_mapping_status_uses_possible_duplicate_without_blocking()
     test_duplicate_detection_checks_existing_inventory()
+    test_concurrent_fetch_matches_serial_artifact()
+    test_resumed_run_fetches_only_missing_rows_and_matches_uninterrupted_artifact()
+    test_host_scheduler_enforces_per_host_budgets_and_interleaves_hosts()
+    test_token_bucket_limits_requests_per_second()
+    test_snapshot_cache_revalidates_and_serves_offline()
+    test_corpus_recording_covers_cache_hits_and_revalidations()
+    test_parse_duration_accepts_suffixes()
+    test_fetch_html_negotiates_gzip_and_caps_decoded_size()
+    test_content_decoder_accepts_zlib_and_raw_deflate()
+    test_brotli_decoding_is_capped_per_call_against_decompression_bombs()
+    test_stream_parse_stops_downloading_once_evidence_is_collected()
+    test_snapshot_parser_captures_jsonld_in_a_single_pass()
+    test_lxml_parser_backend_matches_stdlib_on_conformance_corpus()
+    test_process_pool_cpu_stage_matches_in_process_extraction()
+    test_incremental_run_reuses_unchanged_extractions_and_recomputes_the_rest()
+    test_contact_crawl_fills_missing_fields_from_same_site_pages()
+    test_profiled_run_reports_stage_percentiles_slowest_urls_and_a_chrome_trace()
+    test_transient_fetch_failures_are_retried_and_dead_hosts_trip_the_breaker()
+    test_deadline_shrinks_timeouts_and_marks_unfetched_rows()
+    test_deadline_cut_probe_does_not_leave_the_circuit_stuck_half_open()
+    test_host_scheduler_runs_row_fetches_before_follow_up_fetches()
+    test_retries_go_back_to_the_scheduler_behind_unfetched_rows()
+    test_host_scheduler_cancels_queued_fetches_when_the_consumer_fails()
+    test_recorded_corpus_replays_to_the_same_artifact_without_the_origin()
+    test_taxonomy_scanner_matches_per_rule_search()
     print("OK test_concierge_pipeline.py")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Focused verification for concierge stage timers and run profiling."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import concierge_profile  # noqa: E402
+
+
+def spans(stage_seconds: dict[str, float]) -> dict[str, list[concierge_profile.Span]]:
+    return {"spans": [(name, 0.0, seconds, 1, 1) for name, seconds in stage_seconds.items()], "memory": []}
+
+
+def test_percentiles_use_nearest_rank():
+    values = [float(value) for value in range(1, 21)]
+    assert concierge_profile.percentile(values, 0.5) == 10.0
+    assert concierge_profile.percentile(values, 0.95) == 19.0
+    assert concierge_profile.percentile([3.0], 0.95) == 3.0
+    assert concierge_profile.is_row_stage("fetch")
+    assert concierge_profile.is_row_stage("contact_crawl.fetch")
+    assert not concierge_profile.is_row_stage("fetch.connect")
+    assert not concierge_profile.is_row_stage("contact_crawl.fetch.wait")
+
+
+def test_stage_timer_laps_and_round_trips_through_export():
+    timer = concierge_profile.StageTimer(since=0.0)
+    timer.lap("first")
+    with timer.stage("inner"):
+        pass
+    timer.lap("second")
+    names = [span[0] for span in timer.spans]
+    assert names == ["first", "inner", "second"]
+    # A stage inside a lap does not reset the lap clock.
+    assert timer.spans[2][1] == timer.spans[0][1] + timer.spans[0][2]
+    copy = concierge_profile.StageTimer.from_export(timer.export())
+    copy.extend([("fetch", 1.0, 0.5, 1, 1)], prefix=concierge_profile.CONTACT_CRAWL_PREFIX)
+    assert [span[0] for span in copy.spans] == ["first", "inner", "second", "contact_crawl.fetch"]
+
+
+def test_run_profiler_ranks_slowest_urls_by_row_stages_only():
+    profiler = concierge_profile.RunProfiler(slowest_urls=2)
+    review = concierge_profile.StageTimer()
+    profiler.add_row("https://slow.example/", spans({"fetch": 2.0, "fetch.wait": 1.9, "extract": 0.5}), review)
+    profiler.add_row("https://fast.example/", spans({"fetch": 0.1, "extract": 0.2}), review)
+    profiler.add_row("https://crawled.example/", spans({"fetch": 0.5, "contact_crawl.fetch": 1.0}), review)
+    profiler.add_row("https://replayed.example/", None, review)
+    summary = profiler.summary()
+    assert summary["rows"] == 4
+    assert [slow["source_url"] for slow in summary["slowest_urls"]] == ["https://slow.example/", "https://crawled.example/"]
+    assert summary["slowest_urls"][0]["seconds"] == 2.5
+    assert summary["stages"]["fetch"] == {
+        "count": 3,
+        "total_seconds": 2.6,
+        "p50_seconds": 0.5,
+        "p95_seconds": 2.0,
+        "max_seconds": 2.0,
+    }
+    assert summary["memory"]["tracemalloc"] is None
+    events = profiler.trace_events()["traceEvents"]
+    assert sum(1 for event in events if event["ph"] == "X") == 7
+
+
+if __name__ == "__main__":
+    test_percentiles_use_nearest_rank()
+    test_stage_timer_laps_and_round_trips_through_export()
+    test_run_profiler_ranks_slowest_urls_by_row_stages_only()
+    print("OK test_concierge_profile.py")
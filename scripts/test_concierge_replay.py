@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Focused verification for the concierge response corpus and replay server."""
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import concierge_pipeline  # noqa: E402
+import concierge_replay  # noqa: E402
+
+
+NO_RETRIES = concierge_pipeline.RetryPolicy(max_attempts=1)
+
+
+def record_fixture_corpus(root: Path) -> None:
+    recorder = concierge_replay.CorpusRecorder(root)
+    recorder.record_response("https://old.example/", 301, {"Location": "https://www.example.org/home?ref=old"}, b"")
+    recorder.record_response(
+        "https://www.example.org/home?ref=old",
+        200,
+        {"Content-Type": "text/html; charset=utf-8", "ETag": '"v1"', "Content-Encoding": "gzip", "Content-Length": "9"},
+        b"<html><body><h1>Example Dog School</h1></body></html>",
+    )
+    recorder.record_response("https://www.example.org/gone", 410, {"Content-Type": "text/html"}, b"gone")
+    recorder.record_failure("https://down.example/", "[Errno 104] Connection reset by peer")
+    assert recorder.recorded == 4
+
+
+def test_replay_url_mapping_round_trips_and_ignores_replica_hosts():
+    base = "http://127.0.0.1:8123"
+    for url, expected in (
+        ("https://www.example.org/a/b?x=1&y=2", "https://www.example.org/a/b?x=1&y=2"),
+        ("http://example.org:8080/", "http://example.org:8080/"),
+        ("https://example.org", "https://example.org/"),
+    ):
+        local = concierge_replay.replay_request_url(url, base)
+        assert local.startswith(base + "/")
+        assert concierge_replay.source_url_from_replay(local, base) == expected
+    assert concierge_replay.source_url_from_replay("https://elsewhere.example/", base) == "https://elsewhere.example/"
+    assert concierge_replay.corpus_lookup_url("https://replica-12.www.example.org/a?b=1") == "https://www.example.org/a?b=1"
+
+    rows = [{"source_url": "https://a.example/x", "business_name_hint": "A"}, {"source_url": "https://b.example/", "business_name_hint": "B"}]
+    replicated = concierge_replay.replicate_queue(rows, 3)
+    assert [row["source_url"] for row in replicated] == [
+        "https://a.example/x",
+        "https://b.example/",
+        "https://replica-1.a.example/x",
+        "https://replica-1.b.example/",
+        "https://replica-2.a.example/x",
+        "https://replica-2.b.example/",
+    ]
+    assert replicated[4]["business_name_hint"] == "A"
+
+
+def test_replay_server_serves_redirects_errors_and_failures_as_recorded():
+    with tempfile.TemporaryDirectory(prefix="dtd-replay-") as tmp:
+        root = Path(tmp) / "corpus"
+        record_fixture_corpus(root)
+        with concierge_replay.ReplayServer(root) as server:
+            options = concierge_pipeline.FetchOptions(replay_url=server.base_url, retry_policy=NO_RETRIES)
+            page = concierge_pipeline.fetch_source_page("https://old.example/", options)
+            replica = concierge_pipeline.fetch_source_page("https://replica-4.old.example/", options)
+            gone = concierge_pipeline.fetch_source_page("https://www.example.org/gone", options)
+            down = concierge_pipeline.fetch_source_page("https://down.example/", options)
+            missing = concierge_pipeline.fetch_source_page("https://www.example.org/never-recorded", options)
+            direct = concierge_pipeline.fetch_html(
+                "https://www.example.org/home?ref=old",
+                cache=None,
+                replay_url=server.base_url,
+            )
+            assert len(server.corpus) == 4
+
+    assert (page.status, page.final_url, page.error) == (200, "https://www.example.org/home?ref=old", "")
+    assert "Example Dog School" in page.html_text
+    assert page.content_encoding == ""
+    assert replica.final_url == "https://www.example.org/home?ref=old"
+    assert (gone.status, gone.final_url, gone.failure_class) == (410, "https://www.example.org/gone", "http_4xx")
+    assert down.failure_class == "reset"
+    assert (missing.status, missing.failure_class) == (404, "http_4xx")
+    assert (direct.status, direct.final_url) == (200, "https://www.example.org/home?ref=old")
+    assert server.stats["misses"] == 1
+
+
+def test_replay_server_injects_latency_errors_and_dropped_connections():
+    with tempfile.TemporaryDirectory(prefix="dtd-replay-faults-") as tmp:
+        root = Path(tmp) / "corpus"
+        record_fixture_corpus(root)
+        url = "https://www.example.org/home?ref=old"
+        with concierge_replay.ReplayServer(root, latency_ms=60, latency_jitter_ms=10) as server:
+            started = time.perf_counter()
+            slow = concierge_pipeline.fetch_source_page(url, concierge_pipeline.FetchOptions(replay_url=server.base_url))
+            assert time.perf_counter() - started >= 0.05
+        with concierge_replay.ReplayServer(root, error_rate=1.0, error_status=502) as server:
+            failing = concierge_pipeline.fetch_source_page(
+                url,
+                concierge_pipeline.FetchOptions(
+                    replay_url=server.base_url,
+                    retry_policy=concierge_pipeline.RetryPolicy(max_attempts=2, backoff_base=0),
+                ),
+            )
+            assert server.stats["injected_errors"] == 2
+        with concierge_replay.ReplayServer(root, drop_rate=1.0) as server:
+            dropped = concierge_pipeline.fetch_source_page(url, concierge_pipeline.FetchOptions(replay_url=server.base_url, retry_policy=NO_RETRIES))
+            assert server.stats["dropped"] >= 1
+
+    assert slow.status == 200 and slow.error == ""
+    assert (failing.status, failing.attempts, failing.failure_class) == (502, 2, "http_5xx")
+    assert dropped.failure_class == "reset"
+
+
+if __name__ == "__main__":
+    test_replay_url_mapping_round_trips_and_ignores_replica_hosts()
+    test_replay_server_serves_redirects_errors_and_failures_as_recorded()
+    test_replay_server_injects_latency_errors_and_dropped_connections()
+    print("OK test_concierge_replay.py")
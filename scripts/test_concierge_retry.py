@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Focused verification for the concierge fetch retry policy, circuit breaker and run deadline."""
+from __future__ import annotations
+
+import random
+import socket
+import ssl
+import sys
+from email.message import Message
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import concierge_retry  # noqa: E402
+
+
+def http_error(code: int, headers: dict[str, str] | None = None) -> HTTPError:
+    message = Message()
+    for key, value in (headers or {}).items():
+        message[key] = value
+    return HTTPError("https://t.example/", code, "error", message, None)
+
+
+def test_classifies_transient_and_permanent_failures():
+    classify = concierge_retry.classify_fetch_error
+    assert classify(http_error(429)) == "http_429"
+    assert classify(http_error(503)) == "http_5xx"
+    assert classify(http_error(404)) == "http_4xx"
+    assert classify(URLError(ConnectionRefusedError(111, "refused"))) == "connect"
+    assert classify(URLError(ConnectionResetError(104, "reset"))) == "reset"
+    assert classify(URLError(ssl.SSLEOFError(8, "EOF occurred in violation of protocol"))) == "reset"
+    assert classify(URLError(ssl.SSLCertVerificationError(1, "certificate verify failed"))) == "tls_certificate"
+    assert classify(URLError(socket.gaierror(-2, "Name or service not known"))) == "dns"
+    assert classify(TimeoutError("timed out")) == "timeout"
+    assert classify(URLError("unsupported URL")) == "other"
+    assert classify(ValueError("bad body")) == "other"
+    retryable = concierge_retry.RETRYABLE_FAILURES
+    assert {"http_429", "http_5xx", "connect", "reset", "timeout"} <= retryable
+    assert not {"http_4xx", "tls_certificate", "dns", "other"} & retryable
+
+
+def test_backoff_is_jittered_capped_and_honours_retry_after():
+    policy = concierge_retry.RetryPolicy(backoff_base=0.5, backoff_max=2.0, max_retry_after=10.0)
+    rng = random.Random(21)
+    for attempt, ceiling in ((1, 0.5), (2, 1.0), (3, 2.0), (8, 2.0)):
+        delays = [policy.delay(attempt, rng=rng) for _ in range(200)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+        assert max(delays) > ceiling * 0.8
+    assert policy.delay(1, retry_after=4.0) == 4.0
+    assert policy.delay(1, retry_after=60.0) is None
+
+    assert concierge_retry.retry_after_seconds(http_error(429, {"Retry-After": "7"}).headers) == 7.0
+    assert concierge_retry.retry_after_seconds({"Retry-After": "Wed, 21 Oct 2015 07:28:30 GMT"}, now=1445412500.0) == 10.0
+    assert concierge_retry.retry_after_seconds({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, now=1445412500.0) == 0.0
+    assert concierge_retry.retry_after_seconds({"Retry-After": "soon"}) is None
+    assert concierge_retry.retry_after_seconds({}) is None
+
+
+def test_circuit_breaker_opens_after_consecutive_failures_and_probes_after_cooldown():
+    breaker = concierge_retry.CircuitBreaker(threshold=3, cooldown=10.0)
+    for now in (0.0, 1.0):
+        assert breaker.allow("down.example", now)
+        breaker.record("down.example", failed=True, now=now)
+    breaker.record("down.example", failed=False, now=1.5)
+    for now in (2.0, 3.0, 4.0):
+        assert breaker.allow("down.example", now)
+        breaker.record("down.example", failed=True, now=now)
+    assert not breaker.allow("down.example", 5.0)
+    assert breaker.allow("up.example", 5.0)
+
+    assert breaker.allow("down.example", 14.0)
+    assert not breaker.allow("down.example", 14.5)
+    breaker.record("down.example", failed=True, now=15.0)
+    assert not breaker.allow("down.example", 20.0)
+    assert breaker.allow("down.example", 25.0)
+    breaker.record("down.example", failed=False, now=25.5)
+    assert breaker.allow("down.example", 26.0)
+    assert breaker.summary()["hosts_opened"] == [
+        {"host": "down.example", "times_opened": 1, "rejected_requests": 3, "open": False}
+    ]
+
+
+def test_run_deadline_shrinks_request_timeouts_to_the_time_left():
+    now = [100.0]
+    deadline = concierge_retry.RunDeadline(30.0, clock=lambda: now[0])
+    assert deadline.request_timeout(20) == 20
+    now[0] = 118.0
+    assert deadline.request_timeout(20) == 12.0
+    assert not deadline.expired
+    now[0] = 130.0
+    assert deadline.request_timeout(20) is None
+    assert deadline.expired
+
+
+if __name__ == "__main__":
+    test_classifies_transient_and_permanent_failures()
+    test_backoff_is_jittered_capped_and_honours_retry_after()
+    test_circuit_breaker_opens_after_consecutive_failures_and_probes_after_cooldown()
+    test_run_deadline_shrinks_request_timeouts_to_the_time_left()
+    print("OK test_concierge_retry.py")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Focused verification for the concierge HTML snapshot cache."""
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import concierge_snapshot_cache  # noqa: E402
+
+
+def store_example(cache: concierge_snapshot_cache.SnapshotCache, url: str, body: bytes) -> concierge_snapshot_cache.CachedSnapshot:
+    return cache.store(
+        url,
+        final_url=f"{url}/home",
+        status=200,
+        headers={"ETag": '"abc"', "Last-Modified": "Tue, 01 Oct 2026 00:00:00 GMT", "Content-Type": "text/html"},
+        content_type="text/html",
+        charset="utf-8",
+        body=body,
+    )
+
+
+def test_store_and_lookup_round_trip_is_content_addressed():
+    with tempfile.TemporaryDirectory(prefix="dtd-snapshot-cache-") as tmp:
+        cache = concierge_snapshot_cache.SnapshotCache(Path(tmp))
+        first = store_example(cache, "https://a.example", b"<html>same</html>")
+        second = store_example(cache, "https://b.example", b"<html>same</html>")
+
+        assert first.body_sha256 == second.body_sha256
+        assert len(list((Path(tmp) / "blobs").rglob("*"))) == 2
+        loaded = cache.lookup("https://a.example")
+        assert loaded is not None
+        assert loaded.body == b"<html>same</html>"
+        assert loaded.final_url == "https://a.example/home"
+        assert loaded.charset == "utf-8"
+        assert cache.conditional_headers(loaded) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Tue, 01 Oct 2026 00:00:00 GMT",
+        }
+        assert cache.lookup("https://missing.example") is None
+
+
+def test_freshness_and_refresh():
+    with tempfile.TemporaryDirectory(prefix="dtd-snapshot-cache-") as tmp:
+        revalidating = concierge_snapshot_cache.SnapshotCache(Path(tmp))
+        fresh_for_a_minute = concierge_snapshot_cache.SnapshotCache(Path(tmp), max_age=60)
+        stored = store_example(revalidating, "https://a.example", b"<html>v1</html>")
+
+        assert not revalidating.is_fresh(stored)
+        assert fresh_for_a_minute.is_fresh(stored, now=stored.fetched_at + 59)
+        assert not fresh_for_a_minute.is_fresh(stored, now=stored.fetched_at + 61)
+
+        refreshed = revalidating.refresh(stored, {"ETag": '"def"', "X-Ignored": "1"})
+        loaded = revalidating.lookup("https://a.example")
+        assert loaded is not None
+        assert loaded.etag == '"def"'
+        assert "x-ignored" not in loaded.headers
+        assert loaded.fetched_at == refreshed.fetched_at >= stored.fetched_at
+
+
+def test_corrupt_blob_is_treated_as_a_miss():
+    with tempfile.TemporaryDirectory(prefix="dtd-snapshot-cache-") as tmp:
+        cache = concierge_snapshot_cache.SnapshotCache(Path(tmp))
+        stored = store_example(cache, "https://a.example", b"<html>v1</html>")
+        blob = Path(tmp) / "blobs" / stored.body_sha256[:2] / stored.body_sha256
+        blob.write_bytes(b"tampered")
+        assert cache.lookup("https://a.example") is None
+
+
+if __name__ == "__main__":
+    test_store_and_lookup_round_trip_is_content_addressed()
+    test_freshness_and_refresh()
+    test_corrupt_blob_is_treated_as_a_miss()
+    print("OK test_concierge_snapshot_cache.py")